@@ -0,0 +1,74 @@
+"""Measure the throughput of buying labels one shipment at a time vs. with `create_and_buy_many`.
+
+A transport answers every request after `--latency` milliseconds. Each run creates `--shipments` shipments and buys
+their lowest rate: first in a plain loop calling `create`, `get_lowest_object_rate` and `buy`, then with
+`create_and_buy_many` at a few concurrency levels.
+
+Run with `python -m benchmarks.bench_bulk_buy` from the root of the repository.
+"""
+
+import argparse
+import itertools
+import json
+import time
+
+from easypost.easypost_client import EasyPostClient
+from easypost.transports import (
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+from easypost.util import get_lowest_object_rate
+
+RATES = [
+    {"id": "rate_usps", "carrier": "USPS", "service": "GroundAdvantage", "rate": "5.00"},
+    {"id": "rate_ups", "carrier": "UPS", "service": "Ground", "rate": "6.00"},
+]
+
+
+class SlowShipmentTransport(Transport):
+    """A transport creating and buying shipments after a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.ids = itertools.count()
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        time.sleep(self.latency)
+        path = request.url.split("/v2/", 1)[1]
+        if path == "shipments":
+            shipment = {"id": f"shp_{next(self.ids):06}", "object": "Shipment", "rates": RATES}
+        else:
+            shipment = {"id": path.split("/")[1], "object": "Shipment", "selected_rate": RATES[0]}
+
+        return TransportResponse(status=200, headers={}, body=json.dumps(shipment).encode("utf-8"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shipments", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=50, help="milliseconds per request")
+    args = parser.parse_args()
+
+    client = EasyPostClient(api_key="bench", transport=SlowShipmentTransport(args.latency / 1000))
+    shipments = [{"reference": str(index)} for index in range(args.shipments)]
+    print(f"Buying {args.shipments} shipments, {args.latency:g} ms per request\n")
+
+    start = time.perf_counter()
+    for params in shipments:
+        shipment = client.shipment.create(**params)
+        client.shipment.buy(shipment.id, rate=get_lowest_object_rate(shipment))
+    elapsed = time.perf_counter() - start
+    print(f"{'sequential loop':<32} {elapsed:>7.2f} s   {args.shipments / elapsed:>8.1f} shipments/s")
+
+    for concurrency in (1, 4, 16, 32):
+        bulk_buy = client.shipment.create_and_buy_many(shipments, concurrency=concurrency)
+        failed = sum(not result.ok for result in bulk_buy)
+        stats = bulk_buy.stats
+
+        label = f"create_and_buy_many({concurrency})"
+        print(f"{label:<32} {stats.elapsed:>7.2f} s   {stats.throughput:>8.1f} shipments/s   {failed} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measure the time and memory it takes to create clients, as multi-tenant platforms hold one per customer.
+
+Services are built on first access, so the benchmark reports both a bare client and one that has used a
+couple of services, along with the retained memory of many clients alive at once.
+
+Run with `python -m benchmarks.bench_client` from the root of the repository.
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable
+
+from benchmarks.harness import (
+    report,
+    time_calls,
+)
+from easypost.easypost_client import EasyPostClient
+
+
+def measure_retained(func: Callable[[], object], count: int) -> float:
+    """Return the memory retained per object by keeping `count` results of `func` alive, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [func() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=1000)
+    args = parser.parse_args()
+
+    def bare_client() -> EasyPostClient:
+        return EasyPostClient("EZTK123")
+
+    def used_client() -> EasyPostClient:
+        client = EasyPostClient("EZTK123")
+        client.shipment
+        client.tracker
+        return client
+
+    report("create client", time_calls(bare_client, args.iterations))
+    report("create client + 2 services", time_calls(used_client, args.iterations))
+
+    print()
+    for label, func in (("create client", bare_client), ("create client + 2 services", used_client)):
+        print(f"{label:<32} {measure_retained(func, args.clients) / 1024:>9.1f} KB retained per client")
+
+
+if __name__ == "__main__":
+    main()
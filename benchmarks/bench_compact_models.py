@@ -0,0 +1,84 @@
+"""Compare the memory held by regular and compact (slotted) models for a large tracker export.
+
+Each tracker is the one recorded in the `test_tracker_retrieve` cassette padded to `--details` tracking details,
+converted `--trackers` times with `compact=False` and `compact=True`.
+
+Run with `python -m benchmarks.bench_compact_models` from the root of the repository.
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any
+
+from benchmarks.cassettes import load_cassette_payload
+from benchmarks.harness import (
+    report,
+    time_calls,
+)
+from easypost.easypost_object import convert_to_easypost_object
+
+
+def build_tracker(details: int) -> dict[str, Any]:
+    """Pad a recorded tracker with copies of its tracking details."""
+    tracker = json.loads(load_cassette_payload("test_tracker_retrieve"))
+    recorded = tracker["tracking_details"]
+    tracker["tracking_details"] = [dict(recorded[index % len(recorded)]) for index in range(details)]
+    return tracker
+
+
+def count_objects(tracker: dict[str, Any]) -> int:
+    """Return the number of objects a tracker converts to, itself included."""
+    count = 0
+    pending: list[Any] = [tracker]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, dict):
+            count += 1
+            pending.extend(value.values())
+        elif isinstance(value, list):
+            pending.extend(value)
+
+    return count
+
+
+def measure_retained(trackers: list[dict[str, Any]], compact: bool) -> int:
+    """Return the memory retained by converting every tracker."""
+    gc.collect()
+    tracemalloc.start()
+    converted = [convert_to_easypost_object(response=tracker, compact=compact) for tracker in trackers]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del converted
+
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trackers", type=int, default=10000)
+    parser.add_argument("--details", type=int, default=10)
+    args = parser.parse_args()
+
+    tracker = build_tracker(args.details)
+    trackers = [tracker] * args.trackers
+    objects = count_objects(tracker)
+    print(f"Converting {args.trackers} trackers with {args.details} tracking details ({objects} objects each)\n")
+
+    for compact in (False, True):
+        label = "compact models" if compact else "regular models"
+        retained = measure_retained(trackers, compact=compact)
+        print(
+            f"{label:<32} {retained / 1024 / 1024:>7.1f} MB retained   "
+            f"{retained / args.trackers / 1024:>6.1f} KB per tracker   {retained / args.trackers / objects:>6.0f} B per object"
+        )
+
+    print()
+    for compact in (False, True):
+        label = "convert compact" if compact else "convert regular"
+        report(label, time_calls(lambda: convert_to_easypost_object(response=tracker, compact=compact), 2000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compare how fast tracker snapshots are compared, hashed and serialized.
+
+Each snapshot is the tracker recorded in the `test_tracker_retrieve` cassette padded to `--details` tracking details.
+Comparisons are made between equal snapshots (the worst case, every field is compared) and snapshots differing in
+their last tracking detail, with the previous approach of comparing both objects' indented, key-sorted JSON and
+with the structural comparison.
+
+Run with `python -m benchmarks.bench_equality` from the root of the repository.
+"""
+
+import argparse
+import json
+from typing import Any
+
+from benchmarks.cassettes import load_cassette_payload
+from benchmarks.harness import (
+    report,
+    time_calls,
+)
+from easypost.easypost_object import convert_to_easypost_object
+
+
+def build_tracker(details: int) -> dict[str, Any]:
+    """Pad a recorded tracker with copies of its tracking details."""
+    tracker = json.loads(load_cassette_payload("test_tracker_retrieve"))
+    recorded = tracker["tracking_details"]
+    tracker["tracking_details"] = [dict(recorded[index % len(recorded)]) for index in range(details)]
+    return tracker
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--details", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    tracker = build_tracker(args.details)
+    changed = build_tracker(args.details)
+    changed["tracking_details"][-1]["message"] = "Delivered"
+
+    snapshot = convert_to_easypost_object(response=tracker)
+    same = convert_to_easypost_object(response=tracker)
+    different = convert_to_easypost_object(response=changed)
+    print(f"Tracker snapshots with {args.details} tracking details\n")
+
+    report("str() == str(), equal", time_calls(lambda: str(snapshot) == str(same), args.iterations))
+    report("==, equal", time_calls(lambda: snapshot == same, args.iterations))
+    report("str() == str(), different", time_calls(lambda: str(snapshot) == str(different), args.iterations))
+    report("==, different", time_calls(lambda: snapshot == different, args.iterations))
+    report("content_hash", time_calls(snapshot.content_hash, args.iterations))
+    report("to_dict(canonical=True)", time_calls(lambda: snapshot.to_dict(canonical=True), args.iterations))
+    report("to_dict", time_calls(snapshot.to_dict, args.iterations))
+    report("to_json(canonical=True)", time_calls(lambda: snapshot.to_json(canonical=True), args.iterations))
+    report("to_json", time_calls(snapshot.to_json, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measure how long `import easypost` takes on a cold interpreter, as serverless functions pay it on every cold start.
+
+Each run starts a fresh interpreter with `-X importtime` and reads the cumulative time of the `easypost` package
+from its report, along with the time to create a client and use a service. Pass `--budget` (in milliseconds) to
+exit with an error when the median import time goes over it, eg: in CI to catch import time regressions.
+
+Run with `python -m benchmarks.bench_import` from the root of the repository.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List
+
+SCENARIOS = {
+    "import easypost": "import easypost",
+    "import + create client": "import easypost; easypost.EasyPostClient('EZTK123')",
+    "import + create client + service": "import easypost; easypost.EasyPostClient('EZTK123').shipment",
+}
+
+
+def measure_import_time(code: str) -> float:
+    """Run `code` in a fresh interpreter and return the cumulative import time of everything it imported in ms."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total = 0
+    started = False
+    for line in result.stderr.splitlines():
+        # Lines look like `import time: self [us] | cumulative | imported package`, top-level imports are unindented
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if started and not name.startswith("  "):
+            total += int(cumulative)
+        # Everything up to `site` is imported by the interpreter itself before running `code`
+        started = started or name.strip() == "site"
+
+    return total / 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--budget", type=float, default=None, help="fail when `import easypost` exceeds it (ms)")
+    args = parser.parse_args()
+
+    medians = {}
+    for label, code in SCENARIOS.items():
+        timings: List[float] = [measure_import_time(code) for _ in range(args.runs)]
+        medians[label] = statistics.median(timings)
+        print(f"{label:<36} median {medians[label]:>7.1f} ms   min {min(timings):>7.1f} ms")
+
+    if args.budget is not None and medians["import easypost"] > args.budget:
+        sys.exit(f"`import easypost` took {medians['import easypost']:.1f} ms, over the {args.budget:.1f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compare the JSON codecs on every response body recorded in the test cassettes.
+
+Run with `python -m benchmarks.bench_json_codec` from the root of the repository.
+"""
+
+import argparse
+import glob
+import os
+
+from benchmarks.cassettes import (
+    CASSETTES_DIR,
+    load_cassette_responses,
+)
+from benchmarks.harness import (
+    report,
+    time_calls,
+)
+from easypost.json_codec import (
+    JSON_CODECS,
+    JsonCodec,
+)
+
+
+def load_payloads() -> list[bytes]:
+    """Return every JSON response body recorded in the cassettes."""
+    payloads = []
+    for path in sorted(glob.glob(os.path.join(CASSETTES_DIR, "*.yaml"))):
+        for _, _, _, body in load_cassette_responses(os.path.basename(path)[: -len(".yaml")]):
+            if body.startswith((b"{", b"[")):
+                payloads.append(body)
+
+    return payloads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = load_payloads()
+    print(f"{len(payloads)} cassette payloads, {sum(map(len, payloads)) / 1024:.0f} KB in total\n")
+
+    codecs: list[JsonCodec] = []
+    for codec_class in JSON_CODECS.values():
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f"{codec_class.name} is not installed, skipping it")
+
+    for codec in codecs:
+        decoded = [codec.loads(payload) for payload in payloads]
+
+        def decode_all(codec: JsonCodec = codec) -> None:
+            for payload in payloads:
+                codec.loads(payload)
+
+        def encode_all(codec: JsonCodec = codec, decoded: list = decoded) -> None:
+            for data in decoded:
+                codec.dumps(data)
+
+        report(f"loads  {codec.name}", time_calls(decode_all, args.iterations, warmup=2))
+        report(f"dumps  {codec.name}", time_calls(encode_all, args.iterations, warmup=2))
+
+
+if __name__ == "__main__":
+    main()
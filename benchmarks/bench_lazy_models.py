@@ -0,0 +1,73 @@
+"""Compare eager and lazy conversion of a large page of shipments when only a few fields are read.
+
+The page holds the shipments recorded in the `test_shipment_all` cassette repeated up to `--shipments`, converted
+with `lazy=False` and `lazy=True` before reading the ID, tracking code and selected rate of each shipment, as a
+listing or export would.
+
+Run with `python -m benchmarks.bench_lazy_models` from the root of the repository.
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any
+
+from benchmarks.cassettes import load_cassette_payload
+from benchmarks.harness import (
+    report,
+    time_calls,
+)
+from easypost.easypost_object import convert_to_easypost_object
+
+
+def build_page(shipments: int) -> dict[str, Any]:
+    """Pad a recorded page of shipments to the given number of shipments."""
+    page = json.loads(load_cassette_payload("test_shipment_all"))
+    recorded = page["shipments"]
+    page["shipments"] = [recorded[index % len(recorded)] for index in range(shipments)]
+    return page
+
+
+def read_page(page: dict[str, Any], lazy: bool) -> list[Any]:
+    """Convert a page and read the few fields of each shipment a listing needs."""
+    converted = convert_to_easypost_object(response=page, lazy=lazy)
+    return [
+        (shipment.id, shipment.tracking_code, shipment.selected_rate and shipment.selected_rate.rate)
+        for shipment in converted.shipments
+    ]
+
+
+def measure_peak(page: dict[str, Any], lazy: bool) -> int:
+    """Return the peak memory allocated while converting and reading a page."""
+    gc.collect()
+    tracemalloc.start()
+    read_page(page, lazy=lazy)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shipments", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    page = build_page(args.shipments)
+    print(f"Converting a page of {args.shipments} shipments, reading 3 fields of each\n")
+
+    for lazy in (False, True):
+        label = "lazy models" if lazy else "eager models"
+        peak = measure_peak(page, lazy=lazy)
+        print(f"{label:<32} {peak / 1024 / 1024:>7.1f} MB peak   {peak / args.shipments / 1024:>6.1f} KB per shipment")
+
+    print()
+    for lazy in (False, True):
+        label = "read page lazy" if lazy else "read page eager"
+        report(label, time_calls(lambda: read_page(page, lazy=lazy), args.iterations, warmup=5))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare finding the model class of each object from the class registry with the previous per-object lookup.
+
+The previous lookup split the object's ID, snake-cased the class name with a regex and imported its module for
+every object. The registry maps ID prefixes and `object` types straight to the model classes once per process.
+
+Conversions use the shipments and trackers recorded in the `test_shipment_all` and `test_tracker_all` cassettes.
+
+Run with `python -m benchmarks.bench_model_registry` from the root of the repository.
+"""
+
+import argparse
+import importlib
+import json
+import re
+from typing import Any
+
+from benchmarks.cassettes import load_cassette_payload
+from benchmarks.harness import (
+    report,
+    time_calls,
+)
+from easypost.easypost_object import (
+    EASYPOST_OBJECT_ID_PREFIX_TO_CLASS_NAME_MAP,
+    OBJECT_CLASS_NAME_OVERRIDES,
+    EasyPostObject,
+    _id_prefix_models,
+    _object_type_models,
+    convert_to_easypost_object,
+)
+
+
+def previous_lookup(response: dict[str, Any]) -> Any:
+    """The previous class lookup of `convert_to_easypost_object`."""
+    class_name = OBJECT_CLASS_NAME_OVERRIDES.get(response.get("object", EasyPostObject), EasyPostObject)
+    object_id = response.get("id")
+    if object_id is not None:
+        class_name = EASYPOST_OBJECT_ID_PREFIX_TO_CLASS_NAME_MAP.get(object_id.split("_")[0], EasyPostObject)
+
+    if class_name == EasyPostObject:
+        return EasyPostObject
+
+    return getattr(
+        importlib.import_module(f"easypost.models.{re.sub(r'(?<!^)(?=[A-Z])', '_', class_name).lower()}"), class_name
+    )
+
+
+def registry_lookup(response: dict[str, Any]) -> Any:
+    """The class lookup of `convert_to_easypost_object` through the registry."""
+    class_model = None
+    object_id = response.get("id")
+    if object_id is not None:
+        class_model = _id_prefix_models.get(object_id.partition("_")[0])
+    if class_model is None:
+        class_model = _object_type_models.get(response.get("object"), EasyPostObject)  # type: ignore[arg-type]
+
+    return class_model
+
+
+def collect_objects(value: Any, objects: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Collect every dict nested in a payload, the payload included."""
+    if isinstance(value, dict):
+        objects.append(value)
+        for item in value.values():
+            collect_objects(item, objects)
+    elif isinstance(value, list):
+        for item in value:
+            collect_objects(item, objects)
+
+    return objects
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    for cassette in ("test_shipment_all", "test_tracker_all"):
+        payload = json.loads(load_cassette_payload(cassette))
+        objects = collect_objects(payload, [])
+        convert_to_easypost_object(response=payload)  # fills the registry
+        assert all(previous_lookup(item) is registry_lookup(item) for item in objects)
+        print(f"{cassette}: {len(objects)} objects")
+
+        report(
+            "  previous lookup (all objects)",
+            time_calls(lambda: [previous_lookup(item) for item in objects], args.iterations),
+        )
+        report(
+            "  registry lookup (all objects)",
+            time_calls(lambda: [registry_lookup(item) for item in objects], args.iterations),
+        )
+        report("  convert page", time_calls(lambda: convert_to_easypost_object(response=payload), args.iterations))
+        print()
+
+
+if __name__ == "__main__":
+    main()
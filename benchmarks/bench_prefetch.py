@@ -0,0 +1,77 @@
+"""Measure how prefetching pages hides the latency of paginating a list while its items are processed.
+
+A transport answers every list request after `--latency` milliseconds and the caller spends `--work` milliseconds
+processing each page, as an export writing pages to a warehouse would. Each run streams `--pages` pages with
+`iter_all`, without prefetching and with a few prefetch depths.
+
+Run with `python -m benchmarks.bench_prefetch` from the root of the repository.
+"""
+
+import argparse
+import json
+import time
+from urllib.parse import (
+    parse_qs,
+    urlsplit,
+)
+
+from easypost.easypost_client import EasyPostClient
+from easypost.transports import (
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+
+
+class SlowListTransport(Transport):
+    """A transport answering list requests with pages of shipments after a fixed latency."""
+
+    def __init__(self, pages: int, page_size: int, latency: float):
+        self.ids = [f"shp_{index:06}" for index in range(pages * page_size, 0, -1)]
+        self.latency = latency
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        time.sleep(self.latency)
+        query = {key: values[0] for key, values in parse_qs(urlsplit(request.url).query).items()}
+        page_size = int(query["page_size"])
+        ids = self.ids[self.ids.index(query["before_id"]) + 1 :] if "before_id" in query else self.ids
+        page = {
+            "shipments": [{"id": id, "object": "Shipment"} for id in ids[:page_size]],
+            "has_more": len(ids) > page_size,
+        }
+
+        return TransportResponse(status=200, headers={}, body=json.dumps(page).encode("utf-8"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=50, help="milliseconds per request")
+    parser.add_argument("--work", type=float, default=50, help="milliseconds of processing per page")
+    args = parser.parse_args()
+
+    transport = SlowListTransport(args.pages, args.page_size, args.latency / 1000)
+    client = EasyPostClient(api_key="bench", transport=transport)
+    item_work = args.work / 1000 / args.page_size
+    print(f"Streaming {args.pages} pages of {args.page_size} shipments, {args.latency:g} ms per request, ", end="")
+    print(f"{args.work:g} ms of processing per page\n")
+
+    for depth in (0, 1, 2, 4):
+        start = time.perf_counter()
+        items = 0
+        deadline = start
+        for _ in client.shipment.iter_all(page_size=args.page_size, prefetch=depth):
+            # Busy wait rather than sleep, the processing holds the caller's thread like real work would
+            deadline = max(deadline, time.perf_counter()) + item_work
+            while time.perf_counter() < deadline:
+                pass
+            items += 1
+        elapsed = time.perf_counter() - start
+
+        label = f"prefetch={depth}" if depth else "no prefetch"
+        print(f"{label:<32} {elapsed:>7.2f} s   {items / elapsed:>8.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Compare encoding large request bodies in a single pass with the previous copy-then-serialize approach.
+
+The previous path walked the whole params tree to copy it with every nested `EasyPostObject` replaced by its ID,
+then serialized the copy. The single pass path lets the JSON codec replace the objects inline while encoding.
+
+Run with `python -m benchmarks.bench_request_encoder` from the root of the repository.
+"""
+
+import argparse
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+)
+
+from benchmarks.harness import (
+    report,
+    time_calls,
+)
+from easypost.easypost_object import EasyPostObject
+from easypost.json_codec import (
+    JsonCodec,
+    detect_json_codec,
+)
+from easypost.request_encoder import encode_json_body
+
+
+def objects_to_ids(param: Any) -> Any:
+    """The previous `Requestor._objects_to_ids`, copying the params tree to replace objects with their ID."""
+    if isinstance(param, EasyPostObject):
+        return {"id": param.id}
+    elif isinstance(param, dict):
+        data = {}
+        for k, v in param.items():
+            if isinstance(v, list):
+                data[k] = [objects_to_ids(item) for item in v]
+            else:
+                data[k] = objects_to_ids(v)
+        return data
+    else:
+        return param
+
+
+def build_batch(shipments: int) -> dict[str, Any]:
+    """Build the params of a batch creating shipments that reference saved addresses and embed their parcel."""
+    from_address = EasyPostObject(id="adr_123")
+    return {
+        "batch": {
+            "shipments": [
+                {
+                    "from_address": from_address,
+                    "to_address": {
+                        "name": f"Customer {index}",
+                        "street1": "417 Montgomery Street",
+                        "city": "San Francisco",
+                        "state": "CA",
+                        "zip": "94104",
+                        "country": "US",
+                    },
+                    "parcel": {"length": 10, "width": 8, "height": 4, "weight": 15.4},
+                    "options": {"label_format": "PDF", "invoice_number": f"INV-{index}"},
+                    "carrier_accounts": [EasyPostObject(id="ca_123")],
+                    "reference": f"order-{index}",
+                }
+                for index in range(shipments)
+            ]
+        }
+    }
+
+
+def measure_allocations(func: Callable[[], object]) -> int:
+    """Return the peak memory allocated while running `func` once."""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shipments", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+
+    params = build_batch(args.shipments)
+    codec: JsonCodec = detect_json_codec()
+
+    def copy_then_encode() -> bytes:
+        return codec.dumps(objects_to_ids(params))
+
+    def single_pass() -> bytes:
+        return encode_json_body(params, codec)
+
+    assert copy_then_encode() == single_pass()
+    print(f"Encoding a batch of {args.shipments} shipments ({len(single_pass()) / 1024:.0f} KB) with {codec.name}\n")
+
+    report("copy then encode", time_calls(copy_then_encode, args.iterations, warmup=5))
+    report("single pass", time_calls(single_pass, args.iterations, warmup=5))
+
+    print()
+    for label, func in (("copy then encode", copy_then_encode), ("single pass", single_pass)):
+        print(f"{label:<32} peak {measure_allocations(func) / 1024:>9.0f} KB allocated")
+
+
+if __name__ == "__main__":
+    main()
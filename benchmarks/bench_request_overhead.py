@@ -0,0 +1,70 @@
+"""Measure the CPU the client spends on each request with the network stubbed out.
+
+An in-memory transport answers every request with a tiny canned body, so the timings only include what the
+client itself does: building the URL, headers and body of a request, running it through the requestor and
+turning the response into an object.
+
+Run with `python -m benchmarks.bench_request_overhead` from the root of the repository.
+"""
+
+import argparse
+
+from benchmarks.harness import (
+    report,
+    time_calls,
+)
+from easypost.easypost_client import EasyPostClient
+from easypost.requestor import (
+    RequestMethod,
+    Requestor,
+)
+from easypost.transports import (
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+
+PARCEL_BODY = b'{"id": "prcl_123", "object": "Parcel", "weight": 15.4}'
+
+
+class InMemoryTransport(Transport):
+    """A transport that answers every request with the same response without touching the network."""
+
+    def __init__(self, body: bytes):
+        self.response = TransportResponse(status=200, headers={}, body=body)
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        return self.response
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    client = EasyPostClient(api_key="bench", transport=InMemoryTransport(PARCEL_BODY), json_codec="json")
+    requestor = Requestor(client)
+    params = {"length": 10, "width": 8, "height": 4, "weight": 15.4}
+
+    report(
+        "prepare request",
+        time_calls(
+            lambda: requestor._prepare_request(method=RequestMethod.GET, url="/parcels/prcl_123"), args.iterations
+        ),
+    )
+    report(
+        "request_raw GET",
+        time_calls(lambda: requestor.request_raw(method=RequestMethod.GET, url="/parcels/prcl_123"), args.iterations),
+    )
+    report(
+        "client.parcel.retrieve",
+        time_calls(lambda: client.parcel.retrieve("prcl_123"), args.iterations),
+    )
+    report(
+        "client.parcel.create",
+        time_calls(lambda: client.parcel.create(**params), args.iterations),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compare the memory allocated to parse a response body decoded as text with parsing it straight from bytes.
+
+The text path reproduces the previous `requests` behaviour: `Response.text` on a body served without a charset
+(which runs encoding detection over the whole body) followed by `json.loads` on the decoded string. The bytes
+path is what the requestor does now: `json.loads` on the bytes returned by the transport.
+
+Run with `python -m benchmarks.bench_response_body` from the root of the repository.
+"""
+
+import argparse
+import json
+import tracemalloc
+from typing import Callable
+
+import requests
+
+from benchmarks.cassettes import load_cassette_payload
+from benchmarks.harness import (
+    report,
+    time_calls,
+)
+from easypost.requestor import Requestor
+
+
+def build_large_shipment(rates: int) -> bytes:
+    """Pad a recorded shipment with copies of its rates to reach the size of a real multi-carrier response."""
+    shipment = json.loads(load_cassette_payload("test_shipment_retrieve"))
+    shipment["rates"] = [dict(shipment["rates"][index % len(shipment["rates"])]) for index in range(rates)]
+    return json.dumps(shipment).encode("utf-8")
+
+
+def measure_allocations(func: Callable[[], object]) -> int:
+    """Return the peak memory allocated while running `func` once."""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rates", type=int, default=300)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    body = build_large_shipment(args.rates)
+    requestor = Requestor(None)  # type: ignore[arg-type]
+
+    def text_path() -> object:
+        response = requests.Response()
+        response._content = body
+        response.headers["Content-Type"] = "application/json"  # No charset, `text` has to detect it
+        return requestor.interpret_response(http_body=response.text, http_status=200)
+
+    def bytes_path() -> object:
+        return requestor.interpret_response(http_body=body, http_status=200)
+
+    print(f"Parsing a shipment with {args.rates} rates ({len(body) / 1024:.0f} KB)\n")
+    for label, func in (("Response.text + json.loads", text_path), ("json.loads(bytes)", bytes_path)):
+        print(f"{label:<32} peak allocations {measure_allocations(func) / 1024:>9.0f} KB")
+        report(label, time_calls(func, args.iterations, warmup=5))
+
+
+if __name__ == "__main__":
+    main()
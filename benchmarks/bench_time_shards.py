@@ -0,0 +1,104 @@
+"""Compare exporting a year of shipments with sequential pagination and with time-sharded concurrent pagination.
+
+A transport answers list requests after `--latency` milliseconds from an in-memory year of shipments, one every
+`--spacing` minutes plus a burst of `--burst` shipments on a single day, filtered on `start_datetime`/`end_datetime`
+and paginated with `before_id` like the API.
+
+Run with `python -m benchmarks.bench_time_shards` from the root of the repository.
+"""
+
+import argparse
+import bisect
+import datetime
+import json
+import time
+from typing import Any
+from urllib.parse import (
+    parse_qs,
+    urlsplit,
+)
+
+from easypost.easypost_client import EasyPostClient
+from easypost.time_shards import (
+    format_datetime,
+    parse_datetime,
+)
+from easypost.transports import (
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+END = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class ShipmentListTransport(Transport):
+    """A transport listing in-memory shipments like the API, after a fixed latency."""
+
+    def __init__(self, spacing: int, burst: int, latency: float):
+        created = []
+        moment = START
+        while moment < END:
+            created.append(moment)
+            moment += datetime.timedelta(minutes=spacing)
+        created += [START + datetime.timedelta(days=200, seconds=index) for index in range(burst)]
+        created.sort()
+
+        # Oldest first, bisected on creation time and ID
+        self.created = created
+        self.shipments = [
+            {"id": f"shp_{index:08}", "object": "Shipment", "created_at": format_datetime(created_at)}
+            for index, created_at in enumerate(created)
+        ]
+        self.latency = latency
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        time.sleep(self.latency)
+        query = {key: values[0] for key, values in parse_qs(urlsplit(request.url).query).items()}
+        low = bisect.bisect_left(self.created, parse_datetime(query.get("start_datetime", START)))
+        high = bisect.bisect_right(self.created, parse_datetime(query.get("end_datetime", END)))
+        if "before_id" in query:
+            high = min(high, int(query["before_id"].split("_")[1]))
+        page_size = int(query.get("page_size", 20))
+        page: dict[str, Any] = {
+            "shipments": self.shipments[max(low, high - page_size) : high][::-1],
+            "has_more": high - low > page_size,
+        }
+
+        return TransportResponse(status=200, headers={}, body=json.dumps(page).encode("utf-8"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--spacing", type=int, default=60, help="minutes between shipments")
+    parser.add_argument("--burst", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=20, help="milliseconds per request")
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    transport = ShipmentListTransport(args.spacing, args.burst, args.latency / 1000)
+    client = EasyPostClient(api_key="bench", transport=transport, response_format="dict")
+    print(f"Exporting {len(transport.shipments)} shipments, {args.latency:g} ms per request\n")
+
+    def run(label: str, shipments: Any) -> None:
+        start = time.perf_counter()
+        count = sum(1 for _ in shipments)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<32} {elapsed:>7.2f} s   {count / elapsed:>8.0f} shipments/s   {count} shipments")
+
+    run(
+        "sequential iter_all",
+        client.shipment.iter_all(
+            start_datetime=format_datetime(START), end_datetime=format_datetime(END), page_size=args.page_size
+        ),
+    )
+    for workers in (4, 8, 16):
+        run(
+            f"iter_all_sharded workers={workers}",
+            client.shipment.iter_all_sharded(START, END, workers=workers, page_size=args.page_size),
+        )
+
+
+if __name__ == "__main__":
+    main()
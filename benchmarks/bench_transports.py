@@ -0,0 +1,49 @@
+"""Compare the per-request cost of the `requests` and `urllib3` transports against a local stub server.
+
+Run with `python -m benchmarks.bench_transports` from the root of the repository.
+"""
+
+import argparse
+
+from benchmarks.cassettes import load_cassette_payload
+from benchmarks.harness import (
+    report,
+    time_calls,
+)
+from benchmarks.stub_server import StubServer
+from easypost import EasyPostClient
+from easypost.transports import (
+    RequestsTransport,
+    Urllib3Transport,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    shipment = load_cassette_payload("test_shipment_retrieve")
+
+    with StubServer(default_body=shipment) as server:
+        transports = {
+            "requests.Session": RequestsTransport(api_base=server.api_base),
+            "urllib3.PoolManager": Urllib3Transport(),
+        }
+        print(f"Retrieving a shipment ({len(shipment)} bytes) {args.iterations} times\n")
+
+        for label, transport in transports.items():
+            client = EasyPostClient(api_key="bench", api_base=server.api_base, transport=transport)
+            report(
+                f"GET  {label}",
+                time_calls(lambda: client.shipment.retrieve("shp_123"), args.iterations),
+            )
+            report(
+                f"POST {label}",
+                time_calls(lambda: client.parcel.create(length=10, width=8, height=4, weight=15.4), args.iterations),
+            )
+            transport.close()
+
+
+if __name__ == "__main__":
+    main()
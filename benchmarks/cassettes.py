@@ -0,0 +1,43 @@
+"""Load recorded API responses from the test cassettes to use as realistic benchmark payloads."""
+
+import os
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+import yaml
+
+CASSETTES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "cassettes")
+
+
+def load_cassette_responses(name: str) -> List[Tuple[str, str, int, bytes]]:
+    """Return the `(method, uri, status, body)` of every interaction recorded in a cassette."""
+    with open(os.path.join(CASSETTES_DIR, f"{name}.yaml")) as cassette_file:
+        cassette = yaml.safe_load(cassette_file)
+
+    responses = []
+    for interaction in cassette["interactions"]:
+        request = interaction["request"]
+        response = interaction["response"]
+        body = response["body"]["string"]
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        responses.append((request["method"], request["uri"], response["status"]["code"], body))
+
+    return responses
+
+
+def load_cassette_payload(name: str, method: str = "GET") -> bytes:
+    """Return the body of the first response in a cassette recorded for the given request method."""
+    for request_method, _, _, body in load_cassette_responses(name):
+        if request_method == method:
+            return body
+
+    raise ValueError(f"No {method} interaction recorded in the {name} cassette")
+
+
+def load_cassette_payloads(names: List[str]) -> Dict[str, bytes]:
+    """Return the first response body of each named cassette."""
+    return {name: load_cassette_responses(name)[0][3] for name in names}
@@ -0,0 +1,32 @@
+"""Small timing helpers shared by the benchmarks."""
+
+import statistics
+import time
+from typing import (
+    Callable,
+    List,
+)
+
+
+def time_calls(func: Callable[[], object], iterations: int, warmup: int = 50) -> List[float]:
+    """Call `func` repeatedly and return the wall time of each call in microseconds."""
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+
+    return timings
+
+
+def report(label: str, timings: List[float]) -> None:
+    """Print the median, p95 and mean of a list of timings in microseconds."""
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<32} median {statistics.median(ordered):>9.1f} us   "
+        f"p95 {p95:>9.1f} us   mean {statistics.fmean(ordered):>9.1f} us"
+    )
@@ -0,0 +1,76 @@
+"""A local HTTP/1.1 keep-alive server that answers every request with a canned response.
+
+The benchmarks point an `EasyPostClient` at this server so they measure the client rather than the network.
+"""
+
+import threading
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Write the headers and body in one segment so delayed ACKs don't stall the keep-alive connection
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def _respond(self) -> None:
+        content_length = int(self.headers.get("Content-Length") or 0)
+        if content_length:
+            self.rfile.read(content_length)
+
+        server: StubServer = self.server  # type: ignore[assignment]
+        path = self.path.split("?", 1)[0]
+        status, body = server.routes.get((self.command, path), server.default_response)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+    do_PUT = _respond
+    do_PATCH = _respond
+    do_DELETE = _respond
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """Serve canned responses on 127.0.0.1, keyed by `(method, path)` with a fallback for anything else."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        default_body: bytes = b"{}",
+        default_status: int = 200,
+        routes: Optional[Dict[Tuple[str, str], Tuple[int, bytes]]] = None,
+    ):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.default_response = (default_status, default_body)
+        self.routes = routes or {}
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def api_base(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v2"
+
+    def __enter__(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+        self.server_close()
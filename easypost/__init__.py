@@ -1,19 +1,52 @@
 # flake8: noqa
+from typing import TYPE_CHECKING
+
 from easypost.constant import (
     AUTHOR,
     VERSION,
     VERSION_INFO,
 )
-from easypost.easypost_client import EasyPostClient
-from easypost.util import (
-    get_lowest_object_rate,
-    get_lowest_smart_rate,
-    get_lowest_stateless_rate,
-    receive_event,
-    validate_webhook,
-)
+from easypost.lazy_loader import lazy_loader
+
+
+if TYPE_CHECKING:
+    from easypost.async_easypost_client import AsyncEasyPostClient
+    from easypost.easypost_client import EasyPostClient
+    from easypost.easypost_object import register_model
+    from easypost.util import (
+        get_lowest_object_rate,
+        get_lowest_smart_rate,
+        get_lowest_stateless_rate,
+        receive_event,
+        validate_webhook,
+    )
 
 
 __author__ = AUTHOR
 __version__ = VERSION
 version_info = VERSION_INFO
+
+__all__ = [
+    "AsyncEasyPostClient",
+    "EasyPostClient",
+    "get_lowest_object_rate",
+    "get_lowest_smart_rate",
+    "get_lowest_stateless_rate",
+    "receive_event",
+    "register_model",
+    "validate_webhook",
+]
+
+__getattr__, __dir__ = lazy_loader(
+    __name__,
+    {
+        "AsyncEasyPostClient": "easypost.async_easypost_client",
+        "EasyPostClient": "easypost.easypost_client",
+        "get_lowest_object_rate": "easypost.util",
+        "get_lowest_smart_rate": "easypost.util",
+        "get_lowest_stateless_rate": "easypost.util",
+        "receive_event": "easypost.util",
+        "register_model": "easypost.easypost_object",
+        "validate_webhook": "easypost.util",
+    },
+)
@@ -0,0 +1,218 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from easypost.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from easypost.concurrency_limiter import ConcurrencyLimiter
+from easypost.constant import (
+    _RESPONSE_FORMATS,
+    API_BASE,
+    API_VERSION,
+    INVALID_RESPONSE_FORMAT_ERROR,
+    MAX_CONNECTIONS,
+    RESPONSE_FORMAT,
+    TIMEOUT,
+)
+from easypost.easypost_object import convert_to_easypost_object
+from easypost.errors.general.invalid_parameter_error import InvalidParameterError
+from easypost.hooks import RequestHook, ResponseHook
+from easypost.json_codec import (
+    JsonCodec,
+    get_json_codec,
+)
+from easypost.rate_limiter import RateLimiter
+from easypost.requestor import AsyncRequestor, RequestMethod
+from easypost.response_cache import ResponseCache
+from easypost.retry_policy import RetryPolicy
+from easypost.services.base_service import LazyService
+from easypost.single_flight import SingleFlight
+from easypost.transports import (
+    AsyncTransport,
+    HttpxTransport,
+)
+
+if TYPE_CHECKING:
+    from easypost.services import (
+        AsyncAddressService,
+        AsyncApiKeyService,
+        AsyncBatchService,
+        AsyncBetaRateService,
+        AsyncBetaReferralCustomerService,
+        AsyncBillingService,
+        AsyncCarrierAccountService,
+        AsyncCarrierMetadataService,
+        AsyncClaimService,
+        AsyncCustomerPortalService,
+        AsyncCustomsInfoService,
+        AsyncCustomsItemService,
+        AsyncEmbeddableService,
+        AsyncEndShipperService,
+        AsyncEventService,
+        AsyncFedExRegistrationService,
+        AsyncInsuranceService,
+        AsyncLumaService,
+        AsyncOrderService,
+        AsyncParcelService,
+        AsyncPickupService,
+        AsyncRateService,
+        AsyncReferralCustomerService,
+        AsyncRefundService,
+        AsyncReportService,
+        AsyncScanFormService,
+        AsyncShipmentService,
+        AsyncSmartRateService,
+        AsyncTrackerService,
+        AsyncUserService,
+        AsyncWebhookService,
+    )
+
+
+class AsyncEasyPostClient:
+    """An asyncio client object used to authenticate and configure all HTTP calls to the EasyPost API.
+
+    Every service mirrors the `EasyPostClient` service of the same name with `async def` methods. All requests
+    share a single pool of HTTP connections, so close the client via `await client.close()` (or use it as an
+    `async with` context manager) once you are done with it. The optional arguments are the same as the
+    ones of `EasyPostClient`, except `transport` must be an `easypost.transports.AsyncTransport`.
+    """
+
+    # Services, each built on first access
+    address: "LazyService[AsyncAddressService]" = LazyService("AsyncAddressService")
+    api_keys: "LazyService[AsyncApiKeyService]" = LazyService("AsyncApiKeyService")
+    batch: "LazyService[AsyncBatchService]" = LazyService("AsyncBatchService")
+    beta_rate: "LazyService[AsyncBetaRateService]" = LazyService("AsyncBetaRateService")
+    beta_referral_customer: "LazyService[AsyncBetaReferralCustomerService]" = LazyService(
+        "AsyncBetaReferralCustomerService"
+    )
+    billing: "LazyService[AsyncBillingService]" = LazyService("AsyncBillingService")
+    carrier_account: "LazyService[AsyncCarrierAccountService]" = LazyService("AsyncCarrierAccountService")
+    carrier_metadata: "LazyService[AsyncCarrierMetadataService]" = LazyService("AsyncCarrierMetadataService")
+    claim: "LazyService[AsyncClaimService]" = LazyService("AsyncClaimService")
+    customer_portal: "LazyService[AsyncCustomerPortalService]" = LazyService("AsyncCustomerPortalService")
+    customs_info: "LazyService[AsyncCustomsInfoService]" = LazyService("AsyncCustomsInfoService")
+    customs_item: "LazyService[AsyncCustomsItemService]" = LazyService("AsyncCustomsItemService")
+    embeddable: "LazyService[AsyncEmbeddableService]" = LazyService("AsyncEmbeddableService")
+    end_shipper: "LazyService[AsyncEndShipperService]" = LazyService("AsyncEndShipperService")
+    event: "LazyService[AsyncEventService]" = LazyService("AsyncEventService")
+    fedex_registration: "LazyService[AsyncFedExRegistrationService]" = LazyService("AsyncFedExRegistrationService")
+    insurance: "LazyService[AsyncInsuranceService]" = LazyService("AsyncInsuranceService")
+    luma: "LazyService[AsyncLumaService]" = LazyService("AsyncLumaService")
+    order: "LazyService[AsyncOrderService]" = LazyService("AsyncOrderService")
+    parcel: "LazyService[AsyncParcelService]" = LazyService("AsyncParcelService")
+    rate: "LazyService[AsyncRateService]" = LazyService("AsyncRateService")
+    pickup: "LazyService[AsyncPickupService]" = LazyService("AsyncPickupService")
+    referral_customer: "LazyService[AsyncReferralCustomerService]" = LazyService("AsyncReferralCustomerService")
+    refund: "LazyService[AsyncRefundService]" = LazyService("AsyncRefundService")
+    report: "LazyService[AsyncReportService]" = LazyService("AsyncReportService")
+    scan_form: "LazyService[AsyncScanFormService]" = LazyService("AsyncScanFormService")
+    shipment: "LazyService[AsyncShipmentService]" = LazyService("AsyncShipmentService")
+    smart_rate: "LazyService[AsyncSmartRateService]" = LazyService("AsyncSmartRateService")
+    tracker: "LazyService[AsyncTrackerService]" = LazyService("AsyncTrackerService")
+    user: "LazyService[AsyncUserService]" = LazyService("AsyncUserService")
+    webhook: "LazyService[AsyncWebhookService]" = LazyService("AsyncWebhookService")
+
+    def __init__(
+        self,
+        api_key: str,
+        api_base: str = f"{API_BASE}/{API_VERSION}",
+        timeout: int = TIMEOUT,
+        max_connections: int = MAX_CONNECTIONS,
+        transport: Optional[AsyncTransport] = None,
+        json_codec: Optional[Union[str, JsonCodec]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        single_flight: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        compact_models: bool = False,
+        lazy_models: bool = False,
+        response_format: str = RESPONSE_FORMAT,
+    ):
+        # Client configuration
+        self.api_key = api_key
+        self.api_base = api_base
+        self.timeout = timeout
+        self._json_codec = get_json_codec(json_codec)
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._concurrency_limiter = concurrency_limiter
+        self._circuit_breaker = circuit_breaker
+        self._single_flight = SingleFlight() if single_flight else None
+        self._response_cache = response_cache
+        self._compact_models = compact_models
+        self._lazy_models = lazy_models
+        if response_format not in _RESPONSE_FORMATS:
+            raise InvalidParameterError(
+                message=INVALID_RESPONSE_FORMAT_ERROR.format(response_format, ", ".join(_RESPONSE_FORMATS))
+            )
+        self._raw_responses = response_format == "dict"
+        # The headers of every request, built on the first one (see `Requestor._base_headers`)
+        self._base_headers: Optional[Tuple[str, dict[str, Any]]] = None
+
+        # Hooks
+        self._request_hook = RequestHook()
+        self._response_hook = ResponseHook()
+
+        self._transport = transport or HttpxTransport(max_connections=max_connections)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP connections of the client."""
+        await self._transport.close()
+
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """Return the state of the circuit breaker of every route called, empty without a circuit breaker."""
+        if self._circuit_breaker is None:
+            return {}
+
+        return self._circuit_breaker.states()
+
+    def subscribe_to_request_hook(self, function):
+        """Subscribe functions to run when a request occurs."""
+        self._request_hook += function
+
+    def unsubscribe_from_request_hook(self, function):
+        """Unsubscribe functions from running when a request occurs."""
+        self._request_hook -= function
+
+    def subscribe_to_response_hook(self, function):
+        """Subscribe functions to run when a response occurs."""
+        self._response_hook += function
+
+    def unsubscribe_from_response_hook(self, function):
+        """Unsubscribe functions from running when a response occurs."""
+        self._response_hook -= function
+
+    async def make_api_call(
+        self,
+        method: RequestMethod,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: Optional[dict[str, str]] = None,
+    ) -> dict[str, Any]:
+        """Make an API call to the EasyPost API.
+
+        This public, generic interface is useful for making arbitrary API calls to the EasyPost API that
+        are not yet supported by the client library's services. When possible, the service for your use case
+        should be used instead as it provides a more convenient and higher-level interface depending on the endpoint.
+        Extra `headers` (such as an `Idempotency-Key` allowing a POST to be retried) are sent with the request.
+        """
+        response = await AsyncRequestor(self).request(method=method, url=endpoint, params=params, headers=headers)
+
+        if self._raw_responses:
+            return response
+
+        return convert_to_easypost_object(response=response, compact=self._compact_models, lazy=self._lazy_models)
@@ -0,0 +1,227 @@
+import concurrent.futures
+import time
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from easypost.constant import (
+    BULK_BUY_ITERATED_ERROR,
+    INVALID_CONCURRENCY_ERROR,
+    MISSING_PARAMETER_ERROR,
+)
+from easypost.errors import (
+    EasyPostError,
+    InvalidParameterError,
+    MissingParameterError,
+)
+from easypost.util import (
+    get_lowest_object_rate,
+    get_lowest_smart_rate,
+)
+
+# How many shipments are queued per worker ahead of the workers, the rest of the input is only read as they finish
+_QUEUED_PER_WORKER = 2
+
+
+class RatePolicy(NamedTuple):
+    """How the rate of each shipment of a bulk buy is selected.
+
+    The lowest rate of the `carriers` and `services` listed (any by default) is bought. With `delivery_days`, the
+    lowest SmartRate delivering within that many days at `delivery_accuracy` (such as `percentile_90`) is bought.
+    """
+
+    carriers: Optional[list[str]] = None
+    services: Optional[list[str]] = None
+    delivery_days: Optional[int] = None
+    delivery_accuracy: Optional[str] = None
+
+
+class BulkBuyResult(NamedTuple):
+    """The outcome of creating and buying the shipment at `position` in the input of a bulk buy.
+
+    `shipment` is the bought shipment, or the created one if selecting or buying its rate failed (so it can be
+    bought again without being created twice), or None if it couldn't be created.
+    """
+
+    position: int
+    params: dict[str, Any]
+    shipment: Optional[Any]
+    rate: Optional[Any]
+    error: Optional[Exception]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkBuyStats(NamedTuple):
+    """The throughput of a bulk buy, so far or once all its results were iterated over."""
+
+    total: int
+    succeeded: int
+    failed: int
+    elapsed: float
+    # Wall-clock shipments per second, and the mean time spent on each shipment by a worker
+    throughput: float
+    mean_latency: float
+
+
+# Selects the rate to buy of a created shipment
+RateSelector = Callable[[Any], Any]
+
+
+def rate_selector(service: Any, rate_policy: RatePolicy) -> RateSelector:
+    """Return the function selecting the rate of a created shipment following `rate_policy`."""
+    if rate_policy.delivery_days is None:
+        if rate_policy.delivery_accuracy is not None:
+            raise MissingParameterError(MISSING_PARAMETER_ERROR.format("delivery_days"))
+        return lambda shipment: get_lowest_object_rate(shipment, rate_policy.carriers, rate_policy.services)
+
+    if rate_policy.delivery_accuracy is None:
+        raise MissingParameterError(MISSING_PARAMETER_ERROR.format("delivery_accuracy"))
+    delivery_days = rate_policy.delivery_days
+    delivery_accuracy = rate_policy.delivery_accuracy.lower()
+    carriers = [carrier.lower() for carrier in rate_policy.carriers or []]
+    services = [service.lower() for service in rate_policy.services or []]
+
+    def select_smart_rate(shipment: Any) -> Any:
+        smart_rates = [
+            rate
+            for rate in service.get_smart_rates(shipment["id"])
+            if (not carriers or rate["carrier"].lower() in carriers)
+            and (not services or rate["service"].lower() in services)
+        ]
+        return get_lowest_smart_rate(smart_rates, delivery_days, delivery_accuracy)
+
+    return select_smart_rate
+
+
+class BulkBuy:
+    """Creates and buys shipments on a pool of `concurrency` threads, yielding a result per shipment as it finishes.
+
+    Shipments are read from the input as workers free up, so only a few are pending at a time however many are bought.
+    An error creating or buying a shipment is reported in its result and the other shipments carry on. `stats` gives
+    the throughput of the results iterated over so far.
+
+    A bulk buy can only be iterated over once. If iteration stops early, the shipments queued but not started yet are
+    not bought, and the results of those already being bought are waited for and kept in `unread_results`.
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        shipments: Iterable[dict[str, Any]],
+        select_rate: RateSelector,
+        concurrency: int,
+        buy_params: dict[str, Any],
+    ):
+        if concurrency < 1:
+            raise InvalidParameterError(message=INVALID_CONCURRENCY_ERROR.format(concurrency))
+
+        self.service = service
+        self.shipments = shipments
+        self.select_rate = select_rate
+        self.concurrency = concurrency
+        self.buy_params = buy_params
+        self.unread_results: list[BulkBuyResult] = []
+        self._succeeded = 0
+        self._failed = 0
+        self._latency = 0.0
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def _create_and_buy(self, index: int, params: dict[str, Any]) -> BulkBuyResult:
+        start = time.perf_counter()
+        shipment = None
+        rate = None
+        try:
+            shipment = self.service.create(**params)
+            rate = self.select_rate(shipment)
+            shipment = self.service.buy(shipment["id"], rate=rate, **self.buy_params)
+            error = None
+        except Exception as exception:
+            error = exception
+
+        return BulkBuyResult(index, params, shipment, rate, error, time.perf_counter() - start)
+
+    def _record(self, result: BulkBuyResult) -> BulkBuyResult:
+        if result.ok:
+            self._succeeded += 1
+        else:
+            self._failed += 1
+        self._latency += result.elapsed
+        return result
+
+    def __iter__(self) -> Iterator[BulkBuyResult]:
+        # Iterating again would create and buy every shipment a second time
+        if self._started is not None:
+            raise EasyPostError(message=BULK_BUY_ITERATED_ERROR)
+        self._started = time.perf_counter()
+        return self._run()
+
+    def _run(self) -> Iterator[BulkBuyResult]:
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="easypost-buy"
+        )
+        pending: set[concurrent.futures.Future[BulkBuyResult]] = set()
+        shipments = enumerate(self.shipments)
+        try:
+            while True:
+                for index, params in shipments:
+                    pending.add(executor.submit(self._create_and_buy, index, params))
+                    if len(pending) >= self.concurrency * _QUEUED_PER_WORKER:
+                        break
+                if not pending:
+                    break
+
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield self._record(future.result())
+        finally:
+            # Shipments already being created or bought can't be stopped, wait for them so their results aren't lost
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.unread_results = sorted(
+                (self._record(future.result()) for future in pending if not future.cancelled()),
+                key=lambda result: result.position,
+            )
+            self._finished = time.perf_counter()
+
+    @property
+    def stats(self) -> BulkBuyStats:
+        total = self._succeeded + self._failed
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished if self._finished is not None else time.perf_counter()) - self._started
+
+        return BulkBuyStats(
+            total=total,
+            succeeded=self._succeeded,
+            failed=self._failed,
+            elapsed=elapsed,
+            throughput=total / elapsed if elapsed else 0.0,
+            mean_latency=self._latency / total if total else 0.0,
+        )
+
+
+def create_and_buy_many(
+    service: Any,
+    shipments: Iterable[dict[str, Any]],
+    rate_policy: Optional[Union[RatePolicy, RateSelector]],
+    concurrency: int,
+    buy_params: dict[str, Any],
+) -> BulkBuy:
+    """Create and buy shipments concurrently through a shipment service, see `ShipmentService.create_and_buy_many`."""
+    if rate_policy is None:
+        rate_policy = RatePolicy()
+    select_rate = rate_selector(service, rate_policy) if isinstance(rate_policy, RatePolicy) else rate_policy
+
+    return BulkBuy(service, shipments, select_rate, concurrency, buy_params)
@@ -0,0 +1,171 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Optional
+
+from easypost.constant import (
+    CIRCUIT_OPEN_ERROR,
+    INVALID_FAILURE_RATE_THRESHOLD_ERROR,
+    INVALID_MINIMUM_ERROR,
+)
+from easypost.errors import (
+    CircuitOpenError,
+    InvalidParameterError,
+    TimeoutError,
+)
+from easypost.routes import normalize_route
+
+FAILURE_STATUSES = (500, 502, 503, 504)
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    """The state of the circuit of a single route."""
+
+    def __init__(self, window_size: int):
+        self.state = CircuitState.CLOSED
+        self.outcomes: deque[bool] = deque(maxlen=window_size)
+        self.consecutive_timeouts = 0
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+        self.last_probe_at = 0.0
+
+
+class CircuitBreaker:
+    """Fails fast on routes that keep failing instead of letting every call wait for the full timeout.
+
+    Each route (the path of a request with its IDs replaced by `:id`, eg: `/shipments/:id/buy`) has its own
+    circuit. A circuit opens when the share of failures (timeouts, connection errors and `5xx` responses) among
+    its last `window_size` requests reaches `failure_rate_threshold` (once at least `min_requests` were made), or
+    after `timeout_threshold` consecutive timeouts. While open, requests on the route raise a `CircuitOpenError`
+    without being sent. After `recovery_timeout` seconds the circuit goes half-open and lets `half_open_probes`
+    requests through: it closes again if they succeed and re-opens if they fail.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_requests: int = 10,
+        timeout_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        if not 0 < failure_rate_threshold <= 1:
+            raise InvalidParameterError(message=INVALID_FAILURE_RATE_THRESHOLD_ERROR.format(failure_rate_threshold))
+        for name, value, minimum in (
+            ("window_size", window_size, 1),
+            ("min_requests", min_requests, 1),
+            ("timeout_threshold", timeout_threshold, 1),
+            ("recovery_timeout", recovery_timeout, 0),
+            ("half_open_probes", half_open_probes, 1),
+        ):
+            if value < minimum:
+                raise InvalidParameterError(message=INVALID_MINIMUM_ERROR.format(name, value, minimum))
+
+        self.failure_rate_threshold = failure_rate_threshold
+        self.window_size = window_size
+        self.min_requests = min_requests
+        self.timeout_threshold = timeout_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def route(url: str) -> str:
+        """Normalize the path of a request to its route by replacing IDs with `:id`."""
+        return normalize_route(url)
+
+    def state(self, route: str) -> CircuitState:
+        """Return the state of the circuit of a route."""
+        with self._lock:
+            circuit = self._circuits.get(route)
+            if circuit is None:
+                return CircuitState.CLOSED
+            self._refresh(circuit, time.monotonic())
+            return circuit.state
+
+    def states(self) -> dict[str, CircuitState]:
+        """Return the state of the circuit of every route that was called."""
+        return {route: self.state(route) for route in list(self._circuits)}
+
+    def before_request(self, route: str) -> None:
+        """Let a request on a route through or raise a `CircuitOpenError` if its circuit is open."""
+        now = time.monotonic()
+
+        with self._lock:
+            circuit = self._circuits.get(route)
+            if circuit is None:
+                return
+            self._refresh(circuit, now)
+
+            if circuit.state == CircuitState.HALF_OPEN:
+                # A probe that never reported back (eg: the caller crashed) shouldn't keep the circuit stuck
+                stale_probes = now - circuit.last_probe_at > self.recovery_timeout
+                if circuit.probes_in_flight < self.half_open_probes or stale_probes:
+                    circuit.probes_in_flight = 1 if stale_probes else circuit.probes_in_flight + 1
+                    circuit.last_probe_at = now
+                    return
+                retry_after = 0.0
+            elif circuit.state == CircuitState.OPEN:
+                retry_after = circuit.opened_at + self.recovery_timeout - now
+            else:
+                return
+
+        raise CircuitOpenError(
+            message=CIRCUIT_OPEN_ERROR.format(route, retry_after),
+            route=route,
+            retry_after=retry_after,
+        )
+
+    def record(self, route: str, status: Optional[int] = None, error: Optional[Exception] = None) -> None:
+        """Record the outcome of a request: the HTTP status of its response or the error it failed with."""
+        failed = error is not None or status in FAILURE_STATUSES
+        now = time.monotonic()
+
+        with self._lock:
+            circuit = self._circuits.get(route)
+            if circuit is None:
+                circuit = self._circuits[route] = _Circuit(self.window_size)
+
+            if circuit.state == CircuitState.HALF_OPEN:
+                circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+                if failed:
+                    self._open(circuit, now)
+                elif circuit.probes_in_flight == 0:
+                    circuit.state = CircuitState.CLOSED
+                    circuit.outcomes.clear()
+                    circuit.consecutive_timeouts = 0
+                return
+
+            circuit.outcomes.append(failed)
+            circuit.consecutive_timeouts = circuit.consecutive_timeouts + 1 if isinstance(error, TimeoutError) else 0
+
+            if circuit.state != CircuitState.CLOSED:
+                return
+
+            failure_rate = sum(circuit.outcomes) / len(circuit.outcomes)
+            if circuit.consecutive_timeouts >= self.timeout_threshold or (
+                len(circuit.outcomes) >= self.min_requests and failure_rate >= self.failure_rate_threshold
+            ):
+                self._open(circuit, now)
+
+    def _open(self, circuit: _Circuit, now: float) -> None:
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = now
+        circuit.probes_in_flight = 0
+
+    def _refresh(self, circuit: _Circuit, now: float) -> None:
+        """Move an open circuit to half-open once its recovery timeout elapsed."""
+        if circuit.state == CircuitState.OPEN and now - circuit.opened_at >= self.recovery_timeout:
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.probes_in_flight = 0
+            circuit.last_probe_at = now
@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Tuple,
+)
+
+from easypost.constant import (
+    INVALID_CONCURRENCY_LIMITS_ERROR,
+    INVALID_DECREASE_FACTOR_ERROR,
+)
+from easypost.errors import InvalidParameterError
+
+if TYPE_CHECKING:
+    import asyncio
+
+OVERLOAD_STATUSES = (429, 503, 504)
+
+
+class ConcurrencyLimiter:
+    """Adapts the number of requests allowed in flight at once the way TCP congestion control does (AIMD).
+
+    While responses come back healthy and their latency stays within `latency_tolerance` times the lowest latency
+    seen, the limit grows additively by about `increase` per window of `limit` requests. When the API signals it is
+    overloaded (a `429`, `503` or `504`, a timeout or a connection error) or latency climbs past the tolerance, the
+    limit is cut multiplicatively by `decrease_factor`, at most once per window so a burst of failures from
+    requests that were already in flight only counts once.
+
+    A single limiter can be shared by threads and asyncio tasks (and by several clients). Read `limit` and
+    `in_flight` to monitor it.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise InvalidParameterError(
+                message=INVALID_CONCURRENCY_LIMITS_ERROR.format(min_limit, initial_limit, max_limit)
+            )
+        if not 0 < decrease_factor < 1:
+            raise InvalidParameterError(message=INVALID_DECREASE_FACTOR_ERROR.format(decrease_factor))
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._baseline_latency: Optional[float] = None
+        self._last_decrease_at = 0.0
+        self._condition = threading.Condition()
+        self._async_waiters: deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    @property
+    def limit(self) -> int:
+        """The number of requests currently allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return self._in_flight
+
+    def acquire(self) -> float:
+        """Block the current thread until a request may be sent, returns the time it started at."""
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+        return time.monotonic()
+
+    async def acquire_async(self) -> float:
+        """Suspend the current task until a request may be sent, returns the time it started at."""
+        import asyncio  # Only needed by async clients, deferred to keep `import easypost` fast
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            with self._condition:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return time.monotonic()
+
+                future = loop.create_future()
+                self._async_waiters.append((loop, future))
+
+            try:
+                await future
+            except asyncio.CancelledError:
+                with self._condition:
+                    try:
+                        self._async_waiters.remove((loop, future))
+                    except ValueError:
+                        # We were woken up as we got cancelled, pass the free slot on
+                        self._wake_waiters()
+                raise
+
+    def release(self, started_at: float, status: Optional[int] = None) -> None:
+        """Record the outcome of a request and free its slot.
+
+        `status` is the HTTP status of the response or `None` when the request failed without one.
+        """
+        now = time.monotonic()
+        latency = now - started_at
+
+        with self._condition:
+            self._in_flight -= 1
+
+            if status is None or status in OVERLOAD_STATUSES:
+                self._decrease(started_at, now)
+            elif self._baseline_latency is not None and latency > self._baseline_latency * self.latency_tolerance:
+                self._decrease(started_at, now)
+            else:
+                self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+
+            if status is not None and status < 500:
+                self._record_latency(latency)
+
+            self._wake_waiters()
+
+    def _decrease(self, started_at: float, now: float) -> None:
+        """Cut the limit, unless it was already cut since this request started."""
+        if started_at < self._last_decrease_at:
+            return
+
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._last_decrease_at = now
+
+    def _record_latency(self, latency: float) -> None:
+        """Track the lowest latency seen, drifting slowly towards recent latencies so the baseline can recover
+        after the network conditions change.
+        """
+        if self._baseline_latency is None or latency < self._baseline_latency:
+            self._baseline_latency = latency
+        else:
+            self._baseline_latency += (latency - self._baseline_latency) * 0.01
+
+    def _wake_waiters(self) -> None:
+        """Wake up as many waiting threads and tasks as there are free slots, they compete for them."""
+        free_slots = self.limit - self._in_flight
+        if free_slots <= 0:
+            return
+
+        self._condition.notify(free_slots)
+        for _ in range(min(free_slots, len(self._async_waiters))):
+            loop, future = self._async_waiters.popleft()
+            loop.call_soon_threadsafe(_resolve, future)
+
+
+def _resolve(future: "asyncio.Future") -> None:
+    if not future.done():
+        future.set_result(None)
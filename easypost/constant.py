@@ -9,18 +9,33 @@ API_VERSION = "v2"
 AUTHOR = "EasyPost <oss@easypost.com>"
 SUPPORT_EMAIL = "support@easypost.com"
 TIMEOUT = 60
+MAX_CONNECTIONS = 100
+RESPONSE_FORMAT = "object"
 
 # Error messages
+BULK_BUY_ITERATED_ERROR = "A bulk buy can only be iterated over once, create another one to buy more shipments."
+CIRCUIT_OPEN_ERROR = "The circuit breaker for {} is open after repeated failures, retry in {:.1f} seconds."
 COMMUNICATION_ERROR = "Unexpected error communicating with EasyPost. If this problem persists please let us know at {}. Original error: {}"
+INVALID_CONCURRENCY_ERROR = "Invalid concurrency: {}, must be at least 1."
+INVALID_CONCURRENCY_LIMITS_ERROR = "Invalid concurrency limits: min_limit={}, initial_limit={}, max_limit={}, must satisfy 1 <= min_limit <= initial_limit <= max_limit."
+INVALID_DECREASE_FACTOR_ERROR = "Invalid decrease_factor: {}, must be between 0 and 1."
 INVALID_DELIVER_ACCURACY_ERROR = "Invalid delivery_accuracy value, must be one of: {}"
+INVALID_FAILURE_RATE_THRESHOLD_ERROR = "Invalid failure_rate_threshold: {}, must be greater than 0 and at most 1."
+INVALID_JSON_CODEC_ERROR = "Invalid JSON codec: {}, must be one of: {}."
+INVALID_MAX_ATTEMPTS_ERROR = "Invalid max_attempts: {}, must be at least 1."
+INVALID_MINIMUM_ERROR = "Invalid {}: {}, must be at least {}."
+INVALID_MODEL_CLASS_ERROR = "Invalid model class: {}, must be a subclass of EasyPostObject."
 INVALID_PAYMENT_METHOD_ERROR = "The chosen payment method is not valid. Please try again."
-INVALID_REQUEST_LIB_ERROR = "Bug discovered: invalid request_lib: {}. Please report to {}."
+INVALID_RATE_ERROR = "Invalid rate: {}, must be greater than 0."
 INVALID_REQUEST_METHOD_ERROR = "Bug discovered: invalid request method: {}. Please report to {}."
 INVALID_REQUEST_PARAMETERS_ERROR = "Only GET and DELETE requests support parameters."
 INVALID_REQUESTS_VERSION_ERROR = 'EasyPost requires an up to date requests library. Update requests via "pip install -U requests" or contact us at {}.'
 INVALID_RESPONSE_BODY_ERROR = "Invalid response from API: ({}) {}"
+INVALID_RESPONSE_FORMAT_ERROR = "Invalid response format: {}, must be one of: {}."
 INVALID_SIGNATURE_ERROR = "Webhook received does not contain an HMAC signature."
+INVALID_SYNC_RESOURCE_ERROR = "Invalid sync resource: {}, must be one of: {}."
 INVALID_WEBHOOK_VALIDATION_ERROR = "Webhook received did not originate from EasyPost or had a webhook secret mismatch."
+MISSING_HTTPX_ERROR = 'The async EasyPost client requires the httpx library. Install it via "pip install easypost[async]" or contact us at {}.'
 MISSING_PARAMETER_ERROR = "Missing required parameter: {}"
 NO_ATTRIBUTE_ERROR = "{} object has no attribute {}"
 NO_BILLING_ERROR = "Billing has not been setup for this user. Please add a payment method."
@@ -44,3 +59,7 @@ _CARRIER_ACCOUNT_TYPES_WITH_CUSTOM_OAUTH = [
     "UspsShipAccount",
 ]
 _FILTERS_KEY = "filters"
+_RESPONSE_FORMATS = [
+    "object",
+    "dict",
+]
@@ -1,131 +1,201 @@
-from typing import Any
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from easypost.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from easypost.concurrency_limiter import ConcurrencyLimiter
 from easypost.constant import (
+    _RESPONSE_FORMATS,
     API_BASE,
     API_VERSION,
-    INVALID_REQUESTS_VERSION_ERROR,
-    SUPPORT_EMAIL,
+    INVALID_RESPONSE_FORMAT_ERROR,
+    RESPONSE_FORMAT,
     TIMEOUT,
 )
 from easypost.easypost_object import convert_to_easypost_object
+from easypost.errors.general.invalid_parameter_error import InvalidParameterError
 from easypost.hooks import RequestHook, ResponseHook
+from easypost.json_codec import (
+    JsonCodec,
+    get_json_codec,
+)
+from easypost.rate_limiter import RateLimiter
 from easypost.requestor import RequestMethod, Requestor
-from easypost.services import (
-    AddressService,
-    ApiKeyService,
-    BatchService,
-    BetaRateService,
-    BetaReferralCustomerService,
-    BillingService,
-    CarrierAccountService,
-    CarrierMetadataService,
-    ClaimService,
-    CustomerPortalService,
-    CustomsInfoService,
-    CustomsItemService,
-    EmbeddableService,
-    EndShipperService,
-    EventService,
-    FedExRegistrationService,
-    InsuranceService,
-    LumaService,
-    OrderService,
-    ParcelService,
-    PickupService,
-    RateService,
-    ReferralCustomerService,
-    RefundService,
-    ReportService,
-    ScanFormService,
-    ShipmentService,
-    SmartRateService,
-    TrackerService,
-    UserService,
-    WebhookService,
+from easypost.response_cache import ResponseCache
+from easypost.retry_policy import RetryPolicy
+from easypost.services.base_service import LazyService
+from easypost.single_flight import SingleFlight
+from easypost.transports import (
+    RequestsTransport,
+    Transport,
+    UrlfetchTransport,
 )
 
+if TYPE_CHECKING:
+    from easypost.services import (
+        AddressService,
+        ApiKeyService,
+        BatchService,
+        BetaRateService,
+        BetaReferralCustomerService,
+        BillingService,
+        CarrierAccountService,
+        CarrierMetadataService,
+        ClaimService,
+        CustomerPortalService,
+        CustomsInfoService,
+        CustomsItemService,
+        EmbeddableService,
+        EndShipperService,
+        EventService,
+        FedExRegistrationService,
+        InsuranceService,
+        LumaService,
+        OrderService,
+        ParcelService,
+        PickupService,
+        RateService,
+        ReferralCustomerService,
+        RefundService,
+        ReportService,
+        ScanFormService,
+        ShipmentService,
+        SmartRateService,
+        TrackerService,
+        UserService,
+        WebhookService,
+    )
+
+
+_app_engine: Optional[bool] = None
+
+
+def _on_app_engine() -> bool:
+    """Return whether the urlfetch API of Google App Engine is available, only looked up once per process."""
+    global _app_engine
+
+    if _app_engine is None:
+        try:
+            from google.appengine.api import urlfetch  # type: ignore  # noqa: F401
+
+            _app_engine = True
+        except ImportError:
+            _app_engine = False
+
+    return _app_engine
+
 
 class EasyPostClient:
-    """A client object used to authenticate and configure all HTTP calls to the EasyPost API."""
+    """A client object used to authenticate and configure all HTTP calls to the EasyPost API.
+
+    Optional arguments tune how requests are made:
+    - `transport`: send requests over a custom HTTP stack (see `easypost.transports.Transport`)
+    - `json_codec`: `"orjson"`, `"ujson"`, `"json"` or a `JsonCodec`, the fastest installed codec by default
+    - `retry_policy`: retry requests that failed for a transient reason (see `RetryPolicy`)
+    - `rate_limiter`: throttle requests client-side (see `RateLimiter`)
+    - `concurrency_limiter`: adapt the number of requests in flight to how the API copes (see `ConcurrencyLimiter`)
+    - `circuit_breaker`: fail fast on routes that keep failing (see `CircuitBreaker` and `circuit_states()`)
+    - `single_flight`: let concurrent identical GET requests share a single HTTP call and its result
+    - `response_cache`: cache the responses of GET requests to routes that rarely change (see `ResponseCache`)
+    - `compact_models`: return memory-efficient slotted models for shipments, rates, trackers, tracking details,
+      addresses, parcels and postage labels (see `easypost.models.compact`)
+    - `lazy_models`: only convert the objects nested in a response when they are first accessed
+    - `response_format`: `"dict"` to return the decoded JSON as plain dicts and lists instead of EasyPostObjects
+    """
+
+    # Services, each built on first access
+    address: "LazyService[AddressService]" = LazyService("AddressService")
+    api_keys: "LazyService[ApiKeyService]" = LazyService("ApiKeyService")
+    batch: "LazyService[BatchService]" = LazyService("BatchService")
+    beta_rate: "LazyService[BetaRateService]" = LazyService("BetaRateService")
+    beta_referral_customer: "LazyService[BetaReferralCustomerService]" = LazyService("BetaReferralCustomerService")
+    billing: "LazyService[BillingService]" = LazyService("BillingService")
+    carrier_account: "LazyService[CarrierAccountService]" = LazyService("CarrierAccountService")
+    carrier_metadata: "LazyService[CarrierMetadataService]" = LazyService("CarrierMetadataService")
+    claim: "LazyService[ClaimService]" = LazyService("ClaimService")
+    customer_portal: "LazyService[CustomerPortalService]" = LazyService("CustomerPortalService")
+    customs_info: "LazyService[CustomsInfoService]" = LazyService("CustomsInfoService")
+    customs_item: "LazyService[CustomsItemService]" = LazyService("CustomsItemService")
+    embeddable: "LazyService[EmbeddableService]" = LazyService("EmbeddableService")
+    end_shipper: "LazyService[EndShipperService]" = LazyService("EndShipperService")
+    event: "LazyService[EventService]" = LazyService("EventService")
+    fedex_registration: "LazyService[FedExRegistrationService]" = LazyService("FedExRegistrationService")
+    insurance: "LazyService[InsuranceService]" = LazyService("InsuranceService")
+    luma: "LazyService[LumaService]" = LazyService("LumaService")
+    order: "LazyService[OrderService]" = LazyService("OrderService")
+    parcel: "LazyService[ParcelService]" = LazyService("ParcelService")
+    rate: "LazyService[RateService]" = LazyService("RateService")
+    pickup: "LazyService[PickupService]" = LazyService("PickupService")
+    referral_customer: "LazyService[ReferralCustomerService]" = LazyService("ReferralCustomerService")
+    refund: "LazyService[RefundService]" = LazyService("RefundService")
+    report: "LazyService[ReportService]" = LazyService("ReportService")
+    scan_form: "LazyService[ScanFormService]" = LazyService("ScanFormService")
+    shipment: "LazyService[ShipmentService]" = LazyService("ShipmentService")
+    smart_rate: "LazyService[SmartRateService]" = LazyService("SmartRateService")
+    tracker: "LazyService[TrackerService]" = LazyService("TrackerService")
+    user: "LazyService[UserService]" = LazyService("UserService")
+    webhook: "LazyService[WebhookService]" = LazyService("WebhookService")
 
     def __init__(
         self,
         api_key: str,
         api_base: str = f"{API_BASE}/{API_VERSION}",
         timeout: int = TIMEOUT,
+        transport: Optional[Transport] = None,
+        json_codec: Optional[Union[str, JsonCodec]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        single_flight: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        compact_models: bool = False,
+        lazy_models: bool = False,
+        response_format: str = RESPONSE_FORMAT,
     ):
         # Client configuration
         self.api_key = api_key
         self.api_base = api_base
         self.timeout = timeout
-
-        # Services
-        self.address = AddressService(self)
-        self.api_keys = ApiKeyService(self)
-        self.batch = BatchService(self)
-        self.beta_rate = BetaRateService(self)
-        self.beta_referral_customer = BetaReferralCustomerService(self)
-        self.billing = BillingService(self)
-        self.carrier_account = CarrierAccountService(self)
-        self.carrier_metadata = CarrierMetadataService(self)
-        self.claim = ClaimService(self)
-        self.customer_portal = CustomerPortalService(self)
-        self.customs_info = CustomsInfoService(self)
-        self.customs_item = CustomsItemService(self)
-        self.embeddable = EmbeddableService(self)
-        self.end_shipper = EndShipperService(self)
-        self.event = EventService(self)
-        self.fedex_registration = FedExRegistrationService(self)
-        self.insurance = InsuranceService(self)
-        self.luma = LumaService(self)
-        self.order = OrderService(self)
-        self.parcel = ParcelService(self)
-        self.rate = RateService(self)
-        self.pickup = PickupService(self)
-        self.referral_customer = ReferralCustomerService(self)
-        self.refund = RefundService(self)
-        self.report = ReportService(self)
-        self.scan_form = ScanFormService(self)
-        self.shipment = ShipmentService(self)
-        self.smart_rate = SmartRateService(self)
-        self.tracker = TrackerService(self)
-        self.user = UserService(self)
-        self.webhook = WebhookService(self)
+        self._json_codec = get_json_codec(json_codec)
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._concurrency_limiter = concurrency_limiter
+        self._circuit_breaker = circuit_breaker
+        self._single_flight = SingleFlight() if single_flight else None
+        self._response_cache = response_cache
+        self._compact_models = compact_models
+        self._lazy_models = lazy_models
+        if response_format not in _RESPONSE_FORMATS:
+            raise InvalidParameterError(
+                message=INVALID_RESPONSE_FORMAT_ERROR.format(response_format, ", ".join(_RESPONSE_FORMATS))
+            )
+        self._raw_responses = response_format == "dict"
+        # The headers of every request, built on the first one (see `Requestor._base_headers`)
+        self._base_headers: Optional[Tuple[str, dict[str, Any]]] = None
 
         # Hooks
         self._request_hook = RequestHook()
         self._response_hook = ResponseHook()
 
-        # use urlfetch as request_lib on google app engine, otherwise use requests
-        self._request_lib = None
-        try:
-            from google.appengine.api import urlfetch  # type: ignore
+        # Transport: use urlfetch on google app engine, otherwise use requests
+        if transport is None:
+            transport = UrlfetchTransport() if _on_app_engine() else RequestsTransport(api_base=self.api_base)
+        self._transport = transport
 
-            self._request_lib = "urlfetch"
-            # use the GAE application-wide "deadline" (or its default)
-            timeout = urlfetch.get_default_fetch_deadline() or self.timeout
-        except ImportError:
-            try:
-                import requests
-
-                self._request_lib = "requests"
-                self._requests_session = requests.Session()
-                requests_http_adapter = requests.adapters.HTTPAdapter(max_retries=3)
-                self._requests_session.mount(
-                    prefix=self.api_base.split(f"/{API_VERSION}")[0],
-                    adapter=requests_http_adapter,
-                )
-            except Exception:
-                raise ImportError(INVALID_REQUESTS_VERSION_ERROR.format(SUPPORT_EMAIL))
-
-            try:
-                requests_version = requests.__version__
-                major_version, _, _ = [int(i) for i in requests_version.split(".")]
-            except Exception:
-                raise ImportError(INVALID_REQUESTS_VERSION_ERROR.format(SUPPORT_EMAIL))
-            else:
-                if major_version < 1:
-                    raise ImportError(INVALID_REQUESTS_VERSION_ERROR.format(SUPPORT_EMAIL))
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """Return the state of the circuit breaker of every route called, empty without a circuit breaker."""
+        if self._circuit_breaker is None:
+            return {}
+
+        return self._circuit_breaker.states()
 
     def subscribe_to_request_hook(self, function):
         """Subscribe functions to run when a request occurs."""
@@ -143,13 +213,23 @@ class EasyPostClient:
         """Unsubscribe functions from running when a response occurs."""
         self._response_hook -= function
 
-    def make_api_call(self, method: RequestMethod, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+    def make_api_call(
+        self,
+        method: RequestMethod,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: Optional[dict[str, str]] = None,
+    ) -> dict[str, Any]:
         """Make an API call to the EasyPost API.
 
         This public, generic interface is useful for making arbitrary API calls to the EasyPost API that
         are not yet supported by the client library's services. When possible, the service for your use case
         should be used instead as it provides a more convenient and higher-level interface depending on the endpoint.
+        Extra `headers` (such as an `Idempotency-Key` allowing a POST to be retried) are sent with the request.
         """
-        response = Requestor(self).request(method=method, url=endpoint, params=params)
+        response = Requestor(self).request(method=method, url=endpoint, params=params, headers=headers)
+
+        if self._raw_responses:
+            return response
 
-        return convert_to_easypost_object(response=response)
+        return convert_to_easypost_object(response=response, compact=self._compact_models, lazy=self._lazy_models)
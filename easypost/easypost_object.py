@@ -1,12 +1,19 @@
+import hashlib
 import importlib
 import json
-import re
 from typing import (
     Any,
     Optional,
 )
 
-from easypost.constant import NO_ATTRIBUTE_ERROR
+from easypost.constant import (
+    INVALID_MODEL_CLASS_ERROR,
+    MISSING_PARAMETER_ERROR,
+    NO_ATTRIBUTE_ERROR,
+)
+from easypost.errors.general.invalid_object_error import InvalidObjectError
+from easypost.errors.general.missing_parameter_error import MissingParameterError
+from easypost.json_codec import get_json_codec
 
 EASYPOST_OBJECT_ID_PREFIX_TO_CLASS_NAME_MAP: dict[str, Any] = {
     "adr": "Address",
@@ -51,41 +58,113 @@ OBJECT_CLASS_NAME_OVERRIDES: dict[str, Any] = {
 }
 
 
+# Model classes by ID prefix and by `object` type, filled with the built-in models on the first conversion
+_id_prefix_models: dict[str, type["EasyPostObject"]] = {}
+_object_type_models: dict[str, type["EasyPostObject"]] = {}
+# Model classes registered through `register_model`, looked up before the built-in ones
+_registered_object_type_models: dict[str, type["EasyPostObject"]] = {}
+_registered_id_prefix_models: dict[str, type["EasyPostObject"]] = {}
+_builtin_models_registered = False
+
+
+def _register_builtin_models() -> None:
+    """Map each ID prefix and `object` type of the built-in models to its class, once per process."""
+    global _builtin_models_registered
+
+    # Imported here due to circular imports of EasyPostObject
+    models = importlib.import_module("easypost.models")
+    for id_prefix, class_name in EASYPOST_OBJECT_ID_PREFIX_TO_CLASS_NAME_MAP.items():
+        _id_prefix_models.setdefault(id_prefix, getattr(models, class_name))
+    for object_type, class_name in OBJECT_CLASS_NAME_OVERRIDES.items():
+        _object_type_models.setdefault(object_type, getattr(models, class_name))
+
+    _builtin_models_registered = True
+
+
+def register_model(
+    model_class: type["EasyPostObject"],
+    object_type: Optional[str] = None,
+    id_prefix: Optional[str] = None,
+) -> None:
+    """Convert the objects of an `object` type or ID prefix (such as `"shp"`) to a custom model class.
+
+    The model class must be a subclass of `EasyPostObject`. Registered classes take precedence over built-in ones,
+    whether the built-in class is found from the ID prefix or the `object` type.
+    """
+    if not (isinstance(model_class, type) and issubclass(model_class, EasyPostObject)):
+        raise InvalidObjectError(INVALID_MODEL_CLASS_ERROR.format(model_class))
+    if object_type is None and id_prefix is None:
+        raise MissingParameterError(MISSING_PARAMETER_ERROR.format("object_type or id_prefix"))
+
+    if object_type is not None:
+        _registered_object_type_models[object_type] = model_class
+    if id_prefix is not None:
+        _registered_id_prefix_models[id_prefix] = model_class
+
+
 def convert_to_easypost_object(
     response: dict[str, Any],
     parent: object = None,
     name: Optional[str] = None,
+    compact: bool = False,
+    lazy: bool = False,
 ):
-    """Convert a response to an EasyPostObject."""
+    """Convert a response to an EasyPostObject.
+
+    The model class is the one registered for the object's `object` type or ID prefix (see `register_model`), or
+    else the built-in model of the prefix of its ID, or of its `object` type when the prefix is unknown.
+
+    When `compact` is set, the resources that have a compact model (see `easypost.models.compact`) are converted to
+    it, along with the resources nested in them.
+
+    When `lazy` is set, objects wrap the values of the response and only convert a nested dict or list the first
+    time it is accessed, caching the result. Compact models are always converted eagerly.
+    """
     if isinstance(response, list):
-        return [convert_to_easypost_object(response=item, parent=parent) for item in response]
+        return [
+            convert_to_easypost_object(response=item, parent=parent, compact=compact, lazy=lazy) for item in response
+        ]
     elif isinstance(response, dict):
-        object_type_str = response.get("object", EasyPostObject)
-        class_name = OBJECT_CLASS_NAME_OVERRIDES.get(object_type_str, EasyPostObject)
-        object_id = response.get("id")
+        if not _builtin_models_registered:
+            _register_builtin_models()
 
-        if object_id is not None:
-            # If an object ID is present, use it to find the class type instead.
-            object_id_prefix = object_id.split("_")[0]
-            class_name = EASYPOST_OBJECT_ID_PREFIX_TO_CLASS_NAME_MAP.get(object_id_prefix, EasyPostObject)
+        object_type = response.get("object")
+        object_id = response.get("id")
 
-        # Dynamically import class models due to circular imports of EasyPostObject
-        class_model = (
-            getattr(
-                importlib.import_module(f"easypost.models.{re.sub(r'(?<!^)(?=[A-Z])', '_', class_name).lower()}"),
-                class_name,
+        class_model = _registered_object_type_models.get(object_type) if object_type is not None else None
+        if class_model is None and object_id is not None:
+            # The prefix ends at the first underscore, the rest of the ID is left alone
+            id_prefix = object_id.partition("_")[0]
+            class_model = _registered_id_prefix_models.get(id_prefix) or _id_prefix_models.get(id_prefix)
+        if class_model is None:
+            class_model = _object_type_models.get(object_type, EasyPostObject)  # type: ignore[arg-type]
+
+        if compact:
+            compact_model = _compact_models().get(
+                object_type if class_model is EasyPostObject else class_model.__name__  # type: ignore[arg-type]
             )
-            if class_name != EasyPostObject
-            else EasyPostObject
-        )
-
-        obj = class_model.construct_from(values=response, parent=parent, name=name)
+            if compact_model is not None:
+                return compact_model.construct_from(values=response, parent=parent, name=name, compact=True)
 
-        return obj
+        return class_model.construct_from(values=response, parent=parent, name=name, compact=compact, lazy=lazy)
     else:
         return response
 
 
+_compact_model_registry: Optional[dict[str, Any]] = None
+
+
+def _compact_models() -> dict[str, Any]:
+    """Return the compact model of each model class or `object` type, imported on first use."""
+    global _compact_model_registry
+
+    if _compact_model_registry is None:
+        # Imported here due to circular imports of EasyPostObject
+        _compact_model_registry = importlib.import_module("easypost.models.compact").COMPACT_MODELS
+
+    return _compact_model_registry
+
+
 class EasyPostObject(object):
     def __init__(
         self,
@@ -122,10 +201,24 @@ class EasyPostObject(object):
             return self.__dict__[k]
         except KeyError:
             pass
+
+        # Values of lazily converted objects are converted on first access, then cached like any other value
+        lazy_values = self.__dict__.get("_lazy_values")
+        if lazy_values is not None and k in lazy_values and k not in self._immutable_values:
+            value = self.__dict__[k] = convert_to_easypost_object(
+                response=lazy_values[k], parent=self, name=k, lazy=True
+            )
+            return value
+
         raise AttributeError(NO_ATTRIBUTE_ERROR.format(type(self).__name__, k))
 
     def __getitem__(self, k):
-        return self.__dict__[k]
+        try:
+            return self.__dict__[k]
+        except KeyError:
+            if k in self.__dict__.get("_lazy_values", ()):
+                return getattr(self, k)
+            raise
 
     def get(self, k, default: Any = None) -> Any:
         try:
@@ -157,23 +250,45 @@ class EasyPostObject(object):
         values: dict[str, Any],
         parent: object = None,
         name: Optional[str] = None,
+        compact: bool = False,
+        lazy: bool = False,
     ) -> object:
         """Construct an EasyPostObject from values returned by the API."""
         instance = cls(id=values.get("id"), parent=parent, name=name)
-        instance.convert_each_value(values=values)
+        if lazy:
+            instance.wrap_values(values=values)
+        else:
+            instance.convert_each_value(values=values, compact=compact)
 
         return instance
 
-    def convert_each_value(self, values: dict[str, Any]) -> None:
+    def convert_each_value(self, values: dict[str, Any], compact: bool = False) -> None:
         """Convert each value of a response into an EasyPostObject."""
-        for k, v in sorted(values.items()):
+        for k, v in values.items():
             if k == "id" and self.id != v:
                 self.id = v
             if k in self._immutable_values:
                 continue
-            self.__dict__[k] = convert_to_easypost_object(response=v, parent=self, name=k)
+            self.__dict__[k] = convert_to_easypost_object(response=v, parent=self, name=k, compact=compact)
             self._values.add(k)
 
+    def _ordered_keys(self) -> list[str]:
+        """Return the names of the fields set on the object, except its ID, in the order they were set."""
+        values = self._values
+        lazy_values = self.__dict__.get("_lazy_values")
+        if lazy_values is None:
+            return [k for k in self.__dict__ if k in values]
+
+        # Fields of the response come first, followed by the fields set on the object afterwards
+        keys = [k for k in lazy_values if k in values]
+        keys.extend(k for k in self.__dict__ if k in values and k not in lazy_values)
+        return keys
+
+    def wrap_values(self, values: dict[str, Any]) -> None:
+        """Keep the values of a response to convert each of them on first access."""
+        self.__dict__["_lazy_values"] = values
+        self._values.update(k for k in values if k not in self._immutable_values)
+
     def __repr__(self) -> str:
         """String representation of an EasyPostObject."""
         type_string = ""
@@ -191,35 +306,130 @@ class EasyPostObject(object):
         )
 
     def __str__(self) -> str:
-        return self.to_json(indent=2)
+        return self.to_json(indent=2, canonical=True)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, EasyPostObject):
             return False
-        return self.__str__() == other.__str__()
+        return _objects_equal(self, other)
+
+    def content_hash(self) -> str:
+        """Return a SHA-256 hash of the content of the object, the same for equal objects in any process.
+
+        Useful to de-duplicate snapshots of a resource, the hash is computed from the canonical JSON of the object.
+        """
+        canonical_json = json.dumps(
+            obj=self.to_dict(canonical=True),
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            cls=EasyPostObjectEncoder,
+        )
 
-    def to_json(self, indent: Optional[int] = None) -> str:
-        """Convert current object to json string."""
-        return json.dumps(obj=self.to_dict(), sort_keys=True, indent=indent, cls=EasyPostObjectEncoder)
+        return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert current object to a dict."""
+    def to_json(self, indent: Optional[int] = None, canonical: bool = False) -> str:
+        """Convert current object to json string.
+
+        Keys are only sorted when `canonical` is set.
+        """
+        return (
+            get_json_codec()
+            .dumps(
+                obj=self.to_dict(canonical=canonical),
+                default=_encode_easypost_object,
+                sort_keys=canonical,
+                indent=indent,
+            )
+            .decode("utf-8")
+        )
+
+    def to_dict(self, canonical: bool = False) -> dict[str, Any]:
+        """Convert current object to a dict.
+
+        Keys follow the order of the response, they are only sorted at every level when `canonical` is set.
+        """
 
         def _serialize(o):
             if isinstance(o, EasyPostObject):
-                return o.to_dict()
+                return o.to_dict(canonical=canonical)
             if isinstance(o, list):
                 return [_serialize(r) for r in o]
             return o
 
         d = {"id": self.get("id")} if self.get("id") else {}
-        for k in sorted(self._values):
+        for k in sorted(self._values) if canonical else self._ordered_keys():
             v = getattr(self, k)
             v = _serialize(v)
             d[k] = v
         return d
 
 
+def _objects_equal(a: EasyPostObject, b: EasyPostObject) -> bool:
+    """Compare two EasyPostObjects field by field, stopping at the first difference."""
+    if a is b:
+        return True
+    a_dict = a.__dict__
+    b_dict = b.__dict__
+    if (_object_id(a, a_dict) or None) != (_object_id(b, b_dict) or None):
+        return False
+
+    keys = a._values
+    if keys != b._values:
+        return False
+
+    # Values neither object has converted yet are compared as the values of the response
+    a_lazy_values = a_dict.get("_lazy_values")
+    b_lazy_values = b_dict.get("_lazy_values")
+    for k in keys:
+        if a_lazy_values is not None and b_lazy_values is not None and k not in a_dict and k not in b_dict:
+            if a_lazy_values[k] == b_lazy_values[k]:
+                continue
+        a_value = a_dict[k] if k in a_dict else getattr(a, k)
+        b_value = b_dict[k] if k in b_dict else getattr(b, k)
+        if isinstance(a_value, list):
+            if not _values_equal(a_value, b_value):
+                return False
+        elif a_value != b_value and not _serialized_equal(a_value, b_value):
+            return False
+
+    return True
+
+
+def _object_id(obj: EasyPostObject, obj_dict: dict[str, Any]) -> Optional[str]:
+    """Return the ID of an object, if any, without going through `__getattr__` for objects that have none."""
+    if "id" in obj_dict:
+        return obj_dict["id"]
+    # Compact objects keep their ID in a slot
+    return getattr(obj, "id", None) if hasattr(type(obj), "id") else None
+
+
+def _values_equal(a: Any, b: Any) -> bool:
+    """Compare two values of EasyPostObjects, lists included."""
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_values_equal(x, y) for x, y in zip(a, b))
+
+    return a == b or _serialized_equal(a, b)
+
+
+def _serialized_equal(a: Any, b: Any) -> bool:
+    """Compare an EasyPostObject with a plain value, as in the JSON both serialize to."""
+    a_object = isinstance(a, EasyPostObject)
+    b_object = isinstance(b, EasyPostObject)
+    if a_object == b_object:
+        # Either both objects, already compared field by field, or neither of them
+        return False
+
+    return (a.to_dict() if a_object else a) == (b.to_dict() if b_object else b)
+
+
+def _encode_easypost_object(obj: Any) -> Any:
+    """Convert an EasyPostObject nested in a plain dict to a dict when encoding JSON."""
+    if isinstance(obj, EasyPostObject):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class EasyPostObjectEncoder(json.JSONEncoder):
     def default(self, obj: Any) -> Any:
         """Convert an EasyPostObject to a dict."""
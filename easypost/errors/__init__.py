@@ -1,3 +1,102 @@
 # flake8: noqa
-from easypost.errors.api import *
-from easypost.errors.general import *
+from typing import TYPE_CHECKING
+
+from easypost.lazy_loader import lazy_loader
+
+
+if TYPE_CHECKING:
+    from easypost.errors.api import (
+        ApiError,
+        BadRequestError,
+        EncodingError,
+        ExternalApiError,
+        ForbiddenError,
+        GatewayTimeoutError,
+        HttpError,
+        InternalServerError,
+        InvalidRequestError,
+        JsonError,
+        MethodNotAllowedError,
+        NotFoundError,
+        PaymentError,
+        RateLimitError,
+        RedirectError,
+        ServiceUnavailableError,
+        TimeoutError,
+        UnauthorizedError,
+        UnknownApiError,
+    )
+    from easypost.errors.general import (
+        CircuitOpenError,
+        EasyPostError,
+        EndOfPaginationError,
+        FilteringError,
+        InvalidObjectError,
+        InvalidParameterError,
+        MissingParameterError,
+        SignatureVerificationError,
+    )
+
+
+__all__ = [
+    "ApiError",
+    "BadRequestError",
+    "EncodingError",
+    "ExternalApiError",
+    "ForbiddenError",
+    "GatewayTimeoutError",
+    "HttpError",
+    "InternalServerError",
+    "InvalidRequestError",
+    "JsonError",
+    "MethodNotAllowedError",
+    "NotFoundError",
+    "PaymentError",
+    "RateLimitError",
+    "RedirectError",
+    "ServiceUnavailableError",
+    "TimeoutError",
+    "UnauthorizedError",
+    "UnknownApiError",
+    "CircuitOpenError",
+    "EasyPostError",
+    "EndOfPaginationError",
+    "FilteringError",
+    "InvalidObjectError",
+    "InvalidParameterError",
+    "MissingParameterError",
+    "SignatureVerificationError",
+]
+
+__getattr__, __dir__ = lazy_loader(
+    __name__,
+    {
+        "ApiError": "easypost.errors.api.api_error",
+        "BadRequestError": "easypost.errors.api.bad_request_error",
+        "EncodingError": "easypost.errors.api.encoding_error",
+        "ExternalApiError": "easypost.errors.api.external_api_error",
+        "ForbiddenError": "easypost.errors.api.forbidden_error",
+        "GatewayTimeoutError": "easypost.errors.api.gateway_timeout_error",
+        "HttpError": "easypost.errors.api.http_error",
+        "InternalServerError": "easypost.errors.api.internal_server_error",
+        "InvalidRequestError": "easypost.errors.api.invalid_request_error",
+        "JsonError": "easypost.errors.api.json_error",
+        "MethodNotAllowedError": "easypost.errors.api.method_not_allowed_error",
+        "NotFoundError": "easypost.errors.api.not_found_error",
+        "PaymentError": "easypost.errors.api.payment_error",
+        "RateLimitError": "easypost.errors.api.rate_limit_error",
+        "RedirectError": "easypost.errors.api.redirect_error",
+        "ServiceUnavailableError": "easypost.errors.api.service_unavailable_error",
+        "TimeoutError": "easypost.errors.api.timeout_error",
+        "UnauthorizedError": "easypost.errors.api.unauthorized_error",
+        "UnknownApiError": "easypost.errors.api.unknown_api_error",
+        "CircuitOpenError": "easypost.errors.general.circuit_open_error",
+        "EasyPostError": "easypost.errors.general.easypost_error",
+        "EndOfPaginationError": "easypost.errors.general.end_of_pagination_error",
+        "FilteringError": "easypost.errors.general.filtering_error",
+        "InvalidObjectError": "easypost.errors.general.invalid_object_error",
+        "InvalidParameterError": "easypost.errors.general.invalid_parameter_error",
+        "MissingParameterError": "easypost.errors.general.missing_parameter_error",
+        "SignatureVerificationError": "easypost.errors.general.signature_verification_error",
+    },
+)
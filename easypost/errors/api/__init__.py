@@ -1,20 +1,74 @@
 # flake8: noqa
-from easypost.errors.api.api_error import ApiError
-from easypost.errors.api.bad_request_error import BadRequestError
-from easypost.errors.api.encoding_error import EncodingError
-from easypost.errors.api.external_api_error import ExternalApiError
-from easypost.errors.api.forbidden_error import ForbiddenError
-from easypost.errors.api.gateway_timeout_error import GatewayTimeoutError
-from easypost.errors.api.http_error import HttpError
-from easypost.errors.api.internal_server_error import InternalServerError
-from easypost.errors.api.invalid_request_error import InvalidRequestError
-from easypost.errors.api.json_error import JsonError
-from easypost.errors.api.method_not_allowed_error import MethodNotAllowedError
-from easypost.errors.api.not_found_error import NotFoundError
-from easypost.errors.api.payment_error import PaymentError
-from easypost.errors.api.rate_limit_error import RateLimitError
-from easypost.errors.api.redirect_error import RedirectError
-from easypost.errors.api.service_unavailable_error import ServiceUnavailableError
-from easypost.errors.api.timeout_error import TimeoutError
-from easypost.errors.api.unauthorized_error import UnauthorizedError
-from easypost.errors.api.unknown_api_error import UnknownApiError
+from typing import TYPE_CHECKING
+
+from easypost.lazy_loader import lazy_loader
+
+
+if TYPE_CHECKING:
+    from easypost.errors.api.api_error import ApiError
+    from easypost.errors.api.bad_request_error import BadRequestError
+    from easypost.errors.api.encoding_error import EncodingError
+    from easypost.errors.api.external_api_error import ExternalApiError
+    from easypost.errors.api.forbidden_error import ForbiddenError
+    from easypost.errors.api.gateway_timeout_error import GatewayTimeoutError
+    from easypost.errors.api.http_error import HttpError
+    from easypost.errors.api.internal_server_error import InternalServerError
+    from easypost.errors.api.invalid_request_error import InvalidRequestError
+    from easypost.errors.api.json_error import JsonError
+    from easypost.errors.api.method_not_allowed_error import MethodNotAllowedError
+    from easypost.errors.api.not_found_error import NotFoundError
+    from easypost.errors.api.payment_error import PaymentError
+    from easypost.errors.api.rate_limit_error import RateLimitError
+    from easypost.errors.api.redirect_error import RedirectError
+    from easypost.errors.api.service_unavailable_error import ServiceUnavailableError
+    from easypost.errors.api.timeout_error import TimeoutError
+    from easypost.errors.api.unauthorized_error import UnauthorizedError
+    from easypost.errors.api.unknown_api_error import UnknownApiError
+
+
+__all__ = [
+    "ApiError",
+    "BadRequestError",
+    "EncodingError",
+    "ExternalApiError",
+    "ForbiddenError",
+    "GatewayTimeoutError",
+    "HttpError",
+    "InternalServerError",
+    "InvalidRequestError",
+    "JsonError",
+    "MethodNotAllowedError",
+    "NotFoundError",
+    "PaymentError",
+    "RateLimitError",
+    "RedirectError",
+    "ServiceUnavailableError",
+    "TimeoutError",
+    "UnauthorizedError",
+    "UnknownApiError",
+]
+
+__getattr__, __dir__ = lazy_loader(
+    __name__,
+    {
+        "ApiError": "easypost.errors.api.api_error",
+        "BadRequestError": "easypost.errors.api.bad_request_error",
+        "EncodingError": "easypost.errors.api.encoding_error",
+        "ExternalApiError": "easypost.errors.api.external_api_error",
+        "ForbiddenError": "easypost.errors.api.forbidden_error",
+        "GatewayTimeoutError": "easypost.errors.api.gateway_timeout_error",
+        "HttpError": "easypost.errors.api.http_error",
+        "InternalServerError": "easypost.errors.api.internal_server_error",
+        "InvalidRequestError": "easypost.errors.api.invalid_request_error",
+        "JsonError": "easypost.errors.api.json_error",
+        "MethodNotAllowedError": "easypost.errors.api.method_not_allowed_error",
+        "NotFoundError": "easypost.errors.api.not_found_error",
+        "PaymentError": "easypost.errors.api.payment_error",
+        "RateLimitError": "easypost.errors.api.rate_limit_error",
+        "RedirectError": "easypost.errors.api.redirect_error",
+        "ServiceUnavailableError": "easypost.errors.api.service_unavailable_error",
+        "TimeoutError": "easypost.errors.api.timeout_error",
+        "UnauthorizedError": "easypost.errors.api.unauthorized_error",
+        "UnknownApiError": "easypost.errors.api.unknown_api_error",
+    },
+)
@@ -28,7 +28,9 @@ class ApiError(EasyPostError):
         self.errors = errors
         self.code = code
         self.http_status = http_status
-        self.http_body = http_body
+        # The body is kept as received and only decoded to text when `http_body` is read
+        self._http_body = http_body
+        self._http_body_text: Optional[str] = None
 
         if http_body:
             # Setup `json_body` property
@@ -50,6 +52,21 @@ class ApiError(EasyPostError):
                 except Exception:
                     self.code = None
 
+    @property
+    def http_body(self) -> Optional[str]:
+        """The body of the HTTP response that raised this error, decoded as text."""
+        if not isinstance(self._http_body, bytes):
+            return self._http_body
+
+        if self._http_body_text is None:
+            self._http_body_text = self._http_body.decode(encoding="utf-8", errors="replace")
+        return self._http_body_text
+
+    @http_body.setter
+    def http_body(self, value: Optional[Union[str, bytes]]) -> None:
+        self._http_body = value
+        self._http_body_text = None
+
     def _traverse_json_element(
         self,
         error_message: Optional[Union[dict[str, Any], list, str]],
@@ -1,8 +1,41 @@
 # flake8: noqa
-from easypost.errors.general.easypost_error import EasyPostError
-from easypost.errors.general.end_of_pagination_error import EndOfPaginationError
-from easypost.errors.general.filtering_error import FilteringError
-from easypost.errors.general.invalid_object_error import InvalidObjectError
-from easypost.errors.general.invalid_parameter_error import InvalidParameterError
-from easypost.errors.general.missing_parameter_error import MissingParameterError
-from easypost.errors.general.signature_verification_error import SignatureVerificationError
+from typing import TYPE_CHECKING
+
+from easypost.lazy_loader import lazy_loader
+
+
+if TYPE_CHECKING:
+    from easypost.errors.general.circuit_open_error import CircuitOpenError
+    from easypost.errors.general.easypost_error import EasyPostError
+    from easypost.errors.general.end_of_pagination_error import EndOfPaginationError
+    from easypost.errors.general.filtering_error import FilteringError
+    from easypost.errors.general.invalid_object_error import InvalidObjectError
+    from easypost.errors.general.invalid_parameter_error import InvalidParameterError
+    from easypost.errors.general.missing_parameter_error import MissingParameterError
+    from easypost.errors.general.signature_verification_error import SignatureVerificationError
+
+
+__all__ = [
+    "CircuitOpenError",
+    "EasyPostError",
+    "EndOfPaginationError",
+    "FilteringError",
+    "InvalidObjectError",
+    "InvalidParameterError",
+    "MissingParameterError",
+    "SignatureVerificationError",
+]
+
+__getattr__, __dir__ = lazy_loader(
+    __name__,
+    {
+        "CircuitOpenError": "easypost.errors.general.circuit_open_error",
+        "EasyPostError": "easypost.errors.general.easypost_error",
+        "EndOfPaginationError": "easypost.errors.general.end_of_pagination_error",
+        "FilteringError": "easypost.errors.general.filtering_error",
+        "InvalidObjectError": "easypost.errors.general.invalid_object_error",
+        "InvalidParameterError": "easypost.errors.general.invalid_parameter_error",
+        "MissingParameterError": "easypost.errors.general.missing_parameter_error",
+        "SignatureVerificationError": "easypost.errors.general.signature_verification_error",
+    },
+)
@@ -0,0 +1,10 @@
+from easypost.errors.general.easypost_error import EasyPostError
+
+
+class CircuitOpenError(EasyPostError):
+    """Raised without making a request while the circuit breaker of its route is open."""
+
+    def __init__(self, message: str, route: str, retry_after: float):
+        super().__init__(message)
+        self.route = route
+        self.retry_after = retry_after
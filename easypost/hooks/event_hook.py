@@ -4,6 +4,11 @@ class EventHook:
     def __init__(self):
         self._event_handlers = []
 
+    @property
+    def has_handlers(self) -> bool:
+        """Whether any handler is subscribed, so events nobody listens to can be skipped."""
+        return bool(self._event_handlers)
+
     def __iadd__(self, handler):
         self._event_handlers.append(handler)
         return self
@@ -0,0 +1,230 @@
+import datetime
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import (
+    Any,
+    Callable,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from easypost.constant import (
+    INVALID_SYNC_RESOURCE_ERROR,
+    MISSING_PARAMETER_ERROR,
+)
+from easypost.errors import (
+    InvalidParameterError,
+    MissingParameterError,
+)
+from easypost.time_shards import (
+    WINDOW_OVERLAP,
+    format_datetime,
+    parse_datetime,
+)
+
+# The services incremental syncs list objects from
+SYNC_RESOURCES = ("shipment", "tracker", "event")
+
+# How much time each window of a sync covers by default, a checkpoint is saved after each window
+DEFAULT_SYNC_WINDOW = datetime.timedelta(days=1)
+
+
+class Checkpoint(NamedTuple):
+    """How far a sync got: the newest object delivered and the end of the last window fully delivered."""
+
+    last_id: Optional[str]
+    last_created_at: Optional[str]
+    # The IDs delivered that were created at `last_created_at`, skipped if listed again
+    boundary_ids: tuple[str, ...]
+    synced_until: str
+
+    def to_json(self) -> str:
+        return json.dumps(self._asdict())
+
+    @classmethod
+    def from_json(cls, data: str) -> "Checkpoint":
+        values = json.loads(data)
+        values["boundary_ids"] = tuple(values["boundary_ids"])
+        return cls(**values)
+
+
+class CheckpointStore:
+    """Stores the checkpoints of incremental syncs, the interface every checkpoint store implements."""
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        """Return the checkpoint saved under `key`, if any."""
+        raise NotImplementedError
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        """Durably save a checkpoint under `key`, replacing the previous one."""
+        raise NotImplementedError
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Stores checkpoints in a JSON file, replaced atomically on each save so a crash never leaves it half written."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict[str, str]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        with self._lock:
+            data = self._read().get(key)
+        return Checkpoint.from_json(data) if data is not None else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[key] = checkpoint.to_json()
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".checkpoints-")
+            try:
+                with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                    json.dump(checkpoints, file, indent=2, sort_keys=True)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temporary_path, self.path)
+            except BaseException:
+                os.unlink(temporary_path)
+                raise
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Stores checkpoints in a SQLite database on disk, shared by every process using the same `path`."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints (key TEXT PRIMARY KEY, checkpoint TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection of the current thread, SQLite connections can't be shared between threads."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        row = self._connect().execute("SELECT checkpoint FROM checkpoints WHERE key = ?", (key,)).fetchone()
+        return Checkpoint.from_json(row[0]) if row is not None else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (key, checkpoint) VALUES (?, ?)",
+                (key, checkpoint.to_json()),
+            )
+
+
+class IncrementalSync:
+    """Delivers the shipments, trackers or events created since the last run to a sink, resuming after a crash.
+
+    Each run lists the objects created since the checkpoint of the resource and filters, one time window of
+    `window` at a time from the oldest, and saves a checkpoint once every object of a window was passed to the sink.
+    The first run starts at `start_datetime`. A run interrupted part way through a window lists that window again
+    on the next run, so objects are delivered at least once: objects already delivered up to the checkpoint are
+    skipped by ID, but the sink may receive the objects of an interrupted window twice.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        resource: str,
+        store: CheckpointStore,
+        start_datetime: Optional[Union[str, datetime.datetime]] = None,
+        window: datetime.timedelta = DEFAULT_SYNC_WINDOW,
+        page_size: int = 100,
+        **filters,
+    ):
+        if resource not in SYNC_RESOURCES:
+            raise InvalidParameterError(message=INVALID_SYNC_RESOURCE_ERROR.format(resource, ", ".join(SYNC_RESOURCES)))
+
+        self.client = client
+        self.resource = resource
+        self.store = store
+        self.start_datetime = parse_datetime(start_datetime) if start_datetime is not None else None
+        self.window = window
+        self.page_size = page_size
+        self.filters = filters
+        self.key = f"{resource}:{json.dumps(filters, sort_keys=True, default=str)}"
+
+    def checkpoint(self) -> Optional[Checkpoint]:
+        """Return the checkpoint the next run resumes from, if any."""
+        return self.store.load(self.key)
+
+    def run(self, sink: Callable[[Any], Any], until: Optional[Union[str, datetime.datetime]] = None) -> int:
+        """Pass each object created since the checkpoint (and up to `until`, now by default) to `sink`.
+
+        Returns the number of objects delivered.
+        """
+        checkpoint = self.store.load(self.key)
+        if checkpoint is not None:
+            # Listing from a little before the end of the last window catches the objects listed at its very end
+            window_start = parse_datetime(checkpoint.synced_until) - WINDOW_OVERLAP
+        elif self.start_datetime is not None:
+            window_start = self.start_datetime
+            checkpoint = Checkpoint(None, None, (), format_datetime(window_start))
+        else:
+            raise MissingParameterError(MISSING_PARAMETER_ERROR.format("start_datetime"))
+
+        end = parse_datetime(until) if until is not None else datetime.datetime.now(datetime.timezone.utc)
+        service = getattr(self.client, self.resource)
+        delivered = 0
+
+        while window_start < end:
+            window_end = min(window_start + self.window, end)
+            # Timestamps are compared as datetimes, the API may format them differently over time
+            checkpoint_created_at = (
+                parse_datetime(checkpoint.last_created_at) if checkpoint.last_created_at is not None else None
+            )
+            newest_created_at = checkpoint_created_at
+            last_created_at = checkpoint.last_created_at
+            last_id = checkpoint.last_id
+            boundary_ids = set(checkpoint.boundary_ids)
+
+            for item in service.iter_all(
+                start_datetime=format_datetime(window_start),
+                end_datetime=format_datetime(window_end),
+                page_size=self.page_size,
+                **self.filters,
+            ):
+                created_at = parse_datetime(item["created_at"])
+                if checkpoint_created_at is not None and (
+                    created_at < checkpoint_created_at
+                    or (created_at == checkpoint_created_at and item["id"] in checkpoint.boundary_ids)
+                ):
+                    continue
+
+                sink(item)
+                delivered += 1
+
+                if newest_created_at is None or created_at > newest_created_at:
+                    newest_created_at = created_at
+                    last_created_at = item["created_at"]
+                    last_id = item["id"]
+                    boundary_ids = {item["id"]}
+                elif created_at == newest_created_at:
+                    boundary_ids.add(item["id"])
+
+            checkpoint = Checkpoint(last_id, last_created_at, tuple(sorted(boundary_ids)), format_datetime(window_end))
+            self.store.save(self.key, checkpoint)
+            window_start = window_end
+
+        return delivered
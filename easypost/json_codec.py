@@ -0,0 +1,161 @@
+import json
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Union,
+)
+
+from easypost.constant import INVALID_JSON_CODEC_ERROR
+from easypost.errors import InvalidParameterError
+
+
+class JsonCodec:
+    """Encodes objects to JSON bytes and decodes JSON documents, the interface every codec implements.
+
+    Decoding accepts `bytes` (as returned by a transport) or `str` and raises a `ValueError` on invalid JSON.
+    """
+
+    name = ""
+
+    def dumps(
+        self,
+        obj: Any,
+        default: Optional[Callable[[Any], Any]] = None,
+        sort_keys: bool = False,
+        indent: Optional[int] = None,
+    ) -> bytes:
+        """Encode an object to UTF-8 JSON bytes."""
+        raise NotImplementedError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decode a JSON document."""
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(JsonCodec):
+    """A codec backed by the standard library `json` module, always available."""
+
+    name = "json"
+
+    def dumps(
+        self,
+        obj: Any,
+        default: Optional[Callable[[Any], Any]] = None,
+        sort_keys: bool = False,
+        indent: Optional[int] = None,
+    ) -> bytes:
+        return json.dumps(obj, default=default, sort_keys=sort_keys, indent=indent).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """A codec backed by `orjson`, which parses bytes natively and encodes straight to bytes."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        # The API accepts non-string keys (eg: integer IDs) the same way the standard library encodes them
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(
+        self,
+        obj: Any,
+        default: Optional[Callable[[Any], Any]] = None,
+        sort_keys: bool = False,
+        indent: Optional[int] = None,
+    ) -> bytes:
+        if indent not in (None, 2):
+            # orjson can only indent with 2 spaces
+            return _STDLIB_CODEC.dumps(obj, default=default, sort_keys=sort_keys, indent=indent)
+
+        option = self._option
+        if sort_keys:
+            option |= self._orjson.OPT_SORT_KEYS
+        if indent:
+            option |= self._orjson.OPT_INDENT_2
+
+        return self._orjson.dumps(obj, default=default, option=option)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """A codec backed by `ujson`."""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson  # type: ignore
+
+        self._ujson = ujson
+
+    def dumps(
+        self,
+        obj: Any,
+        default: Optional[Callable[[Any], Any]] = None,
+        sort_keys: bool = False,
+        indent: Optional[int] = None,
+    ) -> bytes:
+        return self._ujson.dumps(
+            obj,
+            default=default,
+            sort_keys=sort_keys,
+            indent=indent or 0,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+        ).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._ujson.loads(data)
+
+
+# Ordered by preference when detecting the codec to use
+JSON_CODECS: dict[str, type[JsonCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+    StdlibJsonCodec.name: StdlibJsonCodec,
+}
+
+_STDLIB_CODEC = StdlibJsonCodec()
+_default_codec: Optional[JsonCodec] = None
+
+
+def detect_json_codec() -> JsonCodec:
+    """Return the fastest installed codec: orjson, then ujson, then the standard library."""
+    global _default_codec
+
+    if _default_codec is None:
+        for codec_class in JSON_CODECS.values():
+            try:
+                _default_codec = codec_class()
+                break
+            except ImportError:
+                continue
+
+    return _default_codec  # type: ignore[return-value]
+
+
+def get_json_codec(codec: Optional[Union[str, JsonCodec]] = None) -> JsonCodec:
+    """Resolve a codec from an instance, the name of a built-in codec (`orjson`, `ujson` or `json`) or `None`
+    to detect the fastest one installed.
+    """
+    if codec is None:
+        return detect_json_codec()
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == StdlibJsonCodec.name:
+        return _STDLIB_CODEC
+
+    try:
+        codec_class = JSON_CODECS[codec]
+    except KeyError:
+        raise InvalidParameterError(message=INVALID_JSON_CODEC_ERROR.format(codec, ", ".join(JSON_CODECS)))
+
+    return codec_class()
@@ -0,0 +1,36 @@
+import importlib
+from typing import (
+    Any,
+    Callable,
+    Tuple,
+)
+
+
+def lazy_loader(package: str, attributes: dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build the module-level `__getattr__` and `__dir__` of a package whose `attributes` (a map of names to the
+    module defining them) are only imported the first time they are accessed, keeping `import easypost` cheap.
+
+    Submodules of the package are imported the first time they are accessed as attributes too.
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = attributes.get(name)
+        if module is None:
+            # Submodules (such as `easypost.errors`) stay reachable as attributes after importing the package alone
+            try:
+                return importlib.import_module(f"{package}.{name}")
+            except ModuleNotFoundError as error:
+                if error.name != f"{package}.{name}":
+                    raise
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module), name)
+        # Later lookups find the attribute on the package without going through `__getattr__` again
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
@@ -1,27 +1,124 @@
 # flake8: noqa
-from easypost.models.address import Address
-from easypost.models.api_key import ApiKey
-from easypost.models.batch import Batch
-from easypost.models.billing import Billing
-from easypost.models.brand import Brand
-from easypost.models.carrier_account import CarrierAccount
-from easypost.models.claim import Claim
-from easypost.models.customs_info import CustomsInfo
-from easypost.models.customs_item import CustomsItem
-from easypost.models.end_shipper import EndShipper
-from easypost.models.event import Event
-from easypost.models.insurance import Insurance
-from easypost.models.order import Order
-from easypost.models.parcel import Parcel
-from easypost.models.payload import Payload
-from easypost.models.pickup import Pickup
-from easypost.models.pickup_rate import PickupRate
-from easypost.models.postage_label import PostageLabel
-from easypost.models.rate import Rate
-from easypost.models.refund import Refund
-from easypost.models.report import Report
-from easypost.models.scan_form import ScanForm
-from easypost.models.shipment import Shipment
-from easypost.models.tracker import Tracker
-from easypost.models.user import User
-from easypost.models.webhook import Webhook
+from typing import TYPE_CHECKING
+
+from easypost.lazy_loader import lazy_loader
+
+
+if TYPE_CHECKING:
+    from easypost.models.address import Address
+    from easypost.models.api_key import ApiKey
+    from easypost.models.batch import Batch
+    from easypost.models.billing import Billing
+    from easypost.models.brand import Brand
+    from easypost.models.carrier_account import CarrierAccount
+    from easypost.models.claim import Claim
+    from easypost.models.compact import (
+        CompactAddress,
+        CompactEasyPostObject,
+        CompactParcel,
+        CompactPostageLabel,
+        CompactRate,
+        CompactShipment,
+        CompactTracker,
+        CompactTrackingDetail,
+        CompactTrackingLocation,
+    )
+    from easypost.models.customs_info import CustomsInfo
+    from easypost.models.customs_item import CustomsItem
+    from easypost.models.end_shipper import EndShipper
+    from easypost.models.event import Event
+    from easypost.models.insurance import Insurance
+    from easypost.models.order import Order
+    from easypost.models.parcel import Parcel
+    from easypost.models.payload import Payload
+    from easypost.models.pickup import Pickup
+    from easypost.models.pickup_rate import PickupRate
+    from easypost.models.postage_label import PostageLabel
+    from easypost.models.rate import Rate
+    from easypost.models.refund import Refund
+    from easypost.models.report import Report
+    from easypost.models.scan_form import ScanForm
+    from easypost.models.shipment import Shipment
+    from easypost.models.tracker import Tracker
+    from easypost.models.user import User
+    from easypost.models.webhook import Webhook
+
+
+__all__ = [
+    "Address",
+    "ApiKey",
+    "Batch",
+    "Billing",
+    "Brand",
+    "CarrierAccount",
+    "Claim",
+    "CompactAddress",
+    "CompactEasyPostObject",
+    "CompactParcel",
+    "CompactPostageLabel",
+    "CompactRate",
+    "CompactShipment",
+    "CompactTracker",
+    "CompactTrackingDetail",
+    "CompactTrackingLocation",
+    "CustomsInfo",
+    "CustomsItem",
+    "EndShipper",
+    "Event",
+    "Insurance",
+    "Order",
+    "Parcel",
+    "Payload",
+    "Pickup",
+    "PickupRate",
+    "PostageLabel",
+    "Rate",
+    "Refund",
+    "Report",
+    "ScanForm",
+    "Shipment",
+    "Tracker",
+    "User",
+    "Webhook",
+]
+
+__getattr__, __dir__ = lazy_loader(
+    __name__,
+    {
+        "Address": "easypost.models.address",
+        "ApiKey": "easypost.models.api_key",
+        "Batch": "easypost.models.batch",
+        "Billing": "easypost.models.billing",
+        "Brand": "easypost.models.brand",
+        "CarrierAccount": "easypost.models.carrier_account",
+        "Claim": "easypost.models.claim",
+        "CompactAddress": "easypost.models.compact",
+        "CompactEasyPostObject": "easypost.models.compact",
+        "CompactParcel": "easypost.models.compact",
+        "CompactPostageLabel": "easypost.models.compact",
+        "CompactRate": "easypost.models.compact",
+        "CompactShipment": "easypost.models.compact",
+        "CompactTracker": "easypost.models.compact",
+        "CompactTrackingDetail": "easypost.models.compact",
+        "CompactTrackingLocation": "easypost.models.compact",
+        "CustomsInfo": "easypost.models.customs_info",
+        "CustomsItem": "easypost.models.customs_item",
+        "EndShipper": "easypost.models.end_shipper",
+        "Event": "easypost.models.event",
+        "Insurance": "easypost.models.insurance",
+        "Order": "easypost.models.order",
+        "Parcel": "easypost.models.parcel",
+        "Payload": "easypost.models.payload",
+        "Pickup": "easypost.models.pickup",
+        "PickupRate": "easypost.models.pickup_rate",
+        "PostageLabel": "easypost.models.postage_label",
+        "Rate": "easypost.models.rate",
+        "Refund": "easypost.models.refund",
+        "Report": "easypost.models.report",
+        "ScanForm": "easypost.models.scan_form",
+        "Shipment": "easypost.models.shipment",
+        "Tracker": "easypost.models.tracker",
+        "User": "easypost.models.user",
+        "Webhook": "easypost.models.webhook",
+    },
+)
@@ -0,0 +1,277 @@
+from typing import (
+    Any,
+    Optional,
+)
+
+from easypost.constant import NO_ATTRIBUTE_ERROR
+from easypost.easypost_object import (
+    EasyPostObject,
+    convert_to_easypost_object,
+)
+from easypost.models.address import Address
+from easypost.models.parcel import Parcel
+from easypost.models.postage_label import PostageLabel
+from easypost.models.rate import Rate
+from easypost.models.shipment import Shipment
+from easypost.models.tracker import Tracker
+
+_MISSING = object()
+
+
+class CompactEasyPostObject(EasyPostObject):
+    """An `EasyPostObject` storing the fields it knows about in slots instead of a per-instance dict.
+
+    Subclasses list their known fields in `__slots__`, fields the API adds later are kept in the instance's overflow
+    `__dict__`, which is only allocated when such a field shows up. Attribute, `get`, `[]`, `to_dict` and `to_json`
+    access behave like any other `EasyPostObject`.
+    """
+
+    __slots__ = ("_parent", "_name")
+
+    # The known fields of a model, its `__slots__`
+    _fields: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fields = frozenset(cls.__dict__.get("__slots__", ()))
+
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        parent: Optional[object] = None,
+        name: Optional[str] = None,
+        **params,
+    ):
+        object.__setattr__(self, "_parent", parent)
+        object.__setattr__(self, "_name", name)
+
+        if id:
+            object.__setattr__(self, "id", id)
+
+    def __setattr__(self, k, v: Any) -> None:
+        # Known fields land in their slot, anything else in the overflow dict
+        object.__setattr__(self, k, v)
+
+    def __getattr__(self, k) -> Any:
+        # Only reached for unset slots and fields that aren't in the overflow dict
+        raise AttributeError(NO_ATTRIBUTE_ERROR.format(type(self).__name__, k))
+
+    def __getitem__(self, k):
+        if k in self._fields:
+            value = getattr(self, k, _MISSING)
+            if value is _MISSING:
+                raise KeyError(k)
+            return value
+
+        return vars(self)[k]
+
+    @property
+    def _values(self) -> set[str]:
+        """The names of the fields set on the object, except its ID."""
+        values = {field for field in self._fields if getattr(self, field, _MISSING) is not _MISSING}
+        values.update(vars(self))
+        values.discard("id")
+        return values
+
+    def _ordered_keys(self) -> list[str]:
+        # Slots don't keep the order fields were set in, list them sorted so the order is the same in every process
+        return sorted(self._values)
+
+    @property
+    def keys(self) -> list[str]:
+        return sorted(self._values)
+
+    @property
+    def values(self) -> list[Any]:
+        return [self[k] for k in sorted(self._values)]
+
+    def convert_each_value(self, values: dict[str, Any], compact: bool = True) -> None:
+        """Convert each value of a response into an EasyPostObject, nested objects are compact as well."""
+        for k, v in sorted(values.items()):
+            object.__setattr__(self, k, convert_to_easypost_object(response=v, parent=self, name=k, compact=True))
+
+
+class CompactAddress(CompactEasyPostObject, Address):
+    __slots__ = (
+        "carrier_facility",
+        "city",
+        "company",
+        "country",
+        "created_at",
+        "email",
+        "federal_tax_id",
+        "id",
+        "mode",
+        "name",
+        "object",
+        "phone",
+        "residential",
+        "state",
+        "state_tax_id",
+        "street1",
+        "street2",
+        "updated_at",
+        "verifications",
+        "zip",
+    )
+
+
+class CompactParcel(CompactEasyPostObject, Parcel):
+    __slots__ = (
+        "created_at",
+        "height",
+        "id",
+        "length",
+        "mode",
+        "object",
+        "predefined_package",
+        "updated_at",
+        "weight",
+        "width",
+    )
+
+
+class CompactPostageLabel(CompactEasyPostObject, PostageLabel):
+    __slots__ = (
+        "created_at",
+        "date_advance",
+        "id",
+        "integrated_form",
+        "label_date",
+        "label_epl2_url",
+        "label_file",
+        "label_file_type",
+        "label_pdf_url",
+        "label_resolution",
+        "label_size",
+        "label_type",
+        "label_url",
+        "label_zpl_url",
+        "object",
+        "updated_at",
+    )
+
+
+class CompactRate(CompactEasyPostObject, Rate):
+    __slots__ = (
+        "billing_type",
+        "carrier",
+        "carrier_account_id",
+        "created_at",
+        "currency",
+        "delivery_date",
+        "delivery_date_guaranteed",
+        "delivery_days",
+        "est_delivery_days",
+        "id",
+        "list_currency",
+        "list_rate",
+        "mode",
+        "object",
+        "rate",
+        "retail_currency",
+        "retail_rate",
+        "service",
+        "shipment_id",
+        "time_in_transit",
+        "updated_at",
+    )
+
+
+class CompactShipment(CompactEasyPostObject, Shipment):
+    __slots__ = (
+        "batch_id",
+        "batch_message",
+        "batch_status",
+        "buyer_address",
+        "created_at",
+        "customs_info",
+        "fees",
+        "forms",
+        "from_address",
+        "id",
+        "insurance",
+        "is_return",
+        "messages",
+        "mode",
+        "object",
+        "options",
+        "order_id",
+        "parcel",
+        "postage_label",
+        "rates",
+        "reference",
+        "refund_status",
+        "return_address",
+        "scan_form",
+        "selected_rate",
+        "status",
+        "tax_identifiers",
+        "to_address",
+        "tracker",
+        "tracking_code",
+        "updated_at",
+        "usps_zone",
+    )
+
+
+class CompactTracker(CompactEasyPostObject, Tracker):
+    __slots__ = (
+        "carrier",
+        "carrier_detail",
+        "created_at",
+        "est_delivery_date",
+        "fees",
+        "finalized",
+        "id",
+        "is_return",
+        "mode",
+        "object",
+        "public_url",
+        "shipment_id",
+        "signed_by",
+        "status",
+        "status_detail",
+        "tracking_code",
+        "tracking_details",
+        "updated_at",
+        "weight",
+    )
+
+
+class CompactTrackingDetail(CompactEasyPostObject):
+    __slots__ = (
+        "carrier_code",
+        "datetime",
+        "description",
+        "est_delivery_date",
+        "message",
+        "object",
+        "source",
+        "status",
+        "status_detail",
+        "tracking_location",
+    )
+
+
+class CompactTrackingLocation(CompactEasyPostObject):
+    __slots__ = (
+        "city",
+        "country",
+        "object",
+        "state",
+        "zip",
+    )
+
+
+# The compact model of each model class or `object` type that has one
+COMPACT_MODELS: dict[str, type[CompactEasyPostObject]] = {
+    "Address": CompactAddress,
+    "Parcel": CompactParcel,
+    "PostageLabel": CompactPostageLabel,
+    "Rate": CompactRate,
+    "Shipment": CompactShipment,
+    "Tracker": CompactTracker,
+    "TrackingDetail": CompactTrackingDetail,
+    "TrackingLocation": CompactTrackingLocation,
+}
@@ -0,0 +1,95 @@
+import queue
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterator,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+# Kinds of the entries passed from the producer to the consumer
+_ITEM = "item"
+_ERROR = "error"
+_DONE = "done"
+
+# How often a producer blocked on a full buffer checks whether the consumer went away, in seconds
+_STOP_CHECK_INTERVAL = 0.1
+
+
+def prefetch(iterator: Iterator[T], depth: int) -> Iterator[T]:
+    """Pull the items of an iterator on a background thread, up to `depth` items ahead of the caller.
+
+    Errors raised while pulling an item are raised to the caller when it reaches that item. The thread stops once the
+    iterator is exhausted or the caller stops iterating (the returned generator is closed or garbage collected).
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(entry: tuple[str, Any]) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=_STOP_CHECK_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterator:
+                if not put((_ITEM, item)):
+                    return
+        except BaseException as error:
+            put((_ERROR, error))
+        else:
+            put((_DONE, None))
+
+    threading.Thread(target=produce, name="easypost-prefetch", daemon=True).start()
+
+    try:
+        while True:
+            kind, value = buffer.get()
+            if kind == _ITEM:
+                yield value
+            elif kind == _ERROR:
+                raise value
+            else:
+                return
+    finally:
+        stopped.set()
+
+
+async def async_prefetch(iterator: AsyncIterator[T], depth: int) -> AsyncIterator[T]:
+    """Pull the items of an async iterator on a background task, up to `depth` items ahead of the caller.
+
+    Errors raised while pulling an item are raised to the caller when it reaches that item. The task is cancelled once
+    the caller stops iterating.
+    """
+    import asyncio
+
+    buffer: asyncio.Queue = asyncio.Queue(maxsize=depth)
+
+    async def produce() -> None:
+        try:
+            async for item in iterator:
+                await buffer.put((_ITEM, item))
+        except Exception as error:
+            await buffer.put((_ERROR, error))
+        else:
+            await buffer.put((_DONE, None))
+
+    task = asyncio.get_running_loop().create_task(produce())
+
+    try:
+        while True:
+            kind, value = await buffer.get()
+            if kind == _ITEM:
+                yield value
+            elif kind == _ERROR:
+                raise value
+            else:
+                return
+    finally:
+        task.cancel()
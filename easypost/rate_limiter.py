@@ -0,0 +1,177 @@
+import hashlib
+import json
+import threading
+import time
+from typing import (
+    IO,
+    Optional,
+    Tuple,
+)
+
+from easypost.constant import INVALID_RATE_ERROR
+from easypost.errors import InvalidParameterError
+from easypost.routes import route_collection
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover, Windows
+    fcntl = None  # type: ignore
+    import msvcrt
+
+
+def _reserve_token(
+    tokens: float,
+    updated_at: float,
+    now: float,
+    rate: float,
+    burst: float,
+) -> Tuple[float, float]:
+    """Refill a token bucket up to `now` and take a token from it.
+
+    The token is taken even when the bucket is empty (leaving it in debt), the returned wait is how long the
+    caller has to sleep before its token is actually available. Reserving this way keeps callers in order and
+    means the state only needs to be touched once per request.
+
+    Returns the new number of tokens and the wait in seconds.
+    """
+    tokens = min(burst, tokens + (now - updated_at) * rate) - 1
+    wait = -tokens / rate if tokens < 0 else 0.0
+
+    return tokens, wait
+
+
+class RateLimiterBackend:
+    """Stores the state of token buckets, the interface every rate limiter backend implements."""
+
+    def reserve(self, key: str, rate: float, burst: float) -> float:
+        """Atomically take a token from the bucket stored under `key` and return how long to wait for it."""
+        raise NotImplementedError
+
+
+class MemoryRateLimiterBackend(RateLimiterBackend):
+    """Keeps token buckets in memory, shared by every thread (and event loop) of the process."""
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, rate: float, burst: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated_at = self._buckets.get(key, (burst, now))
+            tokens, wait = _reserve_token(tokens, updated_at, now, rate, burst)
+            self._buckets[key] = (tokens, now)
+
+        return wait
+
+
+class FileRateLimiterBackend(RateLimiterBackend):
+    """Keeps token buckets in a file guarded by an exclusive lock, shared by every process on the host.
+
+    Point every process at the same `path` (eg: a file in `/tmp`) to have them draw from the same budget.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @staticmethod
+    def _lock(state_file: IO[bytes]) -> None:
+        if fcntl is not None:
+            fcntl.flock(state_file.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover, Windows
+            state_file.seek(0)
+            msvcrt.locking(state_file.fileno(), msvcrt.LK_LOCK, 1)
+
+    @staticmethod
+    def _unlock(state_file: IO[bytes]) -> None:
+        if fcntl is not None:
+            fcntl.flock(state_file.fileno(), fcntl.LOCK_UN)
+        else:  # pragma: no cover, Windows
+            state_file.seek(0)
+            msvcrt.locking(state_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def reserve(self, key: str, rate: float, burst: float) -> float:
+        with open(self.path, "a+b") as state_file:
+            self._lock(state_file)
+            try:
+                state_file.seek(0)
+                content = state_file.read()
+                try:
+                    buckets = json.loads(content) if content else {}
+                except ValueError:
+                    buckets = {}  # A process died mid-write, start from full buckets
+
+                # Wall clock time as monotonic clocks aren't comparable across processes
+                now = time.time()
+                tokens, updated_at = buckets.get(key, (burst, now))
+                tokens, wait = _reserve_token(tokens, updated_at, now, rate, burst)
+                buckets[key] = (tokens, now)
+
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(json.dumps(buckets).encode("utf-8"))
+                state_file.flush()
+            finally:
+                self._unlock(state_file)
+
+        return wait
+
+
+class RateLimiter:
+    """Throttles requests with a token bucket per API key so a client (or a fleet of them) stays under a rate.
+
+    Each API key may make `rate` requests per second on average with bursts of up to `burst` requests.
+    `endpoint_rates` adds a separate budget to a class of endpoints, keyed by the first segment of their path
+    (eg: `{"trackers": 5}` limits every `/trackers...` call to 5 requests per second on top of the overall rate).
+
+    The default backend only throttles the current process, use a `FileRateLimiterBackend` to share the budget
+    between processes. A limiter can be shared by any number of clients.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        endpoint_rates: Optional[dict[str, float]] = None,
+        backend: Optional[RateLimiterBackend] = None,
+    ):
+        if rate <= 0:
+            raise InvalidParameterError(message=INVALID_RATE_ERROR.format(rate))
+
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self.endpoint_rates = endpoint_rates or {}
+        self.backend = backend or MemoryRateLimiterBackend()
+
+    @staticmethod
+    def endpoint_class(url: str) -> str:
+        """Return the class of an endpoint: the first segment of its path (eg: `shipments` for `/shipments/:id`)."""
+        return route_collection(url)
+
+    def reserve(self, api_key: str, url: str) -> float:
+        """Take a token for a request and return how long (in seconds) to wait before sending it."""
+        # Never persist the API key itself, only a digest of it
+        key = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+        wait = self.backend.reserve(key, self.rate, self.burst)
+
+        endpoint_class = self.endpoint_class(url)
+        endpoint_rate = self.endpoint_rates.get(endpoint_class)
+        if endpoint_rate:
+            endpoint_wait = self.backend.reserve(f"{key}:{endpoint_class}", endpoint_rate, max(1.0, endpoint_rate))
+            wait = max(wait, endpoint_wait)
+
+        return wait
+
+    def acquire(self, api_key: str, url: str) -> None:
+        """Block the current thread until a request is allowed."""
+        wait = self.reserve(api_key=api_key, url=url)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, api_key: str, url: str) -> None:
+        """Suspend the current task until a request is allowed."""
+        wait = self.reserve(api_key=api_key, url=url)
+        if wait > 0:
+            import asyncio  # Only needed by async clients, deferred to keep `import easypost` fast
+
+            await asyncio.sleep(wait)
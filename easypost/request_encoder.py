@@ -0,0 +1,68 @@
+import datetime
+from typing import (
+    Any,
+    Iterator,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlencode
+
+from easypost.easypost_object import EasyPostObject
+from easypost.json_codec import JsonCodec
+
+
+def _encode_json_value(value: Any) -> Any:
+    """Encode the values the JSON codecs don't support natively while they encode a request body."""
+    if isinstance(value, EasyPostObject):
+        # Only pass along the ID of an object so the API uses it as a reference
+        return {"id": value.id}
+    elif isinstance(value, bytes):
+        return value.decode("utf-8")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json_body(params: Any, codec: JsonCodec, sort_keys: bool = False) -> bytes:
+    """Encode request params straight to JSON bytes in a single pass of the codec, replacing the `EasyPostObject`s
+    they reference with their ID inline instead of copying the whole params tree beforehand.
+    """
+    return codec.dumps(params, default=_encode_json_value, sort_keys=sort_keys)
+
+
+def _query_value(value: Any) -> Any:
+    """Convert a scalar param to the value sent in a query string."""
+    if isinstance(value, datetime.datetime):
+        # Sent as `str(value)` (eg: `2024-01-01 12:00:00`), as the requests library always did for query params
+        return str(value)
+    return value
+
+
+def flatten_params(params: dict[str, Any], parent_key: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+    """Flatten params to the `(key, value)` pairs of a query string or form in a single pass.
+
+    Nested dicts use bracketed keys (eg: `{"card": {"number": 1}}` becomes `card[number]=1`), `EasyPostObject`s
+    are replaced by their ID (`shipment[id]=shp_123`), lists repeat their key as is (eg: `{"ids": [1, 2]}` becomes
+    `ids=1&ids=2`, dicts in lists are indexed, eg: `line_items[0][sku]=1`) and `None` values are dropped.
+    """
+    for key, value in params.items():
+        if value is None:
+            continue  # Don't add Nones to the query
+
+        full_key = f"{parent_key}[{key}]" if parent_key is not None else key
+        if isinstance(value, EasyPostObject):
+            yield f"{full_key}[id]", value.id
+        elif isinstance(value, dict):
+            yield from flatten_params(value, parent_key=full_key)
+        elif isinstance(value, (list, tuple)):
+            # Lists are sent as repeated keys, services expecting `key[]` name their param that way
+            for index, item in enumerate(value):
+                if isinstance(item, (dict, EasyPostObject)):
+                    yield from flatten_params({str(index): item}, parent_key=full_key)
+                elif item is not None:
+                    yield full_key, _query_value(item)
+        else:
+            yield full_key, _query_value(value)
+
+
+def encode_query(params: dict[str, Any]) -> str:
+    """Encode the params of a GET or DELETE request to a query string."""
+    return urlencode(list(flatten_params(params)))
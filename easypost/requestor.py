@@ -1,32 +1,24 @@
 import datetime
-import json
 import platform
 import time
 import uuid
 from enum import Enum
-from json import JSONDecodeError
 from typing import (
     Any,
     Optional,
     Tuple,
     Union,
 )
-from urllib.parse import urlencode
-
-import requests
 
 from easypost.constant import (
     API_VERSION,
     COMMUNICATION_ERROR,
-    INVALID_REQUEST_LIB_ERROR,
     INVALID_REQUEST_METHOD_ERROR,
     INVALID_REQUEST_PARAMETERS_ERROR,
     INVALID_RESPONSE_BODY_ERROR,
     SUPPORT_EMAIL,
-    TIMEOUT_ERROR,
     VERSION,
 )
-from easypost.easypost_object import EasyPostObject
 from easypost.errors import (
     BadRequestError,
     EasyPostError,
@@ -46,6 +38,14 @@ from easypost.errors import (
     UnauthorizedError,
     UnknownApiError,
 )
+from easypost.request_encoder import (
+    encode_json_body,
+    encode_query,
+)
+from easypost.transports import (
+    TransportRequest,
+    TransportResponse,
+)
 
 STATUS_CODE_TO_ERROR_MAPPING: dict[int, Any] = {
     400: BadRequestError,
@@ -62,6 +62,51 @@ STATUS_CODE_TO_ERROR_MAPPING: dict[int, Any] = {
     504: GatewayTimeoutError,
 }
 
+_user_agent: Optional[str] = None
+
+
+def user_agent() -> str:
+    """Return the User-Agent header of the client library, only built once per process."""
+    global _user_agent
+
+    if _user_agent is not None:
+        return _user_agent
+
+    # Fallback values for the user-agent header
+    details = {
+        "implementation": "NA",
+        "os_arch": "NA",
+        "os_version": "NA",
+        "os": "NA",
+        "python_version": "NA",
+    }
+
+    # Attempt to populate the user-agent header
+    for attr, func in (
+        ("implementation", platform.python_implementation),
+        ("os_details", platform.uname),
+        ("python_version", platform.python_version),
+    ):
+        try:
+            val = func()  # type: ignore
+            if attr == "os_details":
+                details["os"] = val[0]
+                details["os_version"] = val[2]
+                details["os_arch"] = val[4]
+            else:
+                details[attr] = val  # type: ignore
+        except Exception:  # nosec
+            # If we fail to get OS info, do nothing as we already set fallbacks for these values
+            pass
+
+    _user_agent = (
+        f"EasyPost/{API_VERSION} PythonClient/{VERSION} Python/{details['python_version']}"
+        f" OS/{details['os']} OSVersion/{details['os_version']} OSArch/{details['os_arch']}"
+        f" Implementation/{details['implementation']}"
+    )
+
+    return _user_agent
+
 
 class RequestMethod(Enum):
     GET = "get"
@@ -75,24 +120,6 @@ class Requestor:
     def __init__(self, client):
         self._client = client
 
-    @classmethod
-    def _objects_to_ids(cls, param: dict[str, Any]) -> dict[str, Any]:
-        """If providing an object as a parameter to another object,
-        only pass along the ID so the API will use the object reference correctly.
-        """
-        if isinstance(param, EasyPostObject):
-            return {"id": param.id}
-        elif isinstance(param, dict):
-            data = {}
-            for k, v in param.items():
-                if isinstance(v, list):
-                    data[k] = [cls._objects_to_ids(item) for item in v]  # type: ignore
-                else:
-                    data[k] = cls._objects_to_ids(v)  # type: ignore
-            return data
-        else:
-            return param
-
     @staticmethod
     def form_encode_params(
         data: dict[str, Any],
@@ -105,8 +132,8 @@ class Requestor:
 
         for key, value in data.items():
             if isinstance(value, dict):
-                keys.append(key)
-                result = Requestor.form_encode_params(data=value, parent_keys=keys, parent_dict=result)
+                # Each nested dict gets its own copy of the keys, so sibling dicts don't share a prefix
+                result = Requestor.form_encode_params(data=value, parent_keys=keys + [key], parent_dict=result)
             else:
                 dict_key = Requestor._build_dict_key(keys + [key])
                 result[dict_key] = value
@@ -131,21 +158,66 @@ class Requestor:
         url: str,
         params: Optional[dict[str, Any]] = None,
         beta: bool = False,
+        headers: Optional[dict[str, str]] = None,
     ) -> dict[str, Any]:
-        """Make a request to the EasyPost API."""
+        """Make a request to the EasyPost API.
+
+        When the client has single-flight enabled, concurrent identical GET requests share a single HTTP call.
+        When it has a response cache, cacheable GET requests are answered from it and writes invalidate it.
+        """
         if params is None:
             params = {}
 
-        http_body, http_status = self.request_raw(
-            method=method,
-            url=url,
-            params=params,
-            beta=beta,
-        )
+        response_cache = self._client._response_cache
+        cache_key = None
+        cache_generation = 0
+        if response_cache is not None and method == RequestMethod.GET and response_cache.ttl(url) > 0:
+            cache_key = response_cache.key(self._request_key(url=url, params=params, beta=beta, headers=headers))
+            # Read before sending, a write invalidating the cache while the request is in flight drops its response
+            cache_generation = response_cache.generation(self._client.api_key, url)
+            cached_body = response_cache.get(cache_key)
+            if cached_body is not None:
+                return self.interpret_response(http_body=cached_body, http_status=200)
+
+        def send() -> dict[str, Any]:
+            http_body, http_status = self.request_raw(
+                method=method,
+                url=url,
+                params=params,
+                beta=beta,
+                headers=headers,
+            )
+            if response_cache is not None and cache_key is not None and 200 <= http_status < 300:
+                response_cache.set(cache_key, self._client.api_key, url, http_body, cache_generation)
 
-        response = self.interpret_response(http_body=http_body, http_status=http_status)
+            return self.interpret_response(http_body=http_body, http_status=http_status)
 
-        return response
+        if method != RequestMethod.GET:
+            try:
+                return send()
+            finally:
+                if response_cache is not None:
+                    response_cache.invalidate(self._client.api_key, url)
+
+        single_flight = self._client._single_flight
+        if single_flight is not None:
+            key = self._request_key(url=url, params=params, beta=beta, headers=headers)
+            return single_flight.do(key, send)
+
+        return send()
+
+    def _request_key(
+        self,
+        url: str,
+        params: dict[str, Any],
+        beta: bool,
+        headers: Optional[dict[str, str]],
+    ) -> Tuple[Any, ...]:
+        """Identify a GET request by its API key, URL, params and headers to de-duplicate or cache it."""
+        encoded_params = encode_json_body(params, self._client._json_codec, sort_keys=True)
+        encoded_headers = tuple(sorted(headers.items())) if headers else None
+
+        return self._client.api_key, beta, url, encoded_params, encoded_headers
 
     def request_raw(
         self,
@@ -153,114 +225,197 @@ class Requestor:
         url: str,
         params: Optional[dict[str, Any]] = None,
         beta: bool = False,
-    ) -> Tuple[str, int]:
-        """Internal logic required to make a request to the EasyPost API."""
-        abs_url = f"{self._client.api_base}{url}"
+        headers: Optional[dict[str, str]] = None,
+    ) -> Tuple[bytes, int]:
+        """Internal logic required to make a request to the EasyPost API.
 
-        if beta:
-            abs_url = abs_url.replace(API_VERSION, "beta")
-
-        params = self._objects_to_ids(param=params or {})
-
-        # Fallback values for the user-agent header
-        user_agent = {
-            "client_version": VERSION,
-            "implementation": "NA",
-            "os_arch": "NA",
-            "os_version": "NA",
-            "os": "NA",
-            "python_version": "NA",
-        }
-
-        # Attempt to populate the user-agent header
-        for attr, func in (
-            ("implementation", platform.python_implementation),
-            ("os_details", platform.uname),
-            ("python_version", platform.python_version),
-        ):
-            try:
-                val = func()  # type: ignore
-                if attr == "os_details":
-                    user_agent["os"] = val[0]
-                    user_agent["os_version"] = val[2]
-                    user_agent["os_arch"] = val[4]
-                else:
-                    user_agent[attr] = val  # type: ignore
-            except Exception:  # nosec
-                # If we fail to get OS info, do nothing as we already set fallbacks for these values
-                pass
-
-        user_agent = (
-            f"EasyPost/{API_VERSION} PythonClient/{VERSION} Python/{user_agent['python_version']}"  # type: ignore
-            f" OS/{user_agent['os']} OSVersion/{user_agent['os_version']} OSArch/{user_agent['os_arch']}"
-            f" Implementation/{user_agent['implementation']}"
+        Failed attempts are retried according to the client's retry policy, every attempt is reported through
+        the request and response hooks.
+        """
+        abs_url, request_headers, params = self._prepare_request(
+            method=method, url=url, params=params, beta=beta, headers=headers
+        )
+        transport_request = self._build_transport_request(
+            method=method, abs_url=abs_url, headers=request_headers, params=params
         )
+        request_uuid = uuid.uuid4()
 
-        headers = {
-            "Authorization": "Bearer %s" % self._client.api_key,
-            "User-Agent": user_agent,
-        }
+        attempt = 1
+        while True:
+            self._check_circuit(url)
+            self._throttle(url)
+            request_timestamp = self._fire_request_hook(
+                method, abs_url, transport_request, params, request_uuid, attempt
+            )
 
-        request_uuid = uuid.uuid4()
+            try:
+                transport_response = self._send(transport_request)
+            except (HttpError, TimeoutError) as error:
+                self._record_circuit(url, error=error)
+                delay = self._retry_delay(attempt, transport_request, error=error)
+                if delay is None:
+                    raise
+            else:
+                self._record_circuit(url, status=transport_response.status)
+                self._fire_response_hook(method, abs_url, transport_response, request_timestamp, request_uuid, attempt)
+
+                delay = self._retry_delay(attempt, transport_request, response=transport_response)
+                if delay is None:
+                    return transport_response.body, transport_response.status
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _check_circuit(self, url: str) -> None:
+        """Raise a `CircuitOpenError` if the client's circuit breaker is open for the route of a request."""
+        circuit_breaker = self._client._circuit_breaker
+        if circuit_breaker is not None:
+            circuit_breaker.before_request(circuit_breaker.route(url))
+
+    def _record_circuit(self, url: str, status: Optional[int] = None, error: Optional[Exception] = None) -> None:
+        """Report the outcome of an attempt to the client's circuit breaker."""
+        circuit_breaker = self._client._circuit_breaker
+        if circuit_breaker is not None:
+            circuit_breaker.record(circuit_breaker.route(url), status=status, error=error)
+
+    def _throttle(self, url: str) -> None:
+        """Wait until the client's rate limiter allows another request."""
+        rate_limiter = self._client._rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire(api_key=self._client.api_key, url=url)
+
+    def _send(self, transport_request: TransportRequest) -> TransportResponse:
+        """Send a request through the client's transport, wrapping unexpected errors in an `HttpError`.
+
+        When the client has a concurrency limiter, the request waits for a free slot and reports its outcome.
+        """
+        concurrency_limiter = self._client._concurrency_limiter
+        started_at = concurrency_limiter.acquire() if concurrency_limiter is not None else 0.0
+        status = None
+
+        try:
+            transport_response = self._client._transport.send(transport_request)
+            status = transport_response.status
+            return transport_response
+        except EasyPostError:
+            raise
+        except Exception as e:
+            raise HttpError(COMMUNICATION_ERROR.format(SUPPORT_EMAIL, e))
+        finally:
+            if concurrency_limiter is not None:
+                concurrency_limiter.release(started_at=started_at, status=status)
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        transport_request: TransportRequest,
+        response: Optional[TransportResponse] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Return how long to wait before retrying an attempt, or `None` if it should not be retried."""
+        retry_policy = self._client._retry_policy
+        if retry_policy is None:
+            return None
+
+        return retry_policy.get_delay(attempt=attempt, request=transport_request, response=response, error=error)
+
+    def _fire_request_hook(
+        self,
+        method: RequestMethod,
+        abs_url: str,
+        transport_request: TransportRequest,
+        params: dict[str, Any],
+        request_uuid: uuid.UUID,
+        attempt: int,
+    ) -> datetime.datetime:
+        """Report an attempt to the request hook and return the time it was made at."""
         request_timestamp = datetime.datetime.now(datetime.timezone.utc)
         self._client._request_hook(
             method=method,
             path=abs_url,
-            headers=headers,
+            headers=transport_request.headers,
             request_body=params,
             request_timestamp=request_timestamp,
             request_uuid=request_uuid,
+            attempt=attempt,
         )
 
-        if self._client._request_lib == "urlfetch":
-            http_body, http_status, http_headers = self.urlfetch_request(
-                method=method, abs_url=abs_url, headers=headers, params=params
-            )
-        elif self._client._request_lib == "requests":
-            http_body, http_status, http_headers = self.requests_request(
-                method=method, abs_url=abs_url, headers=headers, params=params
-            )
-        else:
-            raise EasyPostError(INVALID_REQUEST_LIB_ERROR.format(self._client._request_lib, SUPPORT_EMAIL))
+        return request_timestamp
+
+    def _fire_response_hook(
+        self,
+        method: RequestMethod,
+        abs_url: str,
+        transport_response: TransportResponse,
+        request_timestamp: datetime.datetime,
+        request_uuid: uuid.UUID,
+        attempt: int,
+    ) -> None:
+        """Report the response of an attempt to the response hook."""
+        response_hook = self._client._response_hook
+        if not response_hook.has_handlers:
+            # Nothing to report to, skip decoding the body
+            return
 
         response_timestamp = datetime.datetime.now(datetime.timezone.utc)
-        self._client._response_hook(
-            http_status=http_status,
+        response_hook(
+            http_status=transport_response.status,
             method=method,
             path=abs_url,
-            headers=http_headers,
-            response_body=http_body,
+            headers=transport_response.headers,
+            response_body=self._body_text(transport_response.body),
+            response_body_raw=transport_response.body,
             request_timestamp=request_timestamp,
             response_timestamp=response_timestamp,
             request_uuid=request_uuid,
+            attempt=attempt,
         )
 
-        return http_body, http_status
+    def _prepare_request(
+        self,
+        method: RequestMethod,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        beta: bool = False,
+        headers: Optional[dict[str, str]] = None,
+    ) -> Tuple[str, dict[str, Any], dict[str, Any]]:
+        """Build the absolute URL, headers and params of a request.
 
-    def interpret_response(self, http_body: str, http_status: int) -> dict[str, Any]:
-        """Interpret the response body we receive from the API."""
-        if http_status == 204:
-            # HTTP 204 does not have any response body and we can just return here
-            return {}
+        This logic is shared between the synchronous and asynchronous requestors.
+        """
+        api_base = self._client.api_base
+        if beta:
+            api_base = api_base.replace(API_VERSION, "beta")
+        abs_url = f"{api_base}{url}"
 
-        try:
-            response = json.loads(http_body)
-        except JSONDecodeError:
-            raise JsonError(INVALID_RESPONSE_BODY_ERROR.format(http_body, http_status))
+        params = params or {}
 
-        if http_status < 200 or http_status >= 300:
-            self.handle_api_error(http_status=http_status, http_body=http_body, response=response)
+        # Each request gets its own copy of the shared base headers, request hooks and transports may modify it
+        request_headers = {**self._base_headers(), **(headers or {})}
 
-        return response
+        return abs_url, request_headers, params
 
-    def requests_request(
-        self,
+    def _base_headers(self) -> dict[str, Any]:
+        """Return the headers sent with every request of the client.
+
+        They are built once per API key and shared by every request of the client, so they must never be modified.
+        """
+        cached = self._client._base_headers
+        if cached is None or cached[0] != self._client.api_key:
+            headers = {
+                "Authorization": f"Bearer {self._client.api_key}",
+                "User-Agent": user_agent(),
+            }
+            cached = self._client._base_headers = (self._client.api_key, headers)
+
+        return cached[1]
+
+    @staticmethod
+    def _split_params(
         method: RequestMethod,
-        abs_url: str,
-        headers: dict[str, Any],
         params: dict[str, Any],
-    ) -> Tuple[str, int, dict[str, Any]]:
-        """Make a request by using the `request` library."""
+    ) -> Tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]:
+        """Split params into URL params (GET/DELETE) or a body (POST/PATCH/PUT) depending on the method."""
         if method in [RequestMethod.GET, RequestMethod.DELETE]:
             url_params = params
             body = None
@@ -273,67 +428,72 @@ class Requestor:
         if url_params and method not in [RequestMethod.GET, RequestMethod.DELETE]:
             raise EasyPostError(INVALID_REQUEST_PARAMETERS_ERROR)
 
-        try:
-            result = self._client._requests_session.request(
-                method=method.value,
-                url=abs_url,
-                params=url_params,
-                headers=headers,
-                json=body,
-                timeout=self._client.timeout,
-                verify=True,
-            )
-            http_body = result.text
-            http_status = result.status_code
-            http_headers = result.headers
-        except requests.exceptions.Timeout:
-            raise TimeoutError(TIMEOUT_ERROR)
-        except Exception as e:
-            raise HttpError(COMMUNICATION_ERROR.format(SUPPORT_EMAIL, e))
-
-        return http_body, http_status, http_headers
+        return url_params, body
 
-    def urlfetch_request(
+    def _build_transport_request(
         self,
         method: RequestMethod,
         abs_url: str,
         headers: dict[str, Any],
         params: dict[str, Any],
-    ) -> Tuple[str, int, dict[str, Any]]:
-        """Make a request by using the `urlfetch` library."""
-        fetch_args = {
-            "method": method.value,
-            "headers": headers,
-            "validate_certificate": False,
-            "deadline": self._client.timeout,
-        }
+    ) -> TransportRequest:
+        """Encode params into the query string (GET/DELETE) or a JSON body (POST/PATCH/PUT) for a transport."""
+        url_params, body = self._split_params(method=method, params=params)
 
-        if method in [RequestMethod.GET, RequestMethod.DELETE]:
-            # GET/DELETE requests use query params
-            fetch_args["url"] = self.add_params_to_url(url=abs_url, params=params, method=method)
-        elif method in [RequestMethod.POST, RequestMethod.PUT]:
-            fetch_args["url"] = abs_url
-            # POST/PUT requests use body params
-            fetch_args["payload"] = json.dumps(params, default=self._utf8)
-        else:
-            raise EasyPostError(INVALID_REQUEST_METHOD_ERROR.format(method, SUPPORT_EMAIL))
+        if url_params:
+            abs_url = self.add_params_to_url(url=abs_url, params=url_params, method=method)
+
+        encoded_body = None
+        if body is not None:
+            headers = {**headers, "Content-Type": "application/json"}
+            encoded_body = encode_json_body(body, self._client._json_codec)
+
+        return TransportRequest(
+            method=method.value.upper(),
+            url=abs_url,
+            headers=headers,
+            body=encoded_body,
+            timeout=self._client.timeout,
+        )
+
+    @staticmethod
+    def _body_text(http_body: Union[str, bytes]) -> str:
+        """Decode a raw body for an error message, the EasyPost API always responds with UTF-8."""
+        if isinstance(http_body, bytes):
+            return http_body.decode(encoding="utf-8", errors="replace")
+        return http_body
+
+    def interpret_response(self, http_body: Union[str, bytes], http_status: int) -> dict[str, Any]:
+        """Interpret the response body we receive from the API.
+
+        The body is parsed straight from the bytes returned by the transport, it is only decoded to text
+        when building an error.
+        """
+        if http_status == 204:
+            # HTTP 204 does not have any response body and we can just return here
+            return {}
 
         try:
-            from google.appengine.api import urlfetch  # type: ignore
+            response = self._client._json_codec.loads(http_body)
+        except ValueError:  # Raised for invalid JSON or UTF-8 by every codec
+            raise JsonError(
+                message=INVALID_RESPONSE_BODY_ERROR.format(http_status, self._body_text(http_body)),
+                http_status=http_status,
+                http_body=http_body,
+            )
 
-            result = urlfetch.fetch(**fetch_args)  # type: ignore
-        except Exception as e:
-            raise HttpError(COMMUNICATION_ERROR.format(SUPPORT_EMAIL, e))
+        if http_status < 200 or http_status >= 300:
+            self.handle_api_error(http_status=http_status, http_body=http_body, response=response)
 
-        return result.content, result.status_code, result.headers
+        return response
 
-    def handle_api_error(self, http_status: int, http_body: str, response: dict[str, Any]) -> None:
+    def handle_api_error(self, http_status: int, http_body: Union[str, bytes], response: dict[str, Any]) -> None:
         """Handles API errors returned from the EasyPost API."""
         try:
             error = response["error"]
         except (KeyError, TypeError):
             raise JsonError(
-                message=INVALID_RESPONSE_BODY_ERROR.format(http_status, http_body),
+                message=INVALID_RESPONSE_BODY_ERROR.format(http_status, self._body_text(http_body)),
                 http_status=http_status,
                 http_body=http_body,
             )
@@ -349,27 +509,12 @@ class Requestor:
             http_body=http_body,
         )
 
-    def _utf8(self, value: Union[str, bytes]) -> str:
-        # Python3's str(bytestring) returns "b'bytestring'" so we use .decode instead
-        if isinstance(value, bytes):
-            return value.decode(encoding="utf-8")
-        return value
-
     def encode_url_params(self, params: dict[str, Any], method: RequestMethod) -> Union[str, None]:
         """Encode params for a URL."""
         if method not in [RequestMethod.GET, RequestMethod.DELETE]:
             raise EasyPostError(INVALID_REQUEST_PARAMETERS_ERROR)
 
-        converted_params = []
-
-        for key, value in sorted(params.items()):
-            if value is None:
-                continue  # Don't add Nones to the query
-            elif isinstance(value, datetime.datetime):
-                value = int(time.mktime(value.timetuple()))  # to UTC timestamp
-            converted_params.append((key, value))
-
-        return urlencode(query=converted_params)
+        return encode_query(params)
 
     def add_params_to_url(self, url: str, params: dict[str, Any], method: RequestMethod) -> str:
         """Add params to the URL."""
@@ -382,3 +527,134 @@ class Requestor:
             return "%s?%s" % (url, encoded_params)
 
         return url
+
+
+class AsyncRequestor(Requestor):
+    """Makes requests to the EasyPost API on an asyncio event loop.
+
+    Request building, error mapping and response interpretation are shared with the synchronous `Requestor`,
+    only the HTTP call itself is awaited.
+    """
+
+    async def request(  # type: ignore[override]
+        self,
+        method: RequestMethod,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        beta: bool = False,
+        headers: Optional[dict[str, str]] = None,
+    ) -> dict[str, Any]:
+        """Make a request to the EasyPost API.
+
+        When the client has single-flight enabled, concurrent identical GET requests share a single HTTP call.
+        When it has a response cache, cacheable GET requests are answered from it and writes invalidate it.
+        """
+        if params is None:
+            params = {}
+
+        response_cache = self._client._response_cache
+        cache_key = None
+        cache_generation = 0
+        if response_cache is not None and method == RequestMethod.GET and response_cache.ttl(url) > 0:
+            cache_key = response_cache.key(self._request_key(url=url, params=params, beta=beta, headers=headers))
+            # Read before sending, a write invalidating the cache while the request is in flight drops its response
+            cache_generation = response_cache.generation(self._client.api_key, url)
+            cached_body = response_cache.get(cache_key)
+            if cached_body is not None:
+                return self.interpret_response(http_body=cached_body, http_status=200)
+
+        async def send() -> dict[str, Any]:
+            http_body, http_status = await self.request_raw(
+                method=method,
+                url=url,
+                params=params,
+                beta=beta,
+                headers=headers,
+            )
+            if response_cache is not None and cache_key is not None and 200 <= http_status < 300:
+                response_cache.set(cache_key, self._client.api_key, url, http_body, cache_generation)
+
+            return self.interpret_response(http_body=http_body, http_status=http_status)
+
+        if method != RequestMethod.GET:
+            try:
+                return await send()
+            finally:
+                if response_cache is not None:
+                    response_cache.invalidate(self._client.api_key, url)
+
+        single_flight = self._client._single_flight
+        if single_flight is not None:
+            key = self._request_key(url=url, params=params, beta=beta, headers=headers)
+            return await single_flight.do_async(key, send)
+
+        return await send()
+
+    async def request_raw(  # type: ignore[override]
+        self,
+        method: RequestMethod,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        beta: bool = False,
+        headers: Optional[dict[str, str]] = None,
+    ) -> Tuple[bytes, int]:
+        """Internal logic required to make a request to the EasyPost API."""
+        abs_url, request_headers, params = self._prepare_request(
+            method=method, url=url, params=params, beta=beta, headers=headers
+        )
+        transport_request = self._build_transport_request(
+            method=method, abs_url=abs_url, headers=request_headers, params=params
+        )
+        request_uuid = uuid.uuid4()
+
+        attempt = 1
+        while True:
+            self._check_circuit(url)
+            await self._throttle(url)
+            request_timestamp = self._fire_request_hook(
+                method, abs_url, transport_request, params, request_uuid, attempt
+            )
+
+            try:
+                transport_response = await self._send(transport_request)
+            except (HttpError, TimeoutError) as error:
+                self._record_circuit(url, error=error)
+                delay = self._retry_delay(attempt, transport_request, error=error)
+                if delay is None:
+                    raise
+            else:
+                self._record_circuit(url, status=transport_response.status)
+                self._fire_response_hook(method, abs_url, transport_response, request_timestamp, request_uuid, attempt)
+
+                delay = self._retry_delay(attempt, transport_request, response=transport_response)
+                if delay is None:
+                    return transport_response.body, transport_response.status
+
+            import asyncio  # Only needed by async clients, deferred to keep `import easypost` fast
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _throttle(self, url: str) -> None:  # type: ignore[override]
+        """Wait until the client's rate limiter allows another request."""
+        rate_limiter = self._client._rate_limiter
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async(api_key=self._client.api_key, url=url)
+
+    async def _send(self, transport_request: TransportRequest) -> TransportResponse:  # type: ignore[override]
+        """Send a request through the client's transport, wrapping unexpected errors in an `HttpError`."""
+        concurrency_limiter = self._client._concurrency_limiter
+        started_at = await concurrency_limiter.acquire_async() if concurrency_limiter is not None else 0.0
+        status = None
+
+        try:
+            transport_response = await self._client._transport.send(transport_request)
+            status = transport_response.status
+            return transport_response
+        except EasyPostError:
+            raise
+        except Exception as e:
+            raise HttpError(COMMUNICATION_ERROR.format(SUPPORT_EMAIL, e))
+        finally:
+            if concurrency_limiter is not None:
+                concurrency_limiter.release(started_at=started_at, status=status)
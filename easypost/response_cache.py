@@ -0,0 +1,256 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    NamedTuple,
+    Optional,
+)
+
+from easypost.routes import (
+    normalize_route,
+    route_collection,
+)
+
+# How long (in seconds) responses of routes that rarely change are cached by default
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "/metadata/carriers": 3600,
+    "/carrier_types": 3600,
+    "/carrier_accounts": 300,
+    "/carrier_accounts/:id": 300,
+    "/rates/:id": 300,
+    "/users": 60,
+    "/users/:id": 60,
+    "/payment_methods": 60,
+}
+
+# Writes to a collection also change the responses of these collections
+RELATED_COLLECTIONS: dict[str, tuple[str, ...]] = {
+    "bank_accounts": ("payment_methods",),
+    "credit_cards": ("payment_methods",),
+    "referral_customers": ("payment_methods", "users"),
+    "api_keys": ("users",),
+}
+
+
+class _Entry(NamedTuple):
+    body: bytes
+    expires_at: float
+    tags: tuple[str, ...]
+
+
+class CacheBackend:
+    """Stores cached response bodies, the interface every response cache backend implements."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the body cached under `key` if it hasn't expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, body: bytes, ttl: float, tags: tuple[str, ...]) -> None:
+        """Cache a body under `key` for `ttl` seconds, tagged so it can be invalidated along with its resource."""
+        raise NotImplementedError
+
+    def invalidate(self, tag: str) -> None:
+        """Remove every entry carrying `tag`."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Caches responses in the memory of the process, evicting the least recently used entries once either
+    `max_entries` or `max_bytes` (the total size of the cached bodies) is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return entry.body
+
+    def set(self, key: str, body: bytes, ttl: float, tags: tuple[str, ...]) -> None:
+        if len(body) > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _Entry(body, time.monotonic() + ttl, tags)
+            self._size += len(body)
+
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tag: str) -> None:
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if tag in entry.tags]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.body)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Caches responses in a SQLite database on disk, shared by every process using the same `path` and evicting
+    the least recently used entries beyond `max_entries`.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10_000):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, expires_at REAL NOT NULL, tags TEXT NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection of the current thread, SQLite connections can't be shared between threads."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        connection = self._connect()
+        row = connection.execute("SELECT body, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if row[1] <= now:
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+
+        connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return bytes(row[0])
+
+    def set(self, key: str, body: bytes, ttl: float, tags: tuple[str, ...]) -> None:
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, expires_at, tags, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                # Tags are stored wrapped in separators so a LIKE can match one exactly
+                (key, body, now + ttl, f"|{'|'.join(tags)}|", now),
+            )
+            connection.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def invalidate(self, tag: str) -> None:
+        self._connect().execute("DELETE FROM responses WHERE tags LIKE ?", (f"%|{tag}|%",))
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM responses")
+
+
+class SharedMemoryCacheBackend(SQLiteCacheBackend):
+    """Caches responses in a SQLite database kept in shared memory (`/dev/shm`) so a pool of processes on the
+    same host shares one warm cache without touching the disk. Falls back to the temporary directory on systems
+    without `/dev/shm`.
+    """
+
+    def __init__(self, name: str = "easypost-response-cache", max_entries: int = 10_000):
+        directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()  # nosec
+        super().__init__(path=os.path.join(directory, f"{name}.sqlite3"), max_entries=max_entries)
+
+
+class ResponseCache:
+    """Caches the responses of GET requests to routes that rarely change.
+
+    `ttls` maps routes (paths with IDs replaced by `:id`, eg: `/carrier_accounts/:id`) to how long their responses
+    are cached in seconds, defaulting to `DEFAULT_CACHE_TTLS`. Routes without a TTL aren't cached. Any write
+    (POST, PATCH, PUT or DELETE) invalidates the cached responses of the collection it targets (eg: updating a
+    carrier account invalidates `/carrier_accounts` and `/carrier_accounts/:id`) for the API key that made it.
+
+    Responses are cached in memory by default, use a `SQLiteCacheBackend` or `SharedMemoryCacheBackend` to share
+    them between processes.
+
+    Each invalidation bumps the generation of the collections it affects, a response to a GET request sent before
+    the last invalidation of its collection in this process isn't cached so a write doesn't get undone by a read
+    that was in flight.
+    """
+
+    def __init__(self, ttls: Optional[dict[str, float]] = None, backend: Optional[CacheBackend] = None):
+        self.ttls = DEFAULT_CACHE_TTLS if ttls is None else ttls
+        self.backend = backend or MemoryCacheBackend()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def ttl(self, url: str) -> float:
+        """Return how long responses of a URL are cached for, 0 when they aren't."""
+        return self.ttls.get(normalize_route(url), 0)
+
+    @staticmethod
+    def _tag(api_key: str, collection: str) -> str:
+        return f"{hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]}:{collection}"
+
+    @staticmethod
+    def key(request_key: tuple[Any, ...]) -> str:
+        """Return the cache key of a request, a digest so API keys are never stored."""
+        return hashlib.sha256(repr(request_key).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body of a request."""
+        return self.backend.get(key)
+
+    def generation(self, api_key: str, url: str) -> int:
+        """Return how many times the responses of `url` were invalidated, to read before sending a request."""
+        return self._generations.get(self._tag(api_key, route_collection(url)), 0)
+
+    def set(self, key: str, api_key: str, url: str, body: bytes, generation: Optional[int] = None) -> None:
+        """Cache the body of a successful response to a GET request if its route is cacheable.
+
+        With the `generation` of `url` read before the request was sent, the body is dropped if the responses of
+        `url` were invalidated since.
+        """
+        ttl = self.ttl(url)
+        if ttl > 0:
+            tag = self._tag(api_key, route_collection(url))
+            with self._lock:
+                if generation is None or self._generations.get(tag, 0) == generation:
+                    self.backend.set(key, body, ttl, (tag,))
+
+    def invalidate(self, api_key: str, url: str) -> None:
+        """Invalidate the responses a write to `url` may have changed."""
+        collection = route_collection(url)
+        with self._lock:
+            for affected_collection in (collection, *RELATED_COLLECTIONS.get(collection, ())):
+                tag = self._tag(api_key, affected_collection)
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+                self.backend.invalidate(tag)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self.backend.clear()
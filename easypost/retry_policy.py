@@ -0,0 +1,106 @@
+import datetime
+import random
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Mapping,
+    Optional,
+)
+
+from easypost.constant import INVALID_MAX_ATTEMPTS_ERROR
+from easypost.errors import (
+    HttpError,
+    InvalidParameterError,
+    TimeoutError,
+)
+from easypost.transports import (
+    TransportRequest,
+    TransportResponse,
+)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+RETRYABLE_STATUSES = (429, 502, 503, 504)
+
+
+class RetryPolicy:
+    """Configures how a client retries requests that failed for a transient reason.
+
+    Requests are retried when they time out, fail to reach the API or come back with one of `retry_statuses`.
+    GET and DELETE requests are always safe to retry, POST, PATCH and PUT requests are only retried when they
+    carry an `Idempotency-Key` header (pass one via `headers` on `make_api_call`) so a request is never applied
+    twice.
+
+    Attempts are spaced with full-jitter exponential backoff: a random delay between 0 and
+    `min(max_delay, base_delay * 2 ** (attempt - 1))` seconds, unless the API sends a `Retry-After` header,
+    which is honoured up to `max_delay`.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_statuses: tuple[int, ...] = RETRYABLE_STATUSES,
+        respect_retry_after: bool = True,
+    ):
+        if max_attempts < 1:
+            raise InvalidParameterError(message=INVALID_MAX_ATTEMPTS_ERROR.format(max_attempts))
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+        self.respect_retry_after = respect_retry_after
+
+    def is_idempotent(self, request: TransportRequest) -> bool:
+        """Return whether a request can be sent more than once without being applied more than once."""
+        if request.method in ("GET", "DELETE"):
+            return True
+
+        return any(header.lower() == IDEMPOTENCY_KEY_HEADER.lower() for header in request.headers)
+
+    def backoff(self, attempt: int) -> float:
+        """Return a full-jitter exponential delay (in seconds) to wait after a failed attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))  # nosec
+
+    def retry_after(self, headers: Mapping[str, Any]) -> Optional[float]:
+        """Parse the delay (in seconds) requested by a `Retry-After` header, either in seconds or an HTTP date."""
+        value = headers.get("Retry-After") or headers.get("retry-after")
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+    def get_delay(
+        self,
+        attempt: int,
+        request: TransportRequest,
+        response: Optional[TransportResponse] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Return how long to wait before retrying a failed attempt, or `None` if it should not be retried."""
+        if attempt >= self.max_attempts or not self.is_idempotent(request):
+            return None
+
+        if response is not None:
+            if response.status not in self.retry_statuses:
+                return None
+
+            if self.respect_retry_after:
+                retry_after = self.retry_after(response.headers)
+                if retry_after is not None:
+                    return min(self.max_delay, retry_after)
+        elif not isinstance(error, (HttpError, TimeoutError)):
+            return None
+
+        return self.backoff(attempt)
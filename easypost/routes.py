@@ -0,0 +1,15 @@
+import re
+
+# IDs are a lowercase prefix and an alphanumeric suffix containing a digit (eg: `shp_123abc`) or a number
+_ID_SEGMENT_PATTERN = re.compile(r"^(?:[a-z]+_[A-Za-z0-9]*[0-9][A-Za-z0-9]*|[0-9]+)$")
+
+
+def normalize_route(url: str) -> str:
+    """Normalize the path of a request to its route by replacing IDs with `:id` (eg: `/shipments/:id/buy`)."""
+    path = url.split("?", 1)[0]
+    return "/".join(":id" if _ID_SEGMENT_PATTERN.match(segment) else segment for segment in path.split("/"))
+
+
+def route_collection(url: str) -> str:
+    """Return the collection a request belongs to: the first segment of its path (eg: `shipments`)."""
+    return url.lstrip("/").split("/", 1)[0].split("?", 1)[0]
@@ -1,32 +1,265 @@
 # flake8: noqa
-from easypost.services.address_service import AddressService
-from easypost.services.api_key_service import ApiKeyService
-from easypost.services.batch_service import BatchService
-from easypost.services.beta_rate_service import BetaRateService
-from easypost.services.beta_referral_customer_service import BetaReferralCustomerService
-from easypost.services.billing_service import BillingService
-from easypost.services.carrier_account_service import CarrierAccountService
-from easypost.services.carrier_metadata_service import CarrierMetadataService
-from easypost.services.claim_service import ClaimService
-from easypost.services.customer_portal_service import CustomerPortalService
-from easypost.services.customs_info_service import CustomsInfoService
-from easypost.services.customs_item_service import CustomsItemService
-from easypost.services.embeddable_service import EmbeddableService
-from easypost.services.end_shipper_service import EndShipperService
-from easypost.services.event_service import EventService
-from easypost.services.fedex_registration_service import FedExRegistrationService
-from easypost.services.insurance_service import InsuranceService
-from easypost.services.luma_service import LumaService
-from easypost.services.order_service import OrderService
-from easypost.services.parcel_service import ParcelService
-from easypost.services.pickup_service import PickupService
-from easypost.services.rate_service import RateService
-from easypost.services.referral_customer_service import ReferralCustomerService
-from easypost.services.refund_service import RefundService
-from easypost.services.report_service import ReportService
-from easypost.services.scan_form_service import ScanFormService
-from easypost.services.shipment_service import ShipmentService
-from easypost.services.smartrate_service import SmartRateService
-from easypost.services.tracker_service import TrackerService
-from easypost.services.user_service import UserService
-from easypost.services.webhook_service import WebhookService
+from typing import TYPE_CHECKING
+
+from easypost.lazy_loader import lazy_loader
+
+
+if TYPE_CHECKING:
+    from easypost.services.address_service import (
+        AddressService,
+        AsyncAddressService,
+    )
+    from easypost.services.api_key_service import (
+        ApiKeyService,
+        AsyncApiKeyService,
+    )
+    from easypost.services.batch_service import (
+        AsyncBatchService,
+        BatchService,
+    )
+    from easypost.services.beta_rate_service import (
+        AsyncBetaRateService,
+        BetaRateService,
+    )
+    from easypost.services.beta_referral_customer_service import (
+        AsyncBetaReferralCustomerService,
+        BetaReferralCustomerService,
+    )
+    from easypost.services.billing_service import (
+        AsyncBillingService,
+        BillingService,
+    )
+    from easypost.services.carrier_account_service import (
+        AsyncCarrierAccountService,
+        CarrierAccountService,
+    )
+    from easypost.services.carrier_metadata_service import (
+        AsyncCarrierMetadataService,
+        CarrierMetadataService,
+    )
+    from easypost.services.claim_service import (
+        AsyncClaimService,
+        ClaimService,
+    )
+    from easypost.services.customer_portal_service import (
+        AsyncCustomerPortalService,
+        CustomerPortalService,
+    )
+    from easypost.services.customs_info_service import (
+        AsyncCustomsInfoService,
+        CustomsInfoService,
+    )
+    from easypost.services.customs_item_service import (
+        AsyncCustomsItemService,
+        CustomsItemService,
+    )
+    from easypost.services.embeddable_service import (
+        AsyncEmbeddableService,
+        EmbeddableService,
+    )
+    from easypost.services.end_shipper_service import (
+        AsyncEndShipperService,
+        EndShipperService,
+    )
+    from easypost.services.event_service import (
+        AsyncEventService,
+        EventService,
+    )
+    from easypost.services.fedex_registration_service import (
+        AsyncFedExRegistrationService,
+        FedExRegistrationService,
+    )
+    from easypost.services.insurance_service import (
+        AsyncInsuranceService,
+        InsuranceService,
+    )
+    from easypost.services.luma_service import (
+        AsyncLumaService,
+        LumaService,
+    )
+    from easypost.services.order_service import (
+        AsyncOrderService,
+        OrderService,
+    )
+    from easypost.services.parcel_service import (
+        AsyncParcelService,
+        ParcelService,
+    )
+    from easypost.services.pickup_service import (
+        AsyncPickupService,
+        PickupService,
+    )
+    from easypost.services.rate_service import (
+        AsyncRateService,
+        RateService,
+    )
+    from easypost.services.referral_customer_service import (
+        AsyncReferralCustomerService,
+        ReferralCustomerService,
+    )
+    from easypost.services.refund_service import (
+        AsyncRefundService,
+        RefundService,
+    )
+    from easypost.services.report_service import (
+        AsyncReportService,
+        ReportService,
+    )
+    from easypost.services.scan_form_service import (
+        AsyncScanFormService,
+        ScanFormService,
+    )
+    from easypost.services.shipment_service import (
+        AsyncShipmentService,
+        ShipmentService,
+    )
+    from easypost.services.smartrate_service import (
+        AsyncSmartRateService,
+        SmartRateService,
+    )
+    from easypost.services.tracker_service import (
+        AsyncTrackerService,
+        TrackerService,
+    )
+    from easypost.services.user_service import (
+        AsyncUserService,
+        UserService,
+    )
+    from easypost.services.webhook_service import (
+        AsyncWebhookService,
+        WebhookService,
+    )
+
+
+__all__ = [
+    "AddressService",
+    "AsyncAddressService",
+    "ApiKeyService",
+    "AsyncApiKeyService",
+    "AsyncBatchService",
+    "BatchService",
+    "AsyncBetaRateService",
+    "BetaRateService",
+    "AsyncBetaReferralCustomerService",
+    "BetaReferralCustomerService",
+    "AsyncBillingService",
+    "BillingService",
+    "AsyncCarrierAccountService",
+    "CarrierAccountService",
+    "AsyncCarrierMetadataService",
+    "CarrierMetadataService",
+    "AsyncClaimService",
+    "ClaimService",
+    "AsyncCustomerPortalService",
+    "CustomerPortalService",
+    "AsyncCustomsInfoService",
+    "CustomsInfoService",
+    "AsyncCustomsItemService",
+    "CustomsItemService",
+    "AsyncEmbeddableService",
+    "EmbeddableService",
+    "AsyncEndShipperService",
+    "EndShipperService",
+    "AsyncEventService",
+    "EventService",
+    "AsyncFedExRegistrationService",
+    "FedExRegistrationService",
+    "AsyncInsuranceService",
+    "InsuranceService",
+    "AsyncLumaService",
+    "LumaService",
+    "AsyncOrderService",
+    "OrderService",
+    "AsyncParcelService",
+    "ParcelService",
+    "AsyncPickupService",
+    "PickupService",
+    "AsyncRateService",
+    "RateService",
+    "AsyncReferralCustomerService",
+    "ReferralCustomerService",
+    "AsyncRefundService",
+    "RefundService",
+    "AsyncReportService",
+    "ReportService",
+    "AsyncScanFormService",
+    "ScanFormService",
+    "AsyncShipmentService",
+    "ShipmentService",
+    "AsyncSmartRateService",
+    "SmartRateService",
+    "AsyncTrackerService",
+    "TrackerService",
+    "AsyncUserService",
+    "UserService",
+    "AsyncWebhookService",
+    "WebhookService",
+]
+
+__getattr__, __dir__ = lazy_loader(
+    __name__,
+    {
+        "AddressService": "easypost.services.address_service",
+        "AsyncAddressService": "easypost.services.address_service",
+        "ApiKeyService": "easypost.services.api_key_service",
+        "AsyncApiKeyService": "easypost.services.api_key_service",
+        "AsyncBatchService": "easypost.services.batch_service",
+        "BatchService": "easypost.services.batch_service",
+        "AsyncBetaRateService": "easypost.services.beta_rate_service",
+        "BetaRateService": "easypost.services.beta_rate_service",
+        "AsyncBetaReferralCustomerService": "easypost.services.beta_referral_customer_service",
+        "BetaReferralCustomerService": "easypost.services.beta_referral_customer_service",
+        "AsyncBillingService": "easypost.services.billing_service",
+        "BillingService": "easypost.services.billing_service",
+        "AsyncCarrierAccountService": "easypost.services.carrier_account_service",
+        "CarrierAccountService": "easypost.services.carrier_account_service",
+        "AsyncCarrierMetadataService": "easypost.services.carrier_metadata_service",
+        "CarrierMetadataService": "easypost.services.carrier_metadata_service",
+        "AsyncClaimService": "easypost.services.claim_service",
+        "ClaimService": "easypost.services.claim_service",
+        "AsyncCustomerPortalService": "easypost.services.customer_portal_service",
+        "CustomerPortalService": "easypost.services.customer_portal_service",
+        "AsyncCustomsInfoService": "easypost.services.customs_info_service",
+        "CustomsInfoService": "easypost.services.customs_info_service",
+        "AsyncCustomsItemService": "easypost.services.customs_item_service",
+        "CustomsItemService": "easypost.services.customs_item_service",
+        "AsyncEmbeddableService": "easypost.services.embeddable_service",
+        "EmbeddableService": "easypost.services.embeddable_service",
+        "AsyncEndShipperService": "easypost.services.end_shipper_service",
+        "EndShipperService": "easypost.services.end_shipper_service",
+        "AsyncEventService": "easypost.services.event_service",
+        "EventService": "easypost.services.event_service",
+        "AsyncFedExRegistrationService": "easypost.services.fedex_registration_service",
+        "FedExRegistrationService": "easypost.services.fedex_registration_service",
+        "AsyncInsuranceService": "easypost.services.insurance_service",
+        "InsuranceService": "easypost.services.insurance_service",
+        "AsyncLumaService": "easypost.services.luma_service",
+        "LumaService": "easypost.services.luma_service",
+        "AsyncOrderService": "easypost.services.order_service",
+        "OrderService": "easypost.services.order_service",
+        "AsyncParcelService": "easypost.services.parcel_service",
+        "ParcelService": "easypost.services.parcel_service",
+        "AsyncPickupService": "easypost.services.pickup_service",
+        "PickupService": "easypost.services.pickup_service",
+        "AsyncRateService": "easypost.services.rate_service",
+        "RateService": "easypost.services.rate_service",
+        "AsyncReferralCustomerService": "easypost.services.referral_customer_service",
+        "ReferralCustomerService": "easypost.services.referral_customer_service",
+        "AsyncRefundService": "easypost.services.refund_service",
+        "RefundService": "easypost.services.refund_service",
+        "AsyncReportService": "easypost.services.report_service",
+        "ReportService": "easypost.services.report_service",
+        "AsyncScanFormService": "easypost.services.scan_form_service",
+        "ScanFormService": "easypost.services.scan_form_service",
+        "AsyncShipmentService": "easypost.services.shipment_service",
+        "ShipmentService": "easypost.services.shipment_service",
+        "AsyncSmartRateService": "easypost.services.smartrate_service",
+        "SmartRateService": "easypost.services.smartrate_service",
+        "AsyncTrackerService": "easypost.services.tracker_service",
+        "TrackerService": "easypost.services.tracker_service",
+        "AsyncUserService": "easypost.services.user_service",
+        "UserService": "easypost.services.user_service",
+        "AsyncWebhookService": "easypost.services.webhook_service",
+        "WebhookService": "easypost.services.webhook_service",
+    },
+)
@@ -1,15 +1,20 @@
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Address
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class AddressService(BaseService):
@@ -37,7 +42,7 @@ class AddressService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def all(self, **params) -> dict[str, Any]:
         """Retrieve a list of Addresses."""
@@ -61,7 +66,7 @@ class AddressService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response["address"])
+        return self._convert_response(response["address"])
 
     def verify(self, id) -> Address:
         """Verify an already created Address."""
@@ -69,7 +74,7 @@ class AddressService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url)
 
-        return convert_to_easypost_object(response=response["address"])
+        return self._convert_response(response["address"])
 
     def get_next_page(
         self,
@@ -81,7 +86,7 @@ class AddressService(BaseService):
         self._check_has_next_page(collection=addresses)
 
         params = {
-            "before_id": addresses["addresses"][-1].id,
+            "before_id": addresses["addresses"][-1]["id"],
             "page_size": page_size,
         }
 
@@ -89,3 +94,96 @@ class AddressService(BaseService):
             params.update(optional_params)
 
         return self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[Address]:
+        """Iterate over all Addresses page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "addresses", max_items, params, prefetch)
+
+
+class AsyncAddressService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Address.__name__
+
+    async def create(
+        self,
+        verify: Optional[bool] = None,
+        verify_strict: Optional[bool] = None,
+        verify_carrier: Optional[str] = None,
+        **params,
+    ) -> Address:
+        """Create an Address."""
+        url = self._class_url(self._model_class)
+        wrapped_params = {self._snakecase_name(self._model_class): params}  # type: dict[str, Any]
+
+        if verify:
+            wrapped_params["verify"] = verify
+        if verify_strict:
+            wrapped_params["verify_strict"] = verify_strict
+        if verify_carrier:
+            wrapped_params["verify_carrier"] = verify_carrier
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Addresses."""
+        filters = {
+            "key": "addresses",
+        }
+
+        return await self._all_resources(self._model_class, filters, **params)
+
+    async def retrieve(self, id) -> Address:
+        """Retrieve an Address."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def create_and_verify(self, verify_carrier: Optional[str] = None, **params) -> Address:
+        """Create and verify an Address in one call."""
+        url = f"{self._class_url('address')}/create_and_verify"
+        wrapped_params = {self._snakecase_name(self._model_class): params}  # type: dict[str, Any]
+
+        if verify_carrier:
+            wrapped_params["verify_carrier"] = verify_carrier
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response["address"])
+
+    async def verify(self, id) -> Address:
+        """Verify an already created Address."""
+        url = f"{self._instance_url('address', id)}/verify"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url)
+
+        return self._convert_response(response["address"])
+
+    async def get_next_page(
+        self,
+        addresses: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve the next page of the list Addresses response."""
+        self._check_has_next_page(collection=addresses)
+
+        params = {
+            "before_id": addresses["addresses"][-1]["id"],
+            "page_size": page_size,
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[Address]:
+        """Iterate over all Addresses page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "addresses", max_items, params, prefetch)
@@ -1,11 +1,13 @@
 from typing import Any
 
 from easypost.constant import NO_USER_FOUND
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.errors import FilteringError
 from easypost.models import ApiKey
-from easypost.requestor import RequestMethod, Requestor
-from easypost.services.base_service import BaseService
+from easypost.requestor import AsyncRequestor, RequestMethod, Requestor
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class ApiKeyService(BaseService):
@@ -24,8 +26,8 @@ class ApiKeyService(BaseService):
         # This function was called on a child user (authenticated as parent, only return
         # this child user's details).
         for child in api_keys["children"]:
-            if child.id == id:
-                return child.keys
+            if child["id"] == id:
+                return child["keys"]
 
         raise FilteringError(message=NO_USER_FOUND)
 
@@ -35,7 +37,7 @@ class ApiKeyService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def create(self, mode: str) -> ApiKey:
         """Create an API key for a child or referral customer user."""
@@ -44,7 +46,7 @@ class ApiKeyService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def delete(self, id: str) -> None:
         """Delete an API key for a child or referral customer user."""
@@ -56,7 +58,7 @@ class ApiKeyService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def disable(self, id: str) -> ApiKey:
         """Disable a child or referral customer API key."""
@@ -64,4 +66,63 @@ class ApiKeyService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
+
+
+class AsyncApiKeyService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = ApiKey.__name__
+
+    async def retrieve_api_keys_for_user(self, id: str) -> list[ApiKey]:
+        """Retrieve a list of API keys (works for the authenticated User or a child User)."""
+        api_keys = await self.all()
+
+        if api_keys["id"] == id:
+            # This function was called on the authenticated user
+            return api_keys["keys"]
+
+        # This function was called on a child user (authenticated as parent, only return
+        # this child user's details).
+        for child in api_keys["children"]:
+            if child["id"] == id:
+                return child["keys"]
+
+        raise FilteringError(message=NO_USER_FOUND)
+
+    async def all(self) -> dict[str, Any]:
+        """Retrieve a list of all API keys."""
+        url = "/api_keys"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url)
+
+        return self._convert_response(response)
+
+    async def create(self, mode: str) -> ApiKey:
+        """Create an API key for a child or referral customer user."""
+        url = "/api_keys"
+        params = {"mode": mode}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def delete(self, id: str) -> None:
+        """Delete an API key for a child or referral customer user."""
+        await self._delete_resource(self._model_class, id)
+
+    async def enable(self, id: str) -> ApiKey:
+        """Enable a child or referral customer API key."""
+        url = f"/api_keys/{id}/enable"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url)
+
+        return self._convert_response(response)
+
+    async def disable(self, id: str) -> ApiKey:
+        """Disable a child or referral customer API key."""
+        url = f"/api_keys/{id}/disable"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url)
+
+        return self._convert_response(response)
@@ -1,7 +1,16 @@
+import datetime
+import importlib
 import re
 from typing import (
     Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Iterator,
     Optional,
+    TypeVar,
+    Union,
+    overload,
 )
 
 from easypost.constant import (
@@ -10,10 +19,60 @@ from easypost.constant import (
 )
 from easypost.easypost_object import convert_to_easypost_object
 from easypost.errors import EndOfPaginationError
+from easypost.prefetch import (
+    async_prefetch,
+    prefetch,
+)
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
+from easypost.time_shards import (
+    format_datetime,
+    iter_time_shards,
+)
+
+ServiceType = TypeVar("ServiceType")
+
+_CAMELCASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Route table of the snake_case name and collection URL of each model class, filled as services are used
+_SNAKECASE_NAMES: dict[str, str] = {}
+_CLASS_URLS: dict[str, str] = {}
+
+# Params the pagination helpers set from the previous page, all other filters are passed on to each page
+_CURSOR_PARAMS = frozenset(("before_id", "after_id"))
+
+
+class LazyService(Generic[ServiceType]):
+    """Declares a service on a client that is only imported and built the first time it is accessed.
+
+    The built service is cached in the client's `__dict__` under the same name, so later lookups are plain
+    attribute reads that never reach this descriptor again.
+    """
+
+    def __init__(self, class_name: str):
+        self.class_name = class_name
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, client: None, owner: type) -> "LazyService[ServiceType]": ...
+
+    @overload
+    def __get__(self, client: object, owner: type) -> ServiceType: ...
+
+    def __get__(self, client, owner):
+        if client is None:
+            return self
+
+        service_class = getattr(importlib.import_module("easypost.services"), self.class_name)
+        # Services are stateless so two threads racing here build equivalent services, the last one wins
+        service = client.__dict__[self.name] = service_class(client)
+        return service
 
 
 class BaseService:
@@ -22,17 +81,40 @@ class BaseService:
     def __init__(self, client):
         self._client = client
 
+    def _convert_response(self, response: Any) -> Any:
+        """Convert a response to EasyPostObjects, compact or lazy ones when the client is set to use them.
+
+        Clients set to the `"dict"` response format get the decoded response as is.
+        """
+        if self._client._raw_responses:
+            return response
+
+        return convert_to_easypost_object(
+            response=response,
+            compact=self._client._compact_models,
+            lazy=self._client._lazy_models,
+        )
+
     def _snakecase_name(self, class_name: str) -> str:
         """Return the class name as snake_case."""
-        return re.sub(r"(?<!^)(?=[A-Z])", "_", class_name).lower()
+        snakecase_name = _SNAKECASE_NAMES.get(class_name)
+        if snakecase_name is None:
+            snakecase_name = _SNAKECASE_NAMES[class_name] = _CAMELCASE_BOUNDARY.sub("_", class_name).lower()
+
+        return snakecase_name
 
     def _class_url(self, class_name: str) -> str:
         """Generate a URL based on class name."""
-        transformed_class_name = self._snakecase_name(class_name)
-        if transformed_class_name[-1:] in ("s", "h"):
-            return f"/{transformed_class_name}es"
-        else:
-            return f"/{transformed_class_name}s"
+        class_url = _CLASS_URLS.get(class_name)
+        if class_url is None:
+            transformed_class_name = self._snakecase_name(class_name)
+            if transformed_class_name[-1:] in ("s", "h"):
+                class_url = f"/{transformed_class_name}es"
+            else:
+                class_url = f"/{transformed_class_name}s"
+            _CLASS_URLS[class_name] = class_url
+
+        return class_url
 
     def _instance_url(self, class_name: str, id: str) -> str:
         """Generate an instance URL based on a class name and ID."""
@@ -45,7 +127,7 @@ class BaseService:
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params, beta=beta)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def _all_resources(
         self,
@@ -61,7 +143,7 @@ class BaseService:
         if filters:  # presence of filters indicates we are dealing with a paginated response
             response[_FILTERS_KEY] = filters  # Save the filters used to reference in potential get_next_page call
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def _retrieve_resource(self, class_name: str, id: str, beta: bool = False) -> Any:
         """Retrieve an object from the EasyPost API."""
@@ -69,7 +151,7 @@ class BaseService:
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, beta=beta)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def _update_resource(
         self,
@@ -85,7 +167,7 @@ class BaseService:
 
         response = Requestor(self._client).request(method=method, url=url, params=wrapped_params, beta=beta)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def _delete_resource(self, class_name: str, id: str, beta: bool = False) -> Any:
         """Delete an EasyPost object via the EasyPost API."""
@@ -93,9 +175,192 @@ class BaseService:
 
         response = Requestor(self._client).request(method=RequestMethod.DELETE, url=url, beta=beta)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def _check_has_next_page(self, collection: dict[str, Any]) -> None:
         """Raise exception if there is no next page of a collection."""
         if not collection.get("has_more", False):
             raise EndOfPaginationError(NO_MORE_PAGES_ERROR)
+
+    def _iter_pages(
+        self,
+        list_page: Callable[..., Any],
+        next_page: Callable[..., Any],
+        key: str,
+        params: dict[str, Any],
+    ) -> Iterator[Any]:
+        """Retrieve the pages of a list one after the other, stopping after the last one."""
+        page = list_page(**params)
+        optional_params = {k: v for k, v in params.items() if k not in _CURSOR_PARAMS}
+
+        while True:
+            yield page
+            if not page.get("has_more", False) or not page.get(key):
+                return
+            page = next_page(page, params.get("page_size"), optional_params)
+
+    def _iter_all_resources(
+        self,
+        list_page: Callable[..., Any],
+        next_page: Callable[..., Any],
+        key: str,
+        max_items: Optional[int],
+        params: dict[str, Any],
+        prefetch_pages: int = 0,
+    ) -> Iterator[Any]:
+        """Iterate over the items of a list page by page, up to `max_items`.
+
+        Only the current page is held onto, unless `prefetch_pages` is set: up to that many of the following pages
+        are then retrieved in the background while the current one is consumed.
+        """
+        if max_items is not None and max_items <= 0:
+            return
+
+        pages = self._iter_pages(list_page, next_page, key, params)
+        if prefetch_pages > 0:
+            pages = prefetch(pages, prefetch_pages)
+
+        count = 0
+        for page in pages:
+            for item in page.get(key, []):
+                yield item
+                count += 1
+                if count == max_items:
+                    return
+
+    def _iter_all_sharded(
+        self,
+        list_page: Callable[..., Any],
+        key: str,
+        start_datetime: Union[str, datetime.datetime],
+        end_datetime: Union[str, datetime.datetime],
+        workers: int,
+        max_items: Optional[int],
+        params: dict[str, Any],
+    ) -> Iterator[Any]:
+        """Iterate over the items of a list created in a time range, paginating windows of the range concurrently."""
+
+        def fetch_page(start: datetime.datetime, end: datetime.datetime, before_id: Optional[str]) -> Any:
+            return list_page(
+                **params,
+                start_datetime=format_datetime(start),
+                end_datetime=format_datetime(end),
+                before_id=before_id,
+            )
+
+        return iter_time_shards(fetch_page, key, start_datetime, end_datetime, workers, max_items)
+
+
+class AsyncBaseService(BaseService):
+    """The base service that all asynchronous services inherit containing shared logic."""
+
+    async def _create_resource(self, class_name: str, beta: bool = False, **params) -> Any:  # type: ignore[override]
+        """Create an EasyPost object via the EasyPost API."""
+        url = self._class_url(class_name)
+        wrapped_params = {self._snakecase_name(class_name): params}
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST, url=url, params=wrapped_params, beta=beta
+        )
+
+        return self._convert_response(response)
+
+    async def _all_resources(  # type: ignore[override]
+        self,
+        class_name: str,
+        filters: Optional[dict[str, Any]] = None,
+        beta: bool = False,
+        **params,
+    ) -> Any:
+        """Retrieve a list of EasyPostObjects from the EasyPost API."""
+        url = self._class_url(class_name)
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET, url=url, params=params, beta=beta
+        )
+
+        if filters:  # presence of filters indicates we are dealing with a paginated response
+            response[_FILTERS_KEY] = filters  # Save the filters used to reference in potential get_next_page call
+
+        return self._convert_response(response)
+
+    async def _retrieve_resource(self, class_name: str, id: str, beta: bool = False) -> Any:  # type: ignore[override]
+        """Retrieve an object from the EasyPost API."""
+        url = self._instance_url(class_name, id)
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, beta=beta)
+
+        return self._convert_response(response)
+
+    async def _update_resource(  # type: ignore[override]
+        self,
+        class_name: str,
+        id: str,
+        method: RequestMethod = RequestMethod.PATCH,
+        beta: bool = False,
+        **params,
+    ) -> Any:
+        """Update an EasyPost object via the EasyPost API."""
+        url = self._instance_url(class_name, id)
+        wrapped_params = {self._snakecase_name(class_name): params}
+
+        response = await AsyncRequestor(self._client).request(method=method, url=url, params=wrapped_params, beta=beta)
+
+        return self._convert_response(response)
+
+    async def _delete_resource(self, class_name: str, id: str, beta: bool = False) -> Any:  # type: ignore[override]
+        """Delete an EasyPost object via the EasyPost API."""
+        url = self._instance_url(class_name, id)
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.DELETE, url=url, beta=beta)
+
+        return self._convert_response(response)
+
+    async def _iter_pages(  # type: ignore[override]
+        self,
+        list_page: Callable[..., Any],
+        next_page: Callable[..., Any],
+        key: str,
+        params: dict[str, Any],
+    ) -> AsyncIterator[Any]:
+        """Retrieve the pages of a list one after the other, stopping after the last one."""
+        page = await list_page(**params)
+        optional_params = {k: v for k, v in params.items() if k not in _CURSOR_PARAMS}
+
+        while True:
+            yield page
+            if not page.get("has_more", False) or not page.get(key):
+                return
+            page = await next_page(page, params.get("page_size"), optional_params)
+
+    async def _iter_all_resources(  # type: ignore[override]
+        self,
+        list_page: Callable[..., Any],
+        next_page: Callable[..., Any],
+        key: str,
+        max_items: Optional[int],
+        params: dict[str, Any],
+        prefetch_pages: int = 0,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the items of a list page by page, up to `max_items`.
+
+        Only the current page is held onto, unless `prefetch_pages` is set: up to that many of the following pages
+        are then retrieved in the background while the current one is consumed.
+        """
+        if max_items is not None and max_items <= 0:
+            return
+
+        pages = self._iter_pages(list_page, next_page, key, params)
+        if prefetch_pages > 0:
+            pages = async_prefetch(pages, prefetch_pages)
+
+        count = 0
+        try:
+            async for page in pages:
+                for item in page.get(key, []):
+                    yield item
+                    count += 1
+                    if count == max_items:
+                        return
+        finally:
+            # Unlike sync generators, async ones aren't closed as soon as they're dropped, stop the prefetching now
+            await pages.aclose()  # type: ignore[attr-defined]
@@ -1,15 +1,20 @@
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Batch
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class BatchService(BaseService):
@@ -39,7 +44,7 @@ class BatchService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def label(self, id: str, **params) -> Batch:
         """Create a Batch label."""
@@ -47,7 +52,7 @@ class BatchService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def remove_shipments(self, id: str, **params) -> Batch:
         """Remove Shipments from a Batch."""
@@ -55,7 +60,7 @@ class BatchService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def add_shipments(self, id: str, **params) -> Batch:
         """Add Shipments to a Batch."""
@@ -63,7 +68,7 @@ class BatchService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def create_scan_form(self, id: str, **params) -> Batch:
         """Create a ScanForm for a Batch."""
@@ -71,7 +76,7 @@ class BatchService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def get_next_page(
         self,
@@ -89,7 +94,7 @@ class BatchService(BaseService):
         self._check_has_next_page(collection=batches)
 
         params = {
-            "before_id": batches["batches"][-1].id,
+            "before_id": batches["batches"][-1]["id"],
             "page_size": page_size,
         }
 
@@ -97,3 +102,104 @@ class BatchService(BaseService):
             params.update(optional_params)
 
         return self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[Batch]:
+        """Iterate over all Batches page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "batches", max_items, params, prefetch)
+
+
+class AsyncBatchService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Batch.__name__
+
+    async def create(self, **params) -> Batch:
+        """Create a Batch."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Batches."""
+        filters = {
+            "key": "batches",
+        }
+
+        return await self._all_resources(self._model_class, filters, **params)
+
+    async def retrieve(self, id: str) -> Batch:
+        """Retrieve a Batch."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def buy(self, id: str, **params) -> Batch:
+        """Buy a Batch."""
+        url = f"{self._instance_url(self._model_class, id)}/buy"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def label(self, id: str, **params) -> Batch:
+        """Create a Batch label."""
+        url = f"{self._instance_url(self._model_class, id)}/label"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def remove_shipments(self, id: str, **params) -> Batch:
+        """Remove Shipments from a Batch."""
+        url = f"{self._instance_url(self._model_class, id)}/remove_shipments"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def add_shipments(self, id: str, **params) -> Batch:
+        """Add Shipments to a Batch."""
+        url = f"{self._instance_url(self._model_class, id)}/add_shipments"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def create_scan_form(self, id: str, **params) -> Batch:
+        """Create a ScanForm for a Batch."""
+        url = f"{self._instance_url(self._model_class, id)}/scan_form"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def get_next_page(
+        self,
+        batches: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """
+        Retrieve the next page of the list Batch response.
+
+        NOTE: This function has known issues with retrieving pages in order due to server-side issues.
+        It is not recommended to be used currently.
+        """
+        # API doesn't return batches newest to oldest, so these parameters don't work as expected
+        self._check_has_next_page(collection=batches)
+
+        params = {
+            "before_id": batches["batches"][-1]["id"],
+            "page_size": page_size,
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[Batch]:
+        """Iterate over all Batches page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "batches", max_items, params, prefetch)
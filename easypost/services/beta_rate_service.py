@@ -2,13 +2,16 @@ from typing import (
     Any,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Rate
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class BetaRateService(BaseService):
@@ -28,4 +31,24 @@ class BetaRateService(BaseService):
             beta=True,
         )
 
-        return convert_to_easypost_object(response=response.get("rates", None))
+        return self._convert_response(response.get("rates", None))
+
+
+class AsyncBetaRateService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Rate.__name__
+
+    async def retrieve_stateless_rates(self, **params) -> dict[str, Any]:
+        """Retrieves stateless rates by passing shipment data."""
+        url = self._class_url(self._model_class)
+        wrapped_params = {"shipment": params}
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url=url,
+            params=wrapped_params,
+            beta=True,
+        )
+
+        return self._convert_response(response.get("rates", None))
@@ -6,14 +6,17 @@ from easypost.constant import (
     INVALID_PAYMENT_METHOD_ERROR,
     NO_BILLING_ERROR,
 )
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.errors import InvalidObjectError
 from easypost.models import Billing
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class BillingService(BaseService):
@@ -49,12 +52,17 @@ class BillingService(BaseService):
         if response.get("id") is None:
             raise InvalidObjectError(message=NO_BILLING_ERROR)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def _get_payment_method_info(self, priority: str = "primary") -> list[str]:
         """Get payment method info (type of the payment method and ID of the payment method)"""
         payment_methods = self.retrieve_payment_methods()
 
+        return self._select_payment_method_info(payment_methods, priority)
+
+    @staticmethod
+    def _select_payment_method_info(payment_methods: dict[str, Any], priority: str = "primary") -> list[str]:
+        """Select the endpoint and ID of the payment method matching the priority from a list of payment methods."""
         payment_method_map = {
             "primary": "primary_payment_method",
             "secondary": "secondary_payment_method",
@@ -75,3 +83,45 @@ class BillingService(BaseService):
             raise InvalidObjectError(message=INVALID_PAYMENT_METHOD_ERROR)
 
         return [endpoint, payment_method_id]
+
+
+class AsyncBillingService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Billing.__name__
+
+    async def fund_wallet(self, amount: str, priority: str = "primary") -> None:
+        """Fund your EasyPost wallet by charging your primary or secondary payment method on file."""
+        endpoint, payment_method_id = await self._get_payment_method_info(priority=priority)
+
+        url = f"{endpoint}/{payment_method_id}/charges"
+        wrapped_params = {"amount": amount}
+
+        await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+    async def delete_payment_method(self, priority: str) -> None:
+        """Delete a payment method."""
+        endpoint, payment_method_id = await self._get_payment_method_info(priority=priority)
+
+        url = f"{endpoint}/{payment_method_id}"
+
+        await AsyncRequestor(self._client).request(method=RequestMethod.DELETE, url=url)
+
+    async def retrieve_payment_methods(self, **params) -> dict[str, Any]:
+        """Retrieve payment methods."""
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url="/payment_methods",
+            params=params,
+        )
+
+        if response.get("id") is None:
+            raise InvalidObjectError(message=NO_BILLING_ERROR)
+
+        return self._convert_response(response)
+
+    async def _get_payment_method_info(self, priority: str = "primary") -> list[str]:
+        """Get payment method info (type of the payment method and ID of the payment method)"""
+        payment_methods = await self.retrieve_payment_methods()
+
+        return BillingService._select_payment_method_info(payment_methods, priority)
@@ -8,14 +8,17 @@ from easypost.constant import (
     _CARRIER_ACCOUNT_TYPES_WITH_CUSTOM_WORKFLOWS,
     MISSING_PARAMETER_ERROR,
 )
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.errors import MissingParameterError
 from easypost.models import CarrierAccount
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class CarrierAccountService(BaseService):
@@ -38,7 +41,7 @@ class CarrierAccountService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def all(self, **params) -> list[dict[str, Any]]:
         """Retrieve a list of CarrierAccounts."""
@@ -60,9 +63,10 @@ class CarrierAccountService(BaseService):
         """Get the types of CarrierAccounts available to the User."""
         response = Requestor(self._client).request(method=RequestMethod.GET, url="/carrier_types")
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
-    def _select_carrier_account_creation_endpoint(self, carrier_account_type: Optional[Any]) -> str:
+    @staticmethod
+    def _select_carrier_account_creation_endpoint(carrier_account_type: Optional[Any]) -> str:
         """Determines which API endpoint to use for the creation call."""
         if carrier_account_type in _CARRIER_ACCOUNT_TYPES_WITH_CUSTOM_WORKFLOWS:
             return "/carrier_accounts/register"
@@ -70,3 +74,48 @@ class CarrierAccountService(BaseService):
             return "/carrier_accounts/register_oauth"
 
         return "/carrier_accounts"
+
+
+class AsyncCarrierAccountService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = CarrierAccount.__name__
+
+    async def create(self, **params) -> CarrierAccount:
+        """Create a CarrierAccount."""
+        carrier_account_type = params.get("type")
+
+        if carrier_account_type is None:
+            raise MissingParameterError(MISSING_PARAMETER_ERROR.format("type"))
+
+        url = CarrierAccountService._select_carrier_account_creation_endpoint(carrier_account_type=carrier_account_type)
+        if carrier_account_type in _CARRIER_ACCOUNT_TYPES_WITH_CUSTOM_OAUTH:
+            wrapped_params = {"carrier_account_oauth_registrations": params}
+        else:
+            wrapped_params = {self._snakecase_name(self._model_class): params}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response)
+
+    async def all(self, **params) -> list[dict[str, Any]]:
+        """Retrieve a list of CarrierAccounts."""
+        return await self._all_resources(self._model_class, **params)
+
+    async def retrieve(self, id: str) -> CarrierAccount:
+        """Retrieve a CarrierAccount."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def update(self, id: str, **params) -> CarrierAccount:
+        """Update a CarrierAccount."""
+        return await self._update_resource(self._model_class, id, **params)
+
+    async def delete(self, id: str) -> None:
+        """Delete a CarrierAccount."""
+        await self._delete_resource(self._model_class, id)
+
+    async def types(self) -> list[dict[str, Any]]:
+        """Get the types of CarrierAccounts available to the User."""
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url="/carrier_types")
+
+        return self._convert_response(response)
@@ -3,12 +3,15 @@ from typing import (
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class CarrierMetadataService(BaseService):
@@ -32,4 +35,28 @@ class CarrierMetadataService(BaseService):
             params=params,
         )
 
-        return convert_to_easypost_object(response=response.get("carriers", []))
+        return self._convert_response(response.get("carriers", []))
+
+
+class AsyncCarrierMetadataService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+
+    async def retrieve(
+        self,
+        carriers: Optional[list[str]] = None,
+        types: Optional[list[str]] = None,
+    ) -> list[dict[str, Any]]:
+        """Get metadata for all carriers on the EasyPost platform or specify optional filters."""
+        params = {
+            "carriers": ",".join(carriers) if carriers else None,
+            "types": ",".join(types) if types else None,
+        }
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url="/metadata/carriers",
+            params=params,
+        )
+
+        return self._convert_response(response.get("carriers", []))
@@ -1,15 +1,20 @@
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Claim
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class ClaimService(BaseService):
@@ -23,7 +28,7 @@ class ClaimService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params, beta=False)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def all(self, **params) -> dict[str, Any]:
         """Retrieve a list of Claims."""
@@ -47,7 +52,7 @@ class ClaimService(BaseService):
         self._check_has_next_page(collection=claims)
 
         params = {
-            "before_id": claims["claims"][-1].id,
+            "before_id": claims["claims"][-1]["id"],
             "page_size": page_size,
         }
 
@@ -56,6 +61,13 @@ class ClaimService(BaseService):
 
         return self.all(**params)
 
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[Claim]:
+        """Iterate over all Claims page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "claims", max_items, params, prefetch)
+
     def cancel(self, id: str) -> Claim:
         """Cancel a Claim."""
         url = f"/claims/{id}/cancel"
@@ -66,4 +78,70 @@ class ClaimService(BaseService):
             beta=False,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
+
+
+class AsyncClaimService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Claim.__name__
+
+    async def create(self, **params) -> Claim:
+        """Create a Claim."""
+        url = "/claims"
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST, url=url, params=params, beta=False
+        )
+
+        return self._convert_response(response)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Claims."""
+        filters = {
+            "key": "claims",
+        }
+
+        return await self._all_resources(class_name=self._model_class, filters=filters, beta=False, **params)
+
+    async def retrieve(self, id: str) -> Claim:
+        """Retrieve a Claim."""
+        return await self._retrieve_resource(class_name=self._model_class, id=id, beta=False)
+
+    async def get_next_page(
+        self,
+        claims: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve the next page of the list Claim response."""
+        self._check_has_next_page(collection=claims)
+
+        params = {
+            "before_id": claims["claims"][-1]["id"],
+            "page_size": page_size,
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[Claim]:
+        """Iterate over all Claims page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "claims", max_items, params, prefetch)
+
+    async def cancel(self, id: str) -> Claim:
+        """Cancel a Claim."""
+        url = f"/claims/{id}/cancel"
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url=url,
+            beta=False,
+        )
+
+        return self._convert_response(response)
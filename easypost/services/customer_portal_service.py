@@ -1,11 +1,14 @@
 from typing import Any
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class CustomerPortalService(BaseService):
@@ -20,4 +23,19 @@ class CustomerPortalService(BaseService):
             params=params,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
+
+
+class AsyncCustomerPortalService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+
+    async def create_account_link(self, **params) -> dict[str, Any]:
+        """Create a Portal Session."""
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url="/customer_portal/account_link",
+            params=params,
+        )
+
+        return self._convert_response(response)
@@ -1,5 +1,8 @@
 from easypost.models import CustomsInfo
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class CustomsInfoService(BaseService):
@@ -14,3 +17,17 @@ class CustomsInfoService(BaseService):
     def retrieve(self, id: str) -> CustomsInfo:
         """Retrieve a CustomsInfo."""
         return self._retrieve_resource(self._model_class, id)
+
+
+class AsyncCustomsInfoService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = CustomsInfo.__name__
+
+    async def create(self, **params) -> CustomsInfo:
+        """Create a CustomsInfo."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def retrieve(self, id: str) -> CustomsInfo:
+        """Retrieve a CustomsInfo."""
+        return await self._retrieve_resource(self._model_class, id)
@@ -1,5 +1,8 @@
 from easypost.models import CustomsItem
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class CustomsItemService(BaseService):
@@ -14,3 +17,17 @@ class CustomsItemService(BaseService):
     def retrieve(self, id: str) -> CustomsItem:
         """Retrieve a CustomsItem."""
         return self._retrieve_resource(self._model_class, id)
+
+
+class AsyncCustomsItemService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = CustomsItem.__name__
+
+    async def create(self, **params) -> CustomsItem:
+        """Create a CustomsItem."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def retrieve(self, id: str) -> CustomsItem:
+        """Retrieve a CustomsItem."""
+        return await self._retrieve_resource(self._model_class, id)
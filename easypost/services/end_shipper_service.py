@@ -2,16 +2,19 @@ from typing import (
     Any,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import (
     Address,
     EndShipper,
 )
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class EndShipperService(BaseService):
@@ -27,7 +30,7 @@ class EndShipperService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def all(self, **params) -> dict[str, Any]:
         """Retrieve a list of EndShippers."""
@@ -47,4 +50,40 @@ class EndShipperService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.PUT, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
+
+
+class AsyncEndShipperService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Address.__name__
+        self._service_class = EndShipper.__name__
+
+    async def create(self, **params) -> Address:
+        """Create an EndShipper."""
+        url = self._class_url(self._service_class)
+        wrapped_params = {self._snakecase_name(self._model_class): params}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of EndShippers."""
+        return await self._all_resources(self._service_class, **params)
+
+    async def retrieve(self, id: str) -> Address:
+        """Retrieve an EndShipper."""
+        return await self._retrieve_resource(self._service_class, id)
+
+    async def update(self, id: str, **params) -> Address:
+        """Update an EndShipper object.
+
+        This function requires all parameters to be present for an EndShipper.
+        """
+        url = self._instance_url(self._service_class, id)
+        wrapped_params = {self._snakecase_name(self._model_class): params}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.PUT, url=url, params=wrapped_params)
+
+        return self._convert_response(response)
@@ -1,18 +1,25 @@
+import datetime
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
     Optional,
+    Union,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import (
     Event,
     Payload,
 )
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class EventService(BaseService):
@@ -42,7 +49,7 @@ class EventService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def retrieve_payload(self, event_id: str, payload_id: str, **params) -> Payload:
         """Retrieve a Payload of an Event."""
@@ -50,7 +57,7 @@ class EventService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def get_next_page(
         self,
@@ -62,7 +69,7 @@ class EventService(BaseService):
         self._check_has_next_page(collection=events)
 
         params = {
-            "before_id": events["events"][-1].id,
+            "before_id": events["events"][-1]["id"],
             "page_size": page_size,
         }
 
@@ -70,3 +77,89 @@ class EventService(BaseService):
             params.update(optional_params)
 
         return self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[Event]:
+        """Iterate over all Events page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "events", max_items, params, prefetch)
+
+    def iter_all_sharded(
+        self,
+        start_datetime: Union[str, datetime.datetime],
+        end_datetime: Union[str, datetime.datetime],
+        workers: int = 4,
+        max_items: Optional[int] = None,
+        **params,
+    ) -> Iterator[Event]:
+        """Iterate over all Events created between `start_datetime` and `end_datetime`, newest first.
+
+        The range is split into time windows paginated concurrently on `workers` threads, dense windows being split
+        further, and merged back in order without duplicates.
+        """
+        return self._iter_all_sharded(self.all, "events", start_datetime, end_datetime, workers, max_items, params)
+
+
+class AsyncEventService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Event.__name__
+
+    async def create(self, **params) -> Event:
+        """Create an Event."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Events."""
+        filters = {
+            "key": "events",
+        }
+
+        return await self._all_resources(self._model_class, filters, **params)
+
+    async def retrieve(self, id: str) -> Event:
+        """Retrieve an Event."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def retrieve_all_payloads(self, event_id: str, **params) -> dict[str, Any]:
+        """Retrieve a list of Payloads for an Event."""
+        url = f"{self._class_url(self._model_class)}/{event_id}/payloads"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def retrieve_payload(self, event_id: str, payload_id: str, **params) -> Payload:
+        """Retrieve a Payload of an Event."""
+        url = f"{self._class_url(self._model_class)}/{event_id}/payloads/{payload_id}"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def get_next_page(
+        self,
+        events: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve the next page of the list Events response."""
+        self._check_has_next_page(collection=events)
+
+        params = {
+            "before_id": events["events"][-1]["id"],
+            "page_size": page_size,
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[Event]:
+        """Iterate over all Events page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "events", max_items, params, prefetch)
@@ -1,9 +1,11 @@
 import uuid
 from typing import Any
 
-from easypost.easypost_object import convert_to_easypost_object
-from easypost.requestor import RequestMethod, Requestor
-from easypost.services.base_service import BaseService
+from easypost.requestor import AsyncRequestor, RequestMethod, Requestor
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class FedExRegistrationService(BaseService):
@@ -17,7 +19,7 @@ class FedExRegistrationService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def request_pin(self, fedex_account_number: str, pin_method_option: str, **params) -> dict[str, Any]:
         """Request a PIN for FedEx account verification."""
@@ -27,7 +29,7 @@ class FedExRegistrationService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def validate_pin(self, fedex_account_number: str, **params) -> dict[str, Any]:
         """Validate the PIN entered by the user for FedEx account verification."""
@@ -36,7 +38,7 @@ class FedExRegistrationService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def submit_invoice(self, fedex_account_number: str, **params) -> dict[str, Any]:
         """Submit invoice information to complete FedEx account registration."""
@@ -45,9 +47,10 @@ class FedExRegistrationService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
-    def _wrap_address_validation(self, params: dict[str, Any]) -> dict[str, Any]:
+    @classmethod
+    def _wrap_address_validation(cls, params: dict[str, Any]) -> dict[str, Any]:
         """Wraps address validation parameters and ensures the "name" field exists.
         If not present, generates a UUID (with hyphens removed) as the name.
         """
@@ -55,7 +58,7 @@ class FedExRegistrationService(BaseService):
 
         if "address_validation" in params:
             address_validation = params["address_validation"].copy()
-            self._ensure_name_field(address_validation)
+            cls._ensure_name_field(address_validation)
             wrapped_params["address_validation"] = address_validation
 
         if "easypost_details" in params:
@@ -63,7 +66,8 @@ class FedExRegistrationService(BaseService):
 
         return wrapped_params
 
-    def _wrap_pin_validation(self, params: dict[str, Any]) -> dict[str, Any]:
+    @classmethod
+    def _wrap_pin_validation(cls, params: dict[str, Any]) -> dict[str, Any]:
         """Wraps PIN validation parameters and ensures the "name" field exists.
         If not present, generates a UUID (with hyphens removed) as the name.
         """
@@ -71,7 +75,7 @@ class FedExRegistrationService(BaseService):
 
         if "pin_validation" in params:
             pin_validation = params["pin_validation"].copy()
-            self._ensure_name_field(pin_validation)
+            cls._ensure_name_field(pin_validation)
             wrapped_params["pin_validation"] = pin_validation
 
         if "easypost_details" in params:
@@ -79,7 +83,8 @@ class FedExRegistrationService(BaseService):
 
         return wrapped_params
 
-    def _wrap_invoice_validation(self, params: dict[str, Any]) -> dict[str, Any]:
+    @classmethod
+    def _wrap_invoice_validation(cls, params: dict[str, Any]) -> dict[str, Any]:
         """Wraps invoice validation parameters and ensures the "name" field exists.
         If not present, generates a UUID (with hyphens removed) as the name.
         """
@@ -87,7 +92,7 @@ class FedExRegistrationService(BaseService):
 
         if "invoice_validation" in params:
             invoice_validation = params["invoice_validation"].copy()
-            self._ensure_name_field(invoice_validation)
+            cls._ensure_name_field(invoice_validation)
             wrapped_params["invoice_validation"] = invoice_validation
 
         if "easypost_details" in params:
@@ -95,10 +100,53 @@ class FedExRegistrationService(BaseService):
 
         return wrapped_params
 
-    def _ensure_name_field(self, mapping: dict[str, Any]) -> None:
+    @staticmethod
+    def _ensure_name_field(mapping: dict[str, Any]) -> None:
         """Ensures the "name" field exists in the provided map.
         If not present, generates a UUID (with hyphens removed) as the name.
         This follows the pattern used in the web UI implementation.
         """
         if "name" not in mapping or mapping["name"] is None:
             mapping["name"] = str(uuid.uuid4()).replace("-", "")
+
+
+class AsyncFedExRegistrationService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+
+    async def register_address(self, fedex_account_number: str, **params) -> dict[str, Any]:
+        """Register the billing address for a FedEx account."""
+        wrapped_params = FedExRegistrationService._wrap_address_validation(params)
+        url = f"/fedex_registrations/{fedex_account_number}/address"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response)
+
+    async def request_pin(self, fedex_account_number: str, pin_method_option: str, **params) -> dict[str, Any]:
+        """Request a PIN for FedEx account verification."""
+        wrapped_params = FedExRegistrationService._wrap_pin_validation(params)
+        wrapped_params["pin_method"] = {"option": pin_method_option}
+        url = f"/fedex_registrations/{fedex_account_number}/pin"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response)
+
+    async def validate_pin(self, fedex_account_number: str, **params) -> dict[str, Any]:
+        """Validate the PIN entered by the user for FedEx account verification."""
+        wrapped_params = FedExRegistrationService._wrap_pin_validation(params)
+        url = f"/fedex_registrations/{fedex_account_number}/pin/validate"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response)
+
+    async def submit_invoice(self, fedex_account_number: str, **params) -> dict[str, Any]:
+        """Submit invoice information to complete FedEx account registration."""
+        wrapped_params = FedExRegistrationService._wrap_invoice_validation(params)
+        url = f"/fedex_registrations/{fedex_account_number}/invoice"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response)
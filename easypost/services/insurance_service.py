@@ -1,15 +1,22 @@
+import datetime
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
     Optional,
+    Union,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Insurance
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class InsuranceService(BaseService):
@@ -43,7 +50,7 @@ class InsuranceService(BaseService):
         self._check_has_next_page(collection=insurances)
 
         params = {
-            "before_id": insurances["insurances"][-1].id,
+            "before_id": insurances["insurances"][-1]["id"],
             "page_size": page_size,
         }
 
@@ -52,6 +59,28 @@ class InsuranceService(BaseService):
 
         return self.all(**params)
 
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[Insurance]:
+        """Iterate over all Insurances page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "insurances", max_items, params, prefetch)
+
+    def iter_all_sharded(
+        self,
+        start_datetime: Union[str, datetime.datetime],
+        end_datetime: Union[str, datetime.datetime],
+        workers: int = 4,
+        max_items: Optional[int] = None,
+        **params,
+    ) -> Iterator[Insurance]:
+        """Iterate over all Insurances created between `start_datetime` and `end_datetime`, newest first.
+
+        The range is split into time windows paginated concurrently on `workers` threads, dense windows being split
+        further, and merged back in order without duplicates.
+        """
+        return self._iter_all_sharded(self.all, "insurances", start_datetime, end_datetime, workers, max_items, params)
+
     def refund(self, id: str) -> Insurance:
         url = f"/insurances/{id}/refund"
         response = Requestor(self._client).request(
@@ -59,4 +88,61 @@ class InsuranceService(BaseService):
             url=url,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
+
+
+class AsyncInsuranceService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Insurance.__name__
+
+    async def create(self, **params) -> Insurance:
+        """Create an Insurance."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Insurances."""
+        filters = {
+            "key": "insurances",
+        }
+
+        return await self._all_resources(self._model_class, filters, **params)
+
+    async def retrieve(self, id: str) -> Insurance:
+        """Retrieve an Insurance."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        insurances: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve the next page of the list Insurance response."""
+        self._check_has_next_page(collection=insurances)
+
+        params = {
+            "before_id": insurances["insurances"][-1]["id"],
+            "page_size": page_size,
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[Insurance]:
+        """Iterate over all Insurances page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "insurances", max_items, params, prefetch)
+
+    async def refund(self, id: str) -> Insurance:
+        url = f"/insurances/{id}/refund"
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url=url,
+        )
+
+        return self._convert_response(response)
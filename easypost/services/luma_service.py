@@ -2,15 +2,18 @@ from typing import (
     Any,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import (
     Shipment,
 )
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class LumaService(BaseService):
@@ -30,4 +33,24 @@ class LumaService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response.get("luma_info", {}))
+        return self._convert_response(response.get("luma_info", {}))
+
+
+class AsyncLumaService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = "Luma"
+
+    async def get_promise(
+        self,
+        **params: dict[str, Any],
+    ) -> Shipment:
+        """Get service recommendations from Luma that meet the criteria of your ruleset."""
+        url = "/luma/promise"
+        wrapped_params = {
+            self._snakecase_name("Shipment"): params,
+        }
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response.get("luma_info", {}))
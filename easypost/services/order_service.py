@@ -1,10 +1,13 @@
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Order
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class OrderService(BaseService):
@@ -26,7 +29,7 @@ class OrderService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def buy(self, id: str, **params) -> Order:
         """Buy an Order."""
@@ -34,4 +37,34 @@ class OrderService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
+
+
+class AsyncOrderService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Order.__name__
+
+    async def create(self, **params) -> Order:
+        """Create an Order."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def retrieve(self, id: str) -> Order:
+        """Retrieve an Order."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_rates(self, id: str) -> Order:
+        """Get rates for an Order."""
+        url = f"{self._instance_url(self._model_class, id)}/rates"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url)
+
+        return self._convert_response(response)
+
+    async def buy(self, id: str, **params) -> Order:
+        """Buy an Order."""
+        url = f"{self._instance_url(self._model_class, id)}/buy"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
@@ -1,5 +1,8 @@
 from easypost.models import Parcel
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class ParcelService(BaseService):
@@ -14,3 +17,17 @@ class ParcelService(BaseService):
     def retrieve(self, id: str) -> Parcel:
         """Retrieve a Parcel."""
         return self._retrieve_resource(self._model_class, id)
+
+
+class AsyncParcelService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Parcel.__name__
+
+    async def create(self, **params) -> Parcel:
+        """Create a Parcel."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def retrieve(self, id: str) -> Parcel:
+        """Retrieve a Parcel."""
+        return await self._retrieve_resource(self._model_class, id)
@@ -1,15 +1,20 @@
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Pickup
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class PickupService(BaseService):
@@ -43,7 +48,7 @@ class PickupService(BaseService):
         self._check_has_next_page(collection=pickups)
 
         params = {
-            "before_id": pickups["pickups"][-1].id,
+            "before_id": pickups["pickups"][-1]["id"],
             "page_size": page_size,
         }
 
@@ -52,13 +57,20 @@ class PickupService(BaseService):
 
         return self.all(**params)
 
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[Pickup]:
+        """Iterate over all Pickups page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "pickups", max_items, params, prefetch)
+
     def buy(self, id: str, **params) -> Pickup:
         """Buy a Pickup."""
         url = f"{self._instance_url(self._model_class, id)}/buy"
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def cancel(self, id: str, **params) -> Pickup:
         """Cancel a Pickup."""
@@ -66,4 +78,68 @@ class PickupService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
+
+
+class AsyncPickupService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Pickup.__name__
+
+    async def create(self, **params) -> Pickup:
+        """Create a Pickup."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Pickups."""
+        filters = {
+            "key": "pickups",
+        }
+
+        return await self._all_resources(self._model_class, filters, **params)
+
+    async def retrieve(self, id: str) -> Pickup:
+        """Retrieve a Pickup."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        pickups: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve the next page of the list Pickup response."""
+        self._check_has_next_page(collection=pickups)
+
+        params = {
+            "before_id": pickups["pickups"][-1]["id"],
+            "page_size": page_size,
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[Pickup]:
+        """Iterate over all Pickups page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "pickups", max_items, params, prefetch)
+
+    async def buy(self, id: str, **params) -> Pickup:
+        """Buy a Pickup."""
+        url = f"{self._instance_url(self._model_class, id)}/buy"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def cancel(self, id: str, **params) -> Pickup:
+        """Cancel a Pickup."""
+        url = f"{self._instance_url(self._model_class, id)}/cancel"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
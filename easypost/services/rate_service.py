@@ -1,5 +1,8 @@
 from easypost.models import Rate
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class RateService(BaseService):
@@ -10,3 +13,13 @@ class RateService(BaseService):
     def retrieve(self, id: str) -> Rate:
         """Retrieve a Rate."""
         return self._retrieve_resource(self._model_class, id)
+
+
+class AsyncRateService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Rate.__name__
+
+    async def retrieve(self, id: str) -> Rate:
+        """Retrieve a Rate."""
+        return await self._retrieve_resource(self._model_class, id)
@@ -1,24 +1,30 @@
-from copy import deepcopy
+import base64
+from copy import copy
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
     Optional,
 )
-
-import requests
+from urllib.parse import urlencode
 
 from easypost.constant import (
     _FILTERS_KEY,
     SEND_STRIPE_DETAILS_ERROR,
     TIMEOUT,
 )
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.errors import ExternalApiError
 from easypost.models import User
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
+from easypost.transports import TransportRequest
 
 
 class ReferralCustomerService(BaseService):
@@ -39,7 +45,7 @@ class ReferralCustomerService(BaseService):
             params=wrapped_params,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def update_email(self, id: str, email: str) -> None:
         """Update a referral customer.
@@ -74,7 +80,7 @@ class ReferralCustomerService(BaseService):
 
         response[_FILTERS_KEY] = filters  # Save the filters used to reference in potential get_next_page call
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def get_next_page(
         self,
@@ -86,7 +92,7 @@ class ReferralCustomerService(BaseService):
         self._check_has_next_page(collection=referral_customers)
 
         params = {
-            "before_id": referral_customers["referral_customers"][-1].id,
+            "before_id": referral_customers["referral_customers"][-1]["id"],
             "page_size": page_size,
         }
 
@@ -95,6 +101,13 @@ class ReferralCustomerService(BaseService):
 
         return self.all(**params)
 
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[User]:
+        """Iterate over all referral customers page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "referral_customers", max_items, params, prefetch)
+
     def add_credit_card(
         self,
         referral_api_key: str,
@@ -127,7 +140,7 @@ class ReferralCustomerService(BaseService):
             priority=priority,
         )
 
-        return convert_to_easypost_object(response)
+        return self._convert_response(response)
 
     def add_credit_card_from_stripe(
         self,
@@ -146,17 +159,13 @@ class ReferralCustomerService(BaseService):
             }
         }
 
-        # Override the API key to use the referral's for this single request
-        referral_client = deepcopy(self._client)
-        referral_client.api_key = referral_api_key
-
-        response = Requestor(referral_client).request(
+        response = Requestor(self._referral_client(referral_api_key)).request(
             method=RequestMethod.POST,
             params=params,
             url="/credit_cards",
         )
 
-        return convert_to_easypost_object(response)
+        return self._convert_response(response)
 
     def add_bank_account_from_stripe(
         self,
@@ -175,17 +184,23 @@ class ReferralCustomerService(BaseService):
             "priority": priority,
         }
 
-        # Override the API key to use the referral's for this single request
-        referral_client = deepcopy(self._client)
-        referral_client.api_key = referral_api_key
-
-        response = Requestor(referral_client).request(
+        response = Requestor(self._referral_client(referral_api_key)).request(
             method=RequestMethod.POST,
             params=params,
             url="/bank_accounts",
         )
 
-        return convert_to_easypost_object(response)
+        return self._convert_response(response)
+
+    def _referral_client(self, referral_api_key: str):
+        """Override the API key to use the referral's for a single request.
+
+        A shallow copy is used so the referral's requests share the pooled connections of the client.
+        """
+        referral_client = copy(self._client)
+        referral_client.api_key = referral_api_key
+
+        return referral_client
 
     def _retrieve_easypost_stripe_api_key(self) -> str:
         """Retrieve EasyPost's Stripe public API key."""
@@ -205,6 +220,9 @@ class ReferralCustomerService(BaseService):
         easypost_stripe_key: str,
     ) -> dict[str, Any]:
         """Get credit card token from Stripe."""
+        # Only imported when needed, `requests` is heavy to import for a rarely used call
+        import requests
+
         headers = {
             # This Stripe endpoint only accepts URL form encoded bodies
             "Content-type": "application/x-www-form-urlencoded",
@@ -246,11 +264,255 @@ class ReferralCustomerService(BaseService):
             }
         }
 
-        # Override the API key to use the referral's for this single request
-        referral_client = deepcopy(self._client)
+        response = Requestor(self._referral_client(referral_api_key)).request(
+            method=RequestMethod.POST,
+            params=params,
+            url="/credit_cards",
+        )
+
+        return response
+
+
+class AsyncReferralCustomerService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = User.__name__
+
+    async def create(self, **params) -> User:
+        """Create a referral customer.
+
+        This function requires the Partner User's API key.
+        """
+        wrapped_params = {"user": params}
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.POST,
+            url="/referral_customers",
+            params=wrapped_params,
+        )
+
+        return self._convert_response(response)
+
+    async def update_email(self, id: str, email: str) -> None:
+        """Update a referral customer.
+
+        This function requires the Partner User's API key.
+        """
+        url = f"/referral_customers/{id}"
+        wrapped_params = {
+            "user": {
+                "email": email,
+            }
+        }
+
+        await AsyncRequestor(self._client).request(
+            method=RequestMethod.PUT,
+            url=url,
+            params=wrapped_params,
+        )
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of referral customers.
+
+        This function requires the Partner User's API key.
+        """
+        filters = {
+            "key": "referral_customers",
+        }
+
+        url = "/referral_customers"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        response[_FILTERS_KEY] = filters  # Save the filters used to reference in potential get_next_page call
+
+        return self._convert_response(response)
+
+    async def get_next_page(
+        self,
+        referral_customers: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve next page of referral customers."""
+        self._check_has_next_page(collection=referral_customers)
+
+        params = {
+            "before_id": referral_customers["referral_customers"][-1]["id"],
+            "page_size": page_size,
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[User]:
+        """Iterate over all referral customers page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "referral_customers", max_items, params, prefetch)
+
+    async def add_credit_card(
+        self,
+        referral_api_key: str,
+        number: str,
+        expiration_month: int,
+        expiration_year: int,
+        cvc: str,
+        priority: str = "primary",
+    ) -> dict[str, Any]:
+        """Add a credit card to EasyPost for a ReferralCustomer without needing a Stripe account.
+
+        This function requires the ReferralCustomer User's API key.
+        """
+        easypost_stripe_api_key = await self._retrieve_easypost_stripe_api_key()
+
+        try:
+            stripe_token = await self._create_stripe_token(
+                number,
+                expiration_month,
+                expiration_year,
+                cvc,
+                easypost_stripe_api_key,
+            )
+        except Exception:
+            raise ExternalApiError(message=SEND_STRIPE_DETAILS_ERROR)
+
+        response = await self._create_easypost_credit_card(
+            referral_api_key,
+            stripe_token.get("id", ""),
+            priority=priority,
+        )
+
+        return self._convert_response(response)
+
+    async def add_credit_card_from_stripe(
+        self,
+        referral_api_key: str,
+        payment_method_id: str,
+        priority: str = "primary",
+    ) -> dict[str, Any]:
+        """Add a credit card to EasyPost for a ReferralCustomer with a payment method ID from Stripe.
+
+        This function requires the ReferralCustomer User's API key.
+        """
+        params = {
+            "credit_card": {
+                "payment_method_id": payment_method_id,
+                "priority": priority,
+            }
+        }
+
+        response = await AsyncRequestor(self._referral_client(referral_api_key)).request(
+            method=RequestMethod.POST,
+            params=params,
+            url="/credit_cards",
+        )
+
+        return self._convert_response(response)
+
+    async def add_bank_account_from_stripe(
+        self,
+        referral_api_key: str,
+        financial_connections_id: str,
+        mandate_data: dict[str, Any],
+        priority: str = "primary",
+    ) -> dict[str, Any]:
+        """Add a bank account to EasyPost for a ReferralCustomer.
+
+        This function requires the ReferralCustomer User's API key.
+        """
+        params = {
+            "financial_connections_id": financial_connections_id,
+            "mandate_data": mandate_data,
+            "priority": priority,
+        }
+
+        response = await AsyncRequestor(self._referral_client(referral_api_key)).request(
+            method=RequestMethod.POST,
+            params=params,
+            url="/bank_accounts",
+        )
+
+        return self._convert_response(response)
+
+    def _referral_client(self, referral_api_key: str):
+        """Override the API key to use the referral's for a single request.
+
+        A shallow copy is used so the referral's requests share the pooled connections of the client.
+        """
+        referral_client = copy(self._client)
         referral_client.api_key = referral_api_key
 
-        response = Requestor(referral_client).request(
+        return referral_client
+
+    async def _retrieve_easypost_stripe_api_key(self) -> str:
+        """Retrieve EasyPost's Stripe public API key."""
+        public_key = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url="/partners/stripe_public_key",
+        )
+
+        return public_key.get("public_key", "")
+
+    async def _create_stripe_token(
+        self,
+        number: str,
+        expiration_month: int,
+        expiration_year: int,
+        cvc: str,
+        easypost_stripe_key: str,
+    ) -> dict[str, Any]:
+        """Get credit card token from Stripe."""
+        headers = {
+            # This Stripe endpoint only accepts URL form encoded bodies
+            "Content-type": "application/x-www-form-urlencoded",
+        }
+
+        credit_card_dict = {
+            "card": {
+                "number": number,
+                "exp_month": expiration_month,
+                "exp_year": expiration_year,
+                "cvc": cvc,
+            }
+        }
+
+        form_encoded_params = Requestor.form_encode_params(credit_card_dict)
+        url = "https://api.stripe.com/v1/tokens"
+
+        credentials = base64.b64encode(f"{easypost_stripe_key}:".encode("utf-8")).decode("utf-8")
+        headers["Authorization"] = f"Basic {credentials}"
+
+        stripe_response = await self._client._transport.send(
+            TransportRequest(
+                method="POST",
+                url=f"{url}?{urlencode(form_encoded_params)}",
+                headers=headers,
+                body=None,
+                timeout=TIMEOUT,
+            )
+        )
+
+        return self._client._json_codec.loads(stripe_response.body)
+
+    async def _create_easypost_credit_card(
+        self,
+        referral_api_key: str,
+        stripe_object_id: str,
+        priority: str = "primary",
+    ) -> dict[str, Any]:
+        """Submit Stripe credit card token to EasyPost."""
+        params = {
+            "credit_card": {
+                "stripe_object_id": stripe_object_id,
+                "priority": priority,
+            }
+        }
+
+        response = await AsyncRequestor(self._referral_client(referral_api_key)).request(
             method=RequestMethod.POST,
             params=params,
             url="/credit_cards",
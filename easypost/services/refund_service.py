@@ -1,10 +1,17 @@
+import datetime
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
     Optional,
+    Union,
 )
 
 from easypost.models import Refund
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class RefundService(BaseService):
@@ -38,7 +45,7 @@ class RefundService(BaseService):
         self._check_has_next_page(collection=refunds)
 
         params = {
-            "before_id": refunds["refunds"][-1].id,
+            "before_id": refunds["refunds"][-1]["id"],
             "page_size": page_size,
         }
 
@@ -46,3 +53,73 @@ class RefundService(BaseService):
             params.update(optional_params)
 
         return self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[Refund]:
+        """Iterate over all Refunds page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "refunds", max_items, params, prefetch)
+
+    def iter_all_sharded(
+        self,
+        start_datetime: Union[str, datetime.datetime],
+        end_datetime: Union[str, datetime.datetime],
+        workers: int = 4,
+        max_items: Optional[int] = None,
+        **params,
+    ) -> Iterator[Refund]:
+        """Iterate over all Refunds created between `start_datetime` and `end_datetime`, newest first.
+
+        The range is split into time windows paginated concurrently on `workers` threads, dense windows being split
+        further, and merged back in order without duplicates.
+        """
+        return self._iter_all_sharded(self.all, "refunds", start_datetime, end_datetime, workers, max_items, params)
+
+
+class AsyncRefundService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Refund.__name__
+
+    async def create(self, **params) -> Refund:
+        """Create a Shipment Refund."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Shipment Refunds."""
+        filters = {
+            "key": "refunds",
+        }
+
+        return await self._all_resources(self._model_class, filters, **params)
+
+    async def retrieve(self, id: str) -> Refund:
+        """Retrieve a Shipment Refund."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        refunds: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve the next page of the list Refund response."""
+        self._check_has_next_page(collection=refunds)
+
+        params = {
+            "before_id": refunds["refunds"][-1]["id"],
+            "page_size": page_size,
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[Refund]:
+        """Iterate over all Refunds page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "refunds", max_items, params, prefetch)
@@ -1,5 +1,7 @@
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
     Optional,
 )
 
@@ -7,14 +9,17 @@ from easypost.constant import (
     _FILTERS_KEY,
     MISSING_PARAMETER_ERROR,
 )
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.errors import MissingParameterError
 from easypost.models import Report
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class ReportService(BaseService):
@@ -33,7 +38,7 @@ class ReportService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def all(self, **params) -> dict[str, Any]:
         """Retrieve a list of Reports."""
@@ -53,7 +58,7 @@ class ReportService(BaseService):
 
         response[_FILTERS_KEY] = filters  # Save the filters used to reference in potential get_next_page call
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def retrieve(self, id: str) -> Report:
         """Retrieve a Report."""
@@ -69,7 +74,7 @@ class ReportService(BaseService):
         self._check_has_next_page(collection=reports)
 
         params = {
-            "before_id": reports["reports"][-1].id,
+            "before_id": reports["reports"][-1]["id"],
             "page_size": page_size,
             "type": reports.get(_FILTERS_KEY, {}).get("type"),  # Use the same type as the last page
         }
@@ -78,3 +83,80 @@ class ReportService(BaseService):
             params.update(optional_params)
 
         return self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[Report]:
+        """Iterate over all Reports page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "reports", max_items, params, prefetch)
+
+
+class AsyncReportService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Report.__name__
+
+    async def create(self, **params) -> Report:
+        """Create a Report."""
+        report_type = params.pop("type")
+
+        if report_type is None:
+            raise MissingParameterError(MISSING_PARAMETER_ERROR.format("type"))
+
+        url = f"{self._class_url(self._model_class)}/{report_type}"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Reports."""
+        # Capture some of the parameters used for later reference
+        filters = {
+            "key": "reports",
+            "type": params.get("type", None),
+        }
+
+        report_type = params.pop("type")
+        if report_type is None:
+            raise MissingParameterError(MISSING_PARAMETER_ERROR.format("type"))
+
+        url = f"{self._class_url(self._model_class)}/{report_type}"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        response[_FILTERS_KEY] = filters  # Save the filters used to reference in potential get_next_page call
+
+        return self._convert_response(response)
+
+    async def retrieve(self, id: str) -> Report:
+        """Retrieve a Report."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        reports: dict[str, Any],
+        page_size: Optional[int] = None,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve the next page of the list Report response."""
+        self._check_has_next_page(collection=reports)
+
+        params = {
+            "before_id": reports["reports"][-1]["id"],
+            "page_size": page_size,
+            "type": reports.get(_FILTERS_KEY, {}).get("type"),  # Use the same type as the last page
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[Report]:
+        """Iterate over all Reports page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "reports", max_items, params, prefetch)
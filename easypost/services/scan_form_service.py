@@ -1,10 +1,15 @@
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
     Optional,
 )
 
 from easypost.models import ScanForm
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class ScanFormService(BaseService):
@@ -38,7 +43,7 @@ class ScanFormService(BaseService):
         self._check_has_next_page(collection=scan_forms)
 
         params = {
-            "before_id": scan_forms["scan_forms"][-1].id,
+            "before_id": scan_forms["scan_forms"][-1]["id"],
             "page_size": page_size,
         }
 
@@ -46,3 +51,58 @@ class ScanFormService(BaseService):
             params.update(optional_params)
 
         return self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[ScanForm]:
+        """Iterate over all ScanForms page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "scan_forms", max_items, params, prefetch)
+
+
+class AsyncScanFormService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = ScanForm.__name__
+
+    async def create(self, **params) -> ScanForm:
+        """Create a ScanForm."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of ScanForms."""
+        filters = {
+            "key": "scan_forms",
+        }
+
+        return await self._all_resources(self._model_class, filters, **params)
+
+    async def retrieve(self, id: str) -> ScanForm:
+        """Retrieve a ScanForm."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        scan_forms: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve the next page of the list ScanForm response."""
+        self._check_has_next_page(collection=scan_forms)
+
+        params = {
+            "before_id": scan_forms["scan_forms"][-1]["id"],
+            "page_size": page_size,
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[ScanForm]:
+        """Iterate over all ScanForms page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "scan_forms", max_items, params, prefetch)
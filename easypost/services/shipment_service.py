@@ -1,19 +1,33 @@
+import datetime
 from typing import (
     Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
     Optional,
+    Union,
 )
 
+from easypost.bulk_buy import (
+    BulkBuy,
+    RatePolicy,
+    RateSelector,
+    create_and_buy_many,
+)
 from easypost.constant import _FILTERS_KEY
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import (
     Rate,
     Shipment,
 )
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 from easypost.util import get_lowest_smart_rate
 
 
@@ -31,7 +45,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def all(self, **params) -> dict[str, Any]:
         """Retrieve a list of Shipments."""
@@ -57,7 +71,7 @@ class ShipmentService(BaseService):
         self._check_has_next_page(collection=shipments)
 
         params = {
-            "before_id": shipments["shipments"][-1].id,
+            "before_id": shipments["shipments"][-1]["id"],
             "page_size": page_size,
             # Use the same include_children as the last page
             "include_children": shipments.get(_FILTERS_KEY, {}).get("include_children"),
@@ -70,13 +84,35 @@ class ShipmentService(BaseService):
 
         return self.all(**params)
 
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[Shipment]:
+        """Iterate over all Shipments page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "shipments", max_items, params, prefetch)
+
+    def iter_all_sharded(
+        self,
+        start_datetime: Union[str, datetime.datetime],
+        end_datetime: Union[str, datetime.datetime],
+        workers: int = 4,
+        max_items: Optional[int] = None,
+        **params,
+    ) -> Iterator[Shipment]:
+        """Iterate over all Shipments created between `start_datetime` and `end_datetime`, newest first.
+
+        The range is split into time windows paginated concurrently on `workers` threads, dense windows being split
+        further, and merged back in order without duplicates.
+        """
+        return self._iter_all_sharded(self.all, "shipments", start_datetime, end_datetime, workers, max_items, params)
+
     def regenerate_rates(self, id: str) -> dict[str, list[Rate]]:
         """Regenerate Rates for a Shipment."""
         url = f"{self._instance_url(self._model_class, id)}/rerate"
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def get_smart_rates(self, id: str) -> list[Rate]:
         """Get SmartRates for a Shipment."""
@@ -84,7 +120,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url)
 
-        return convert_to_easypost_object(response=response.get("result", []))
+        return self._convert_response(response.get("result", []))
 
     def buy(
         self,
@@ -99,7 +135,22 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
+
+    def create_and_buy_many(
+        self,
+        shipments: Iterable[dict[str, Any]],
+        rate_policy: Optional[Union[RatePolicy, RateSelector]] = None,
+        concurrency: int = 8,
+        **params,
+    ) -> BulkBuy:
+        """Create and buy many Shipments, `concurrency` at a time, buying the rate selected by `rate_policy`.
+
+        Iterate over the returned `BulkBuy` to get the result of each Shipment as it finishes, failures included, and
+        read its `stats` for the throughput of the run. `rate_policy` is a `RatePolicy` (the lowest rate of any carrier
+        by default) or a function returning the rate to buy of a created Shipment.
+        """
+        return create_and_buy_many(self, shipments, rate_policy, concurrency, params)
 
     def refund(self, id: str, **params) -> Shipment:
         """Refund a Shipment."""
@@ -107,7 +158,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def insure(self, id: str, **params) -> Shipment:
         """Insure a Shipment."""
@@ -115,7 +166,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def label(self, id: str, **params) -> Shipment:
         """Convert the label format of a Shipment."""
@@ -123,7 +174,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def lowest_smart_rate(self, id: str, delivery_days: int, delivery_accuracy: str) -> Rate:
         """Get the lowest SmartRate of a Shipment."""
@@ -141,7 +192,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def retrieve_estimated_delivery_date(self, id: str, planned_ship_date: str) -> list[dict[str, Any]]:
         """Retrieves the estimated delivery date of each Rate via SmartRate."""
@@ -150,7 +201,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response.get("rates", []))
+        return self._convert_response(response.get("rates", []))
 
     def recommend_ship_date(self, id: str, desired_delivery_date: str) -> list[dict[str, Any]]:
         """Retrieve a recommended ship date for an existing Shipment via the Precision Shipping API,
@@ -160,7 +211,7 @@ class ShipmentService(BaseService):
         params = {"desired_delivery_date": desired_delivery_date}
         response = Requestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
 
-        return convert_to_easypost_object(response=response.get("rates", []))
+        return self._convert_response(response.get("rates", []))
 
     def create_and_buy_luma(
         self,
@@ -174,7 +225,7 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def buy_luma(
         self,
@@ -186,4 +237,183 @@ class ShipmentService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
+
+
+class AsyncShipmentService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Shipment.__name__
+
+    async def create(self, **params) -> Shipment:
+        """Create a Shipment."""
+        url = self._class_url(self._model_class)
+        wrapped_params = {
+            self._snakecase_name(self._model_class): params,
+        }
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Shipments."""
+        filters = {
+            "key": "shipments",
+            "include_children": params.get("include_children"),
+            "purchased": params.get("purchased"),
+        }
+
+        return await self._all_resources(self._model_class, filters, **params)
+
+    async def retrieve(self, id: str) -> Shipment:
+        """Retrieve a Shipment."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        shipments: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Get next page of shipment collection."""
+        self._check_has_next_page(collection=shipments)
+
+        params = {
+            "before_id": shipments["shipments"][-1]["id"],
+            "page_size": page_size,
+            # Use the same include_children as the last page
+            "include_children": shipments.get(_FILTERS_KEY, {}).get("include_children"),
+            # Use the same purchased as the last page
+            "purchased": shipments.get(_FILTERS_KEY, {}).get("purchased"),
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[Shipment]:
+        """Iterate over all Shipments page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "shipments", max_items, params, prefetch)
+
+    async def regenerate_rates(self, id: str) -> dict[str, list[Rate]]:
+        """Regenerate Rates for a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/rerate"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url)
+
+        return self._convert_response(response)
+
+    async def get_smart_rates(self, id: str) -> list[Rate]:
+        """Get SmartRates for a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/smartrate"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url)
+
+        return self._convert_response(response.get("result", []))
+
+    async def buy(
+        self,
+        id: str,
+        end_shipper_id: Optional[str] = None,
+        **params,
+    ) -> Shipment:
+        """Buy a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/buy"
+        if end_shipper_id:
+            params["end_shipper_id"] = end_shipper_id
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def refund(self, id: str, **params) -> Shipment:
+        """Refund a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/refund"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def insure(self, id: str, **params) -> Shipment:
+        """Insure a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/insure"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def label(self, id: str, **params) -> Shipment:
+        """Convert the label format of a Shipment."""
+        url = f"{self._instance_url(self._model_class, id)}/label"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def lowest_smart_rate(self, id: str, delivery_days: int, delivery_accuracy: str) -> Rate:
+        """Get the lowest SmartRate of a Shipment."""
+        smartrates = await self.get_smart_rates(id)
+        lowest_smart_rate = get_lowest_smart_rate(smartrates, delivery_days, delivery_accuracy.lower())
+
+        return lowest_smart_rate
+
+    async def generate_form(self, id: str, form_type: str, form_options: Optional[dict[str, Any]] = {}) -> Shipment:
+        """Generate a form for a Shipment."""
+        params = {"type": form_type}
+        params.update(form_options)  # type: ignore
+        wrapped_params = {"form": params}
+        url = f"{self._instance_url(self._model_class, id)}/forms"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response)
+
+    async def retrieve_estimated_delivery_date(self, id: str, planned_ship_date: str) -> list[dict[str, Any]]:
+        """Retrieves the estimated delivery date of each Rate via SmartRate."""
+        url = f"{self._instance_url(self._model_class, id)}/smartrate/delivery_date"
+        wrapped_params = {"planned_ship_date": planned_ship_date}
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=wrapped_params)
+
+        return self._convert_response(response.get("rates", []))
+
+    async def recommend_ship_date(self, id: str, desired_delivery_date: str) -> list[dict[str, Any]]:
+        """Retrieve a recommended ship date for an existing Shipment via the Precision Shipping API,
+        based on a specific desired delivery date.
+        """
+        url = f"{self._instance_url(self._model_class, id)}/smartrate/precision_shipping"
+        params = {"desired_delivery_date": desired_delivery_date}
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.GET, url=url, params=params)
+
+        return self._convert_response(response.get("rates", []))
+
+    async def create_and_buy_luma(
+        self,
+        **params: dict[str, Any],
+    ) -> Shipment:
+        """Create and buy a Luma Shipment in one call."""
+        url = f"{self._class_url(self._model_class)}/luma"
+        wrapped_params = {
+            self._snakecase_name(self._model_class): params,
+        }
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=wrapped_params)
+
+        return self._convert_response(response)
+
+    async def buy_luma(
+        self,
+        id: str,
+        **params: dict[str, Any],
+    ) -> Shipment:
+        """Buy a Shipment with Luma."""
+        url = f"{self._instance_url(self._model_class, id)}/luma"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
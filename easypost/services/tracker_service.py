@@ -1,10 +1,19 @@
-from typing import Any, Optional
+import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterator,
+    Optional,
+    Union,
+)
 
 from easypost.constant import _FILTERS_KEY
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Tracker
-from easypost.requestor import RequestMethod, Requestor
-from easypost.services.base_service import BaseService
+from easypost.requestor import AsyncRequestor, RequestMethod, Requestor
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class TrackerService(BaseService):
@@ -36,7 +45,7 @@ class TrackerService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def retrieve(self, id: str) -> Tracker:
         """Retrieve a Tracker."""
@@ -52,7 +61,7 @@ class TrackerService(BaseService):
         self._check_has_next_page(collection=trackers)
 
         params = {
-            "before_id": trackers["trackers"][-1].id,
+            "before_id": trackers["trackers"][-1]["id"],
             "page_size": page_size,
             "tracking_code": trackers.get(_FILTERS_KEY, {}).get(
                 "tracking_code"
@@ -65,6 +74,98 @@ class TrackerService(BaseService):
 
         return self.all(**params)
 
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[Tracker]:
+        """Iterate over all Trackers page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "trackers", max_items, params, prefetch)
+
+    def iter_all_sharded(
+        self,
+        start_datetime: Union[str, datetime.datetime],
+        end_datetime: Union[str, datetime.datetime],
+        workers: int = 4,
+        max_items: Optional[int] = None,
+        **params,
+    ) -> Iterator[Tracker]:
+        """Iterate over all Trackers created between `start_datetime` and `end_datetime`, newest first.
+
+        The range is split into time windows paginated concurrently on `workers` threads, dense windows being split
+        further, and merged back in order without duplicates.
+        """
+        return self._iter_all_sharded(self.all, "trackers", start_datetime, end_datetime, workers, max_items, params)
+
     def delete(self, id: str) -> None:
         """Delete a Tracker."""
         self._delete_resource(self._model_class, id)
+
+
+class AsyncTrackerService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Tracker.__name__
+
+    async def create(self, **params) -> Tracker:
+        """Create a Tracker."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Trackers."""
+        filters = {
+            "key": "trackers",
+            "tracking_code": params.get("tracking_code"),
+            "tracking_codes": params.get("tracking_codes"),
+            "carrier": params.get("carrier"),
+        }
+        # Make Ruby on Rails happy with proper URL encoding
+        if params.get("tracking_codes"):
+            params["tracking_codes[]"] = params.pop("tracking_codes")
+
+        return await self._all_resources(self._model_class, filters, **params)
+
+    async def retrieve_batch(self, **params) -> Tracker:
+        """Retrieve a batch of Trackers."""
+        url = "/trackers/batch"
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.POST, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def retrieve(self, id: str) -> Tracker:
+        """Retrieve a Tracker."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def get_next_page(
+        self,
+        trackers: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve the next page of the list Tracker response."""
+        self._check_has_next_page(collection=trackers)
+
+        params = {
+            "before_id": trackers["trackers"][-1]["id"],
+            "page_size": page_size,
+            "tracking_code": trackers.get(_FILTERS_KEY, {}).get(
+                "tracking_code"
+            ),  # Use the same tracking_code as the last page
+            "carrier": trackers.get(_FILTERS_KEY, {}).get("carrier"),  # Use the same carrier as the last page
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all(**params)
+
+    def iter_all(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[Tracker]:
+        """Iterate over all Trackers page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(self.all, self.get_next_page, "trackers", max_items, params, prefetch)
+
+    async def delete(self, id: str) -> None:
+        """Delete a Tracker."""
+        await self._delete_resource(self._model_class, id)
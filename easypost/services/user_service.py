@@ -1,15 +1,20 @@
 from typing import (
     Any,
+    AsyncIterator,
+    Iterator,
     Optional,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import User
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class UserService(BaseService):
@@ -40,7 +45,7 @@ class UserService(BaseService):
             url=url,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def update(self, id: str, **params) -> User:
         """Update a User."""
@@ -59,7 +64,7 @@ class UserService(BaseService):
             url=url,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def update_brand(self, id: str, **params) -> User:
         """Update a User's Brand."""
@@ -71,7 +76,7 @@ class UserService(BaseService):
             params=params,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def all_children(self, **params) -> dict[str, Any]:
         """Retrieve a paginated list of children from the API."""
@@ -82,7 +87,7 @@ class UserService(BaseService):
             params=params,
         )
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def get_next_page_of_children(
         self,
@@ -94,7 +99,7 @@ class UserService(BaseService):
         self._check_has_next_page(collection=children)
 
         params = {
-            "after_id": children["children"][-1].id,
+            "after_id": children["children"][-1]["id"],
             "page_size": page_size,
         }
 
@@ -102,3 +107,113 @@ class UserService(BaseService):
             params.update(optional_params)
 
         return self.all_children(**params)
+
+    def iter_all_children(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> Iterator[User]:
+        """Iterate over all children page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(
+            self.all_children, self.get_next_page_of_children, "children", max_items, params, prefetch
+        )
+
+
+class AsyncUserService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = User.__name__
+
+    async def create(self, **params) -> User:
+        """Create a User."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Users."""
+        return await self._all_resources(self._model_class, **params)
+
+    async def retrieve(self, id: Optional[str] = None) -> User:
+        """Retrieve a User.
+
+        If no id is passed, retrieve the authenticated User.
+        """
+        if id:
+            url = self._instance_url(self._model_class, id)
+        else:
+            url = self._class_url(self._model_class)
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url=url,
+        )
+
+        return self._convert_response(response)
+
+    async def update(self, id: str, **params) -> User:
+        """Update a User."""
+        return await self._update_resource(self._model_class, id, **params)
+
+    async def delete(self, id: str) -> None:
+        """Delete a User."""
+        await self._delete_resource(self._model_class, id)
+
+    async def retrieve_me(self) -> User:
+        """Retrieve the authenticated User."""
+        url = self._class_url(self._model_class)
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url=url,
+        )
+
+        return self._convert_response(response)
+
+    async def update_brand(self, id: str, **params) -> User:
+        """Update a User's Brand."""
+        url = self._instance_url(self._model_class, id) + "/brand"
+
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.PATCH,
+            url=url,
+            params=params,
+        )
+
+        return self._convert_response(response)
+
+    async def all_children(self, **params) -> dict[str, Any]:
+        """Retrieve a paginated list of children from the API."""
+        url = "/users/children"
+        response = await AsyncRequestor(self._client).request(
+            method=RequestMethod.GET,
+            url=url,
+            params=params,
+        )
+
+        return self._convert_response(response)
+
+    async def get_next_page_of_children(
+        self,
+        children: dict[str, Any],
+        page_size: int,
+        optional_params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve the next page of the list Children response."""
+        self._check_has_next_page(collection=children)
+
+        params = {
+            "after_id": children["children"][-1]["id"],
+            "page_size": page_size,
+        }
+
+        if optional_params:
+            params.update(optional_params)
+
+        return await self.all_children(**params)
+
+    def iter_all_children(self, max_items: Optional[int] = None, prefetch: int = 0, **params) -> AsyncIterator[User]:
+        """Iterate over all children page by page, stopping after the last page or `max_items` items.
+
+        With `prefetch`, up to that many of the next pages are retrieved in the background while a page is consumed.
+        """
+        return self._iter_all_resources(
+            self.all_children, self.get_next_page_of_children, "children", max_items, params, prefetch
+        )
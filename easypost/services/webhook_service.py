@@ -2,13 +2,16 @@ from typing import (
     Any,
 )
 
-from easypost.easypost_object import convert_to_easypost_object
 from easypost.models import Webhook
 from easypost.requestor import (
+    AsyncRequestor,
     RequestMethod,
     Requestor,
 )
-from easypost.services.base_service import BaseService
+from easypost.services.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
 
 
 class WebhookService(BaseService):
@@ -34,8 +37,38 @@ class WebhookService(BaseService):
 
         response = Requestor(self._client).request(method=RequestMethod.PATCH, url=url, params=params)
 
-        return convert_to_easypost_object(response=response)
+        return self._convert_response(response)
 
     def delete(self, id: str) -> None:
         """Delete a Webhook."""
         self._delete_resource(self._model_class, id)
+
+
+class AsyncWebhookService(AsyncBaseService):
+    def __init__(self, client):
+        self._client = client
+        self._model_class = Webhook.__name__
+
+    async def create(self, **params) -> Webhook:
+        """Create a Webhook."""
+        return await self._create_resource(self._model_class, **params)
+
+    async def all(self, **params) -> dict[str, Any]:
+        """Retrieve a list of Webhooks."""
+        return await self._all_resources(self._model_class, **params)
+
+    async def retrieve(self, id: str) -> Webhook:
+        """Retrieve a Webhook."""
+        return await self._retrieve_resource(self._model_class, id)
+
+    async def update(self, id: str, **params) -> Webhook:
+        """Update a Webhook."""
+        url = self._instance_url(self._model_class, id)
+
+        response = await AsyncRequestor(self._client).request(method=RequestMethod.PATCH, url=url, params=params)
+
+        return self._convert_response(response)
+
+    async def delete(self, id: str) -> None:
+        """Delete a Webhook."""
+        await self._delete_resource(self._model_class, id)
@@ -0,0 +1,90 @@
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class _Call:
+    """A call in flight that other callers with the same key wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def _share(result: Any) -> Any:
+    # Callers may add keys to the top level of a response (eg: pagination filters), give each their own copy
+    return dict(result) if isinstance(result, dict) else result
+
+
+class SingleFlight:
+    """De-duplicates identical calls in flight: the first caller makes the call and the others wait for it and
+    share its result (or its error).
+
+    Works across threads with `do` and across the tasks of event loops with `do_async`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._async_calls: dict[Hashable, asyncio.Task] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Return the result of `func`, unless a call with the same key is in flight, then share its result."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return _share(call.result)
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of awaiting `func()`, unless a call with the same key is in flight on the running
+        event loop, then share its result.
+        """
+        import asyncio  # Only needed by async clients, deferred to keep `import easypost` fast
+
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+
+        task = self._async_calls.get(loop_key)
+        if task is not None:
+            # Shield the shared call so cancelling a follower doesn't cancel it for everyone
+            return _share(await asyncio.shield(task))
+
+        # The call runs in its own task so cancelling the caller that started it doesn't cancel it for the others
+        task = self._async_calls[loop_key] = asyncio.ensure_future(func())
+
+        def finish(task: asyncio.Task) -> None:
+            del self._async_calls[loop_key]
+            if not task.cancelled():
+                task.exception()  # Mark the error as retrieved when nobody was waiting for it anymore
+
+        task.add_done_callback(finish)
+
+        return await asyncio.shield(task)
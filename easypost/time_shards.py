@@ -0,0 +1,154 @@
+import collections
+import concurrent.futures
+import datetime
+import math
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+# Adjacent windows overlap by this much so no object falls between them whether the API treats `start_datetime` and
+# `end_datetime` as inclusive or not, the objects listed twice are dropped when the windows are merged
+WINDOW_OVERLAP = datetime.timedelta(seconds=1)
+
+# Windows shorter than this are paginated as is, however dense they are
+MIN_WINDOW = datetime.timedelta(seconds=2)
+
+# A window estimated to hold more than this many pages past its first page is split into smaller windows
+PAGES_PER_WINDOW = 5
+
+# How many windows per worker are paginated ahead of the caller, bounding how many pages an export holds in memory
+WINDOWS_AHEAD_PER_WORKER = 2
+
+# A page of a window: (start, end, before_id) -> the page listing the objects of the window
+FetchPage = Callable[[datetime.datetime, datetime.datetime, Optional[str]], Any]
+
+
+class _Window:
+    """The objects of a time window, newest first: those of its own pages, followed by those of the windows it was
+    split into (yet to be paginated), in order."""
+
+    def __init__(self, items: list[Any], children: list[tuple[datetime.datetime, datetime.datetime]]):
+        self.items = items
+        self.children = children
+
+
+def parse_datetime(value: Union[str, datetime.datetime]) -> datetime.datetime:
+    """Parse a datetime or an ISO 8601 string (such as `created_at` values) to an aware datetime, UTC by default."""
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+
+    return value
+
+
+def format_datetime(value: datetime.datetime) -> str:
+    """Format a datetime as the ISO 8601 UTC timestamp the API expects."""
+    return value.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def split_range(
+    start: datetime.datetime,
+    end: datetime.datetime,
+    count: int,
+) -> list[tuple[datetime.datetime, datetime.datetime]]:
+    """Split a time range into `count` windows of equal length, newest first, each overlapping the next one."""
+    step = (end - start) / count
+    boundaries = [end - step * index for index in range(count)] + [start]
+
+    return [
+        (boundaries[index + 1], min(end, boundaries[index] + WINDOW_OVERLAP if index else end))
+        for index in range(count)
+    ]
+
+
+def iter_time_shards(
+    fetch_page: FetchPage,
+    key: str,
+    start_datetime: Union[str, datetime.datetime],
+    end_datetime: Union[str, datetime.datetime],
+    workers: int,
+    max_items: Optional[int] = None,
+) -> Iterator[Any]:
+    """Iterate over the objects of a time range, newest first, paginating windows of the range concurrently.
+
+    The range is split in one window per worker. A window whose first page shows it holds more than
+    `PAGES_PER_WINDOW` pages is split again in proportion to the density of its objects, so sparse periods cost a
+    single request and dense ones are spread over the workers. Windows are merged back in order, without the
+    objects listed by two overlapping windows.
+
+    Only the next `workers * WINDOWS_AHEAD_PER_WORKER` windows in the order they are consumed are paginated ahead of
+    the caller, so an export holds a bounded number of pages in memory however long its range is.
+    """
+    start = parse_datetime(start_datetime)
+    end = parse_datetime(end_datetime)
+    if (max_items is not None and max_items <= 0) or end <= start:
+        return
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="easypost-shard")
+
+    def paginate(window_start: datetime.datetime, window_end: datetime.datetime) -> _Window:
+        page = fetch_page(window_start, window_end, None)
+        items = list(page.get(key) or [])
+        if not page.get("has_more", False) or not items:
+            return _Window(items, [])
+
+        newest = parse_datetime(items[0]["created_at"])
+        oldest = parse_datetime(items[-1]["created_at"])
+        remaining = oldest - window_start
+        if remaining > MIN_WINDOW and newest > oldest:
+            # Estimate how many objects are left from the density of the first page
+            remaining_pages = remaining / (newest - oldest)
+            if remaining_pages > PAGES_PER_WINDOW:
+                count = min(math.ceil(remaining_pages / PAGES_PER_WINDOW), workers * 2)
+                return _Window(items, split_range(window_start, oldest + WINDOW_OVERLAP, count))
+
+        while page.get("has_more", False) and page.get(key):
+            page = fetch_page(window_start, window_end, items[-1]["id"])
+            items.extend(page.get(key) or [])
+
+        return _Window(items, [])
+
+    # The windows left to consume, in order: [(start, end), future of its pagination once scheduled]
+    windows: collections.deque = collections.deque([window, None] for window in split_range(start, end, workers))
+
+    def schedule() -> None:
+        for index, window in enumerate(windows):
+            if index == workers * WINDOWS_AHEAD_PER_WORKER:
+                break
+            if window[1] is None:
+                window[1] = executor.submit(paginate, *window[0])
+
+    def merge() -> Iterator[Any]:
+        schedule()
+        while windows:
+            window = windows.popleft()[1].result()
+            # The windows this one was split into come next, start paginating them while its objects are consumed
+            windows.extendleft([child, None] for child in reversed(window.children))
+            schedule()
+            yield from window.items
+
+    # The IDs of the latest objects, only objects created within the overlap of two windows can be listed twice
+    recent_ids: set[str] = set()
+    recent: collections.deque = collections.deque()
+    count = 0
+    try:
+        for item in merge():
+            created_at = parse_datetime(item["created_at"])
+            while recent and recent[0][0] > created_at + WINDOW_OVERLAP:
+                recent_ids.discard(recent.popleft()[1])
+            if item["id"] in recent_ids:
+                continue
+            recent_ids.add(item["id"])
+            recent.append((created_at, item["id"]))
+
+            yield item
+            count += 1
+            if count == max_items:
+                return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,11 @@
+# flake8: noqa
+from easypost.transports.transport import (
+    AsyncTransport,
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+from easypost.transports.httpx_transport import HttpxTransport
+from easypost.transports.requests_transport import RequestsTransport
+from easypost.transports.urlfetch_transport import UrlfetchTransport
+from easypost.transports.urllib3_transport import Urllib3Transport
@@ -0,0 +1,54 @@
+from typing import Any, Optional
+
+from easypost.constant import (
+    MAX_CONNECTIONS,
+    MISSING_HTTPX_ERROR,
+    SUPPORT_EMAIL,
+    TIMEOUT_ERROR,
+)
+from easypost.errors import TimeoutError
+from easypost.transports.transport import (
+    AsyncTransport,
+    TransportRequest,
+    TransportResponse,
+)
+
+
+class HttpxTransport(AsyncTransport):
+    """Send requests via a pooled `httpx.AsyncClient`, the default transport of the `AsyncEasyPostClient`."""
+
+    def __init__(self, max_connections: int = MAX_CONNECTIONS, httpx_client: Optional[Any] = None):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(MISSING_HTTPX_ERROR.format(SUPPORT_EMAIL))
+
+        self._httpx = httpx
+        # Retry connection failures the same way the `requests` adapter of the synchronous client does
+        self._httpx_client = httpx_client or httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+            ),
+        )
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        """Make a request by using the `httpx` library."""
+        try:
+            result = await self._httpx_client.request(
+                method=request.method,
+                url=request.url,
+                headers=request.headers,
+                content=request.body,
+                timeout=request.timeout,
+            )
+        except self._httpx.TimeoutException:
+            raise TimeoutError(TIMEOUT_ERROR)
+
+        return TransportResponse(status=result.status_code, headers=result.headers, body=result.content)
+
+    async def close(self) -> None:
+        await self._httpx_client.aclose()
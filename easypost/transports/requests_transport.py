@@ -0,0 +1,88 @@
+import threading
+
+from easypost.constant import (
+    API_VERSION,
+    INVALID_REQUESTS_VERSION_ERROR,
+    SUPPORT_EMAIL,
+    TIMEOUT_ERROR,
+)
+from easypost.errors import TimeoutError
+from easypost.transports.transport import (
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+
+
+class RequestsTransport(Transport):
+    """Send requests via a pooled `requests.Session`, the default transport of the `EasyPostClient`."""
+
+    def __init__(self, api_base: str, max_retries: int = 3):
+        try:
+            import requests
+
+            self._requests = requests
+        except Exception:
+            raise ImportError(INVALID_REQUESTS_VERSION_ERROR.format(SUPPORT_EMAIL))
+
+        self._api_base = api_base
+        self._max_retries = max_retries
+        self._session_instance = None
+        self._session_lock = threading.Lock()
+
+        try:
+            requests_version = requests.__version__
+            major_version, _, _ = [int(i) for i in requests_version.split(".")]
+        except Exception:
+            raise ImportError(INVALID_REQUESTS_VERSION_ERROR.format(SUPPORT_EMAIL))
+        else:
+            if major_version < 1:
+                raise ImportError(INVALID_REQUESTS_VERSION_ERROR.format(SUPPORT_EMAIL))
+
+    def __getstate__(self) -> dict:
+        """Copy the settings of the transport only, the module, lock and session can't be copied or pickled."""
+        state = self.__dict__.copy()
+        del state["_requests"], state["_session_lock"]
+        state["_session_instance"] = None
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        import requests
+
+        self.__dict__.update(state)
+        self._requests = requests
+        self._session_lock = threading.Lock()
+
+    @property
+    def _session(self):
+        """The pooled session, only built when the first request is sent so creating a client stays cheap."""
+        if self._session_instance is None:
+            with self._session_lock:
+                if self._session_instance is None:
+                    session = self._requests.Session()
+                    requests_http_adapter = self._requests.adapters.HTTPAdapter(max_retries=self._max_retries)
+                    session.mount(prefix=self._api_base.split(f"/{API_VERSION}")[0], adapter=requests_http_adapter)
+                    self._session_instance = session
+
+        return self._session_instance
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Make a request by using the `requests` library."""
+        try:
+            result = self._session.request(
+                method=request.method,
+                url=request.url,
+                headers=request.headers,
+                data=request.body,
+                timeout=request.timeout,
+                verify=True,
+            )
+        except self._requests.exceptions.Timeout:
+            raise TimeoutError(TIMEOUT_ERROR)
+
+        return TransportResponse(status=result.status_code, headers=result.headers, body=result.content)
+
+    def close(self) -> None:
+        if self._session_instance is not None:
+            self._session_instance.close()
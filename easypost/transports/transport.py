@@ -0,0 +1,59 @@
+from typing import (
+    Any,
+    Mapping,
+    NamedTuple,
+    Optional,
+)
+
+
+class TransportRequest(NamedTuple):
+    """A request that has been fully prepared by the requestor and is ready to be sent over the wire.
+
+    The `headers` may be shared by several requests and must not be modified.
+    """
+
+    method: str
+    url: str
+    headers: dict[str, Any]
+    body: Optional[bytes]
+    timeout: float
+
+
+class TransportResponse(NamedTuple):
+    """The raw response returned by a transport."""
+
+    status: int
+    headers: Mapping[str, Any]
+    body: bytes
+
+
+class Transport:
+    """The interface every synchronous HTTP transport implements.
+
+    A transport receives a `TransportRequest` with the query string already encoded into the URL and the body
+    already serialized. It must raise `easypost.errors.TimeoutError` when a request times out, any other exception
+    is wrapped in an `HttpError` by the requestor.
+    """
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Send a prepared request and return the status, headers and body of the response."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the resources (eg: pooled connections) held by the transport."""
+        pass
+
+
+class AsyncTransport:
+    """The interface every asynchronous HTTP transport implements.
+
+    The same rules as `Transport` apply, but `send` and `close` are awaited.
+    """
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        """Send a prepared request and return the status, headers and body of the response."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release the resources (eg: pooled connections) held by the transport."""
+        pass
@@ -0,0 +1,24 @@
+from easypost.transports.transport import (
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+
+
+class UrlfetchTransport(Transport):
+    """Send requests via the `urlfetch` API of Google App Engine."""
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Make a request by using the `urlfetch` library."""
+        from google.appengine.api import urlfetch  # type: ignore
+
+        result = urlfetch.fetch(
+            url=request.url,
+            method=request.method,
+            headers=request.headers,
+            payload=request.body,
+            validate_certificate=False,
+            deadline=request.timeout,
+        )
+
+        return TransportResponse(status=result.status_code, headers=result.headers, body=result.content)
@@ -0,0 +1,82 @@
+from typing import (
+    Any,
+    Optional,
+)
+
+from easypost.constant import (
+    MAX_CONNECTIONS,
+    TIMEOUT_ERROR,
+)
+from easypost.errors import TimeoutError
+from easypost.transports.transport import (
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+
+
+class Urllib3Transport(Transport):
+    """Send requests straight through a `urllib3.PoolManager`.
+
+    This skips the per-call work of `requests.Session` (hook dispatch, merging environment settings, cookie
+    handling and charset detection) that the EasyPost API does not need. Bodies are sent as the pre-encoded
+    bytes of the request and returned as the raw bytes of the response.
+    """
+
+    # Mirror the headers `requests` sends by default so the API sees identical requests
+    DEFAULT_HEADERS = {
+        "Accept": "*/*",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS,
+        max_retries: int = 3,
+        pool_manager: Optional[Any] = None,
+    ):
+        import urllib3
+
+        self._urllib3 = urllib3
+
+        if pool_manager is None:
+            try:
+                import certifi
+
+                ca_certs = certifi.where()
+            except ImportError:
+                ca_certs = None  # Fallback to the system certificates
+
+            pool_manager = urllib3.PoolManager(
+                maxsize=max_connections,
+                block=False,
+                cert_reqs="CERT_REQUIRED",
+                ca_certs=ca_certs,
+                # Only retry failures to connect, the same way the `requests` adapter is configured
+                retries=urllib3.Retry(total=max_retries, read=False, redirect=False),
+            )
+        self._pool_manager = pool_manager
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Make a request by using the `urllib3` library."""
+        try:
+            result = self._pool_manager.urlopen(
+                method=request.method,
+                url=request.url,
+                body=request.body,
+                headers={**self.DEFAULT_HEADERS, **request.headers},
+                timeout=self._urllib3.Timeout(connect=request.timeout, read=request.timeout),
+                redirect=False,
+            )
+        except self._urllib3.exceptions.TimeoutError:
+            raise TimeoutError(TIMEOUT_ERROR)
+        except self._urllib3.exceptions.MaxRetryError as error:
+            if isinstance(error.reason, self._urllib3.exceptions.TimeoutError):
+                raise TimeoutError(TIMEOUT_ERROR)
+            raise
+
+        return TransportResponse(status=result.status, headers=result.headers, body=result.data)
+
+    def close(self) -> None:
+        self._pool_manager.clear()
@@ -1,6 +1,5 @@
 import hashlib
 import hmac
-import json
 import unicodedata
 from typing import (
     Any,
@@ -23,6 +22,7 @@ from easypost.errors import (
     InvalidParameterError,
     SignatureVerificationError,
 )
+from easypost.json_codec import get_json_codec
 from easypost.models.rate import Rate
 
 
@@ -41,10 +41,12 @@ def get_lowest_object_rate(
     services = [service.lower() for service in services]
 
     for rate in easypost_object.get(rates_key, []):
-        if (carriers and rate.carrier.lower() not in carriers) or (services and rate.service.lower() not in services):
+        if (carriers and rate["carrier"].lower() not in carriers) or (
+            services and rate["service"].lower() not in services
+        ):
             continue
 
-        if lowest_rate is None or float(rate.rate) < float(lowest_rate.rate):
+        if lowest_rate is None or float(rate["rate"]) < float(lowest_rate["rate"]):
             lowest_rate = rate
 
     if lowest_rate is None:
@@ -109,9 +111,12 @@ def get_lowest_stateless_rate(
     return lowest_rate
 
 
-def receive_event(raw_input: str):
-    """Receives a raw Webhook event and converts it to JSON."""
-    return convert_to_easypost_object(response=json.loads(raw_input))
+def receive_event(raw_input: str, lazy: bool = False):
+    """Receives a raw Webhook event and converts it to JSON.
+
+    When `lazy` is set, the objects nested in the event (such as its `result`) are only converted when accessed.
+    """
+    return convert_to_easypost_object(response=get_json_codec().loads(raw_input), lazy=lazy)
 
 
 def validate_webhook(event_body: bytes, headers: dict[str, Any], webhook_secret: str) -> dict[str, Any]:
@@ -135,7 +140,7 @@ def validate_webhook(event_body: bytes, headers: dict[str, Any], webhook_secret:
         digest = "hmac-sha256-hex=" + expected_signature.hexdigest()
 
         if hmac.compare_digest(digest, easypost_hmac_signature):
-            webhook_body = json.loads(event_body)
+            webhook_body = get_json_codec().loads(event_body)
         else:
             raise SignatureVerificationError(message=INVALID_WEBHOOK_VALIDATION_ERROR)
     else:
@@ -1,6 +1,9 @@
+import asyncio
 import datetime
 import json
 import os
+import threading
+import time
 import warnings
 from typing import (
     Any,
@@ -10,12 +13,22 @@ from typing import (
 import pytest
 
 from easypost.easypost_client import EasyPostClient
+from easypost.transports import (
+    AsyncTransport,
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
 
 EASYPOST_TEST_API_KEY = os.getenv("EASYPOST_TEST_API_KEY")
 EASYPOST_PROD_API_KEY = os.getenv("EASYPOST_PROD_API_KEY")
 PARTNER_USER_PROD_API_KEY = os.getenv("PARTNER_USER_PROD_API_KEY", "123")
 REFERRAL_CUSTOMER_PROD_API_KEY = os.getenv("REFERRAL_CUSTOMER_PROD_API_KEY", "123")
 
+# Cassettes match request headers exactly (including `Content-Length`), so clients replaying them must encode
+# bodies the way they were recorded, with the standard library's JSON separators
+CASSETTE_JSON_CODEC = "json"
+
 SCRUBBED_STRING = "<REDACTED>"
 SCRUBBED_ARRAY: list = []
 SCRUBBED_DICT: dict = {}
@@ -138,6 +151,97 @@ def scrub_response_bodies(scrubbers: list[Tuple[str, Any]]) -> Any:
     return before_record_response
 
 
+def json_response(body: Any, status: int = 200) -> TransportResponse:
+    """Build the response of a transport answering with a JSON body."""
+    return TransportResponse(status=status, headers={}, body=json.dumps(body).encode("utf-8"))
+
+
+class _RecordingTransportBase:
+    """Records the requests a transport is asked to send and answers them from `responses`.
+
+    `responses` is the response to every request, a list of the responses to each request in turn, or a function
+    returning the response to a request. A response is a `TransportResponse`, a dict sent as a JSON body or an
+    exception to raise. Each request takes `delay` seconds, the most requests sent at once is kept in `max_in_flight`.
+    """
+
+    def __init__(self, responses: Any = None, delay: float = 0.0):
+        self.responses = responses if responses is not None else {}
+        self.delay = delay
+        self.requests: list[TransportRequest] = []
+        self.sent_at: list[float] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Condition()
+
+    @property
+    def urls(self) -> list[str]:
+        return [request.url for request in self.requests]
+
+    def wait_for(self, requests: int, timeout: float = 5) -> bool:
+        """Wait until at least `requests` requests were sent, returning whether they were before `timeout`."""
+        with self.lock:
+            return self.lock.wait_for(lambda: len(self.requests) >= requests, timeout=timeout)
+
+    def _start(self, request: TransportRequest) -> int:
+        with self.lock:
+            self.requests.append(request)
+            self.sent_at.append(time.monotonic())
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.lock.notify_all()
+            return len(self.requests) - 1
+
+    def _finish(self, request: TransportRequest, index: int) -> TransportResponse:
+        try:
+            if callable(self.responses):
+                response = self.responses(request)
+            elif isinstance(self.responses, list):
+                response = self.responses[index]
+            else:
+                response = self.responses
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+        if isinstance(response, BaseException):
+            raise response
+        if not isinstance(response, TransportResponse):
+            response = json_response(response)
+        return response
+
+
+class RecordingTransport(_RecordingTransportBase, Transport):
+    """A transport recording its requests and answering with canned responses, see `_RecordingTransportBase`."""
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        index = self._start(request)
+        if self.delay:
+            time.sleep(self.delay)
+        return self._finish(request, index)
+
+
+class AsyncRecordingTransport(_RecordingTransportBase, AsyncTransport):
+    """An async `RecordingTransport`, requests wait for `delay` without blocking the event loop."""
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        index = self._start(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self._finish(request, index)
+
+
+@pytest.fixture
+def recording_transport():
+    """Build transports recording their requests and answering with canned responses, see `RecordingTransport`."""
+    return RecordingTransport
+
+
+@pytest.fixture
+def async_recording_transport():
+    """Build async transports recording their requests and answering with canned responses."""
+    return AsyncRecordingTransport
+
+
 @pytest.fixture
 def synchronous_sleep_seconds():
     """Use this fixture for sleeping between API calls where synchronous flows happen."""
@@ -147,25 +251,25 @@ def synchronous_sleep_seconds():
 @pytest.fixture
 def test_client():
     """If a test needs to use the EasyPost test mode, make it depend on this fixture."""
-    return EasyPostClient(EASYPOST_TEST_API_KEY)
+    return EasyPostClient(EASYPOST_TEST_API_KEY, json_codec=CASSETTE_JSON_CODEC)
 
 
 @pytest.fixture
 def prod_client():
     """If a test needs to use the EasyPost prod mode, make it depend on this fixture."""
-    return EasyPostClient(EASYPOST_PROD_API_KEY)
+    return EasyPostClient(EASYPOST_PROD_API_KEY, json_codec=CASSETTE_JSON_CODEC)
 
 
 @pytest.fixture
 def partner_user_prod_client():
     """If a test needs to use prod mode with a partner user's API key, make it depend on this fixture."""
-    return EasyPostClient(PARTNER_USER_PROD_API_KEY)
+    return EasyPostClient(PARTNER_USER_PROD_API_KEY, json_codec=CASSETTE_JSON_CODEC)
 
 
 @pytest.fixture
 def referral_customer_prod_client():
     """If a test needs to use prod mode with a referral customer API key, make it depend on this fixture."""
-    return EasyPostClient(REFERRAL_CUSTOMER_PROD_API_KEY)
+    return EasyPostClient(REFERRAL_CUSTOMER_PROD_API_KEY, json_codec=CASSETTE_JSON_CODEC)
 
 
 def read_fixture_data():
@@ -43,7 +43,7 @@ def test_api_key_all(prod_client):
 def test_api_key_lifecycle():
     """Tests creating an API key for a child user."""
     # Create an API key
-    referral_client = EasyPostClient(os.getenv("REFERRAL_CUSTOMER_PROD_API_KEY"))
+    referral_client = EasyPostClient(os.getenv("REFERRAL_CUSTOMER_PROD_API_KEY"), json_codec="json")
     api_key = referral_client.api_keys.create("production")
     assert isinstance(api_key, ApiKey)
     assert api_key.id.startswith("ak_")
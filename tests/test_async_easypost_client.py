@@ -0,0 +1,174 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.errors import (
+    InvalidRequestError,
+    TimeoutError,
+)
+from easypost.models import (
+    Shipment,
+    Tracker,
+)
+from easypost.requestor import RequestMethod
+from easypost.retry_policy import RetryPolicy
+from easypost.transports import HttpxTransport
+
+
+def mock_async_client(handler, **kwargs) -> AsyncEasyPostClient:
+    """Build an async client whose HTTP calls are answered by the handler instead of the network."""
+    transport = HttpxTransport(httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    return AsyncEasyPostClient(api_key="123", transport=transport, **kwargs)
+
+
+def test_async_easypost_client_api_key():
+    """Tests setting and getting API keys from different async client objects."""
+    client1 = AsyncEasyPostClient(api_key="123")
+    assert client1.api_key == "123"
+
+    client2 = AsyncEasyPostClient(api_key="456")
+    assert client2.api_key == "456"
+
+
+def test_async_easypost_client_api_base():
+    """Tests that we can override the API base of the async client object."""
+    client1 = AsyncEasyPostClient(api_key="123")
+    assert client1.api_base == "https://api.easypost.com/v2"
+
+    client2 = AsyncEasyPostClient(api_key="123", api_base="http://example.com")
+    assert client2.api_base == "http://example.com"
+
+
+def test_async_easypost_client_create():
+    """Tests that async service methods wrap params, authenticate and convert the response."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201, json={"id": "shp_123", "object": "Shipment"})
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            return await client.shipment.create(reference="abc")
+
+    shipment = asyncio.run(run())
+
+    assert isinstance(shipment, Shipment)
+    assert shipment.id == "shp_123"
+    assert requests[0].method == "POST"
+    assert str(requests[0].url) == "https://api.easypost.com/v2/shipments"
+    assert requests[0].headers["Authorization"] == "Bearer 123"
+    assert json.loads(requests[0].content) == {"shipment": {"reference": "abc"}}
+
+
+def test_async_easypost_client_query_params():
+    """Tests that GET params are sent in the query string and that `None` values are dropped."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"trackers": [{"id": "trk_123"}], "has_more": False})
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            return await client.tracker.all(page_size=5, carrier=None)
+
+    trackers = asyncio.run(run())
+
+    assert isinstance(trackers["trackers"][0], Tracker)
+    assert requests[0].method == "GET"
+    assert dict(requests[0].url.params) == {"page_size": "5"}
+
+
+def test_async_easypost_client_error_mapping():
+    """Tests that the async client raises the same errors as the synchronous client."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(422, json={"error": {"code": "PARAMETER.REQUIRED", "message": "Missing parameter."}})
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            await client.shipment.create()
+
+    with pytest.raises(InvalidRequestError) as error:
+        asyncio.run(run())
+
+    assert error.value.http_status == 422
+    assert error.value.code == "PARAMETER.REQUIRED"
+    assert error.value.message == "Missing parameter."
+
+
+def test_async_easypost_client_timeout():
+    """Tests that the async client raises a TimeoutError when the request times out."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            await client.parcel.retrieve("prcl_123")
+
+    with pytest.raises(TimeoutError) as error:
+        asyncio.run(run())
+
+    assert error.value.message == "Request timed out."
+
+
+def test_async_easypost_client_retries():
+    """Tests that the async client retries transient failures according to its retry policy."""
+    statuses = [503, 429]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if statuses:
+            return httpx.Response(statuses.pop(0), headers={"Retry-After": "0"}, json={"error": {"code": "RETRY"}})
+        return httpx.Response(200, json={"id": "trk_123", "object": "Tracker"})
+
+    attempts = []
+
+    async def run():
+        async with mock_async_client(handler, retry_policy=RetryPolicy(base_delay=0)) as client:
+            client.subscribe_to_request_hook(lambda **kwargs: attempts.append(kwargs["attempt"]))
+            return await client.tracker.retrieve("trk_123")
+
+    tracker = asyncio.run(run())
+
+    assert tracker.id == "trk_123"
+    assert attempts == [1, 2, 3]
+
+
+def test_async_easypost_client_concurrent_calls():
+    """Tests that many async calls can run concurrently on a single event loop."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": request.url.path.split("/")[-1], "object": "Tracker"})
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            return await asyncio.gather(*[client.tracker.retrieve(f"trk_{i}") for i in range(50)])
+
+    trackers = asyncio.run(run())
+
+    assert [tracker.id for tracker in trackers] == [f"trk_{i}" for i in range(50)]
+
+
+def test_async_easypost_client_hooks():
+    """Tests that the async client fires the request and response hooks."""
+    events = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"addresses": [], "has_more": False})
+
+    async def run():
+        async with mock_async_client(handler) as client:
+            client.subscribe_to_request_hook(lambda **kwargs: events.append(("request", kwargs["path"])))
+            client.subscribe_to_response_hook(lambda **kwargs: events.append(("response", kwargs["http_status"])))
+            await client.make_api_call(method=RequestMethod.GET, endpoint="/addresses", params={"page_size": 1})
+
+    asyncio.run(run())
+
+    assert events == [("request", "https://api.easypost.com/v2/addresses"), ("response", 200)]
@@ -0,0 +1,174 @@
+import json
+import threading
+from typing import Any
+
+import pytest
+
+from easypost.bulk_buy import RatePolicy
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    EasyPostError,
+    FilteringError,
+    InvalidParameterError,
+    MissingParameterError,
+)
+from easypost.transports import (
+    TransportRequest,
+    TransportResponse,
+)
+
+RATES: list[dict[str, Any]] = [
+    {"id": "rate_usps_priority", "carrier": "USPS", "service": "Priority", "rate": "8.00", "days": 2},
+    {"id": "rate_usps_ground", "carrier": "USPS", "service": "GroundAdvantage", "rate": "5.00", "days": 5},
+    {"id": "rate_ups_ground", "carrier": "UPS", "service": "Ground", "rate": "6.00", "days": 3},
+]
+
+
+class ShipmentsApi:
+    """Creates shipments for a recording transport quoting `RATES`, failing those with a `fail` reference, and buys
+    them."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.created = 0
+        self.bought: dict[str, str] = {}
+
+    def respond(self, status: int, body: dict) -> TransportResponse:
+        return TransportResponse(status=status, headers={}, body=json.dumps(body).encode("utf-8"))
+
+    def __call__(self, request: TransportRequest) -> TransportResponse:
+        path = request.url.split("/v2/", 1)[1].split("?", 1)[0]
+        if path == "shipments":
+            shipment = json.loads(request.body or b"{}")["shipment"]
+            if shipment.get("reference") == "fail":
+                return self.respond(422, {"error": {"code": "ADDRESS.VERIFY.FAILURE", "message": "Invalid address"}})
+            with self.lock:
+                self.created += 1
+                shipment_id = f"shp_{self.created:04}"
+            rates = [{key: value for key, value in rate.items() if key != "days"} for rate in RATES]
+            return self.respond(200, {"id": shipment_id, "object": "Shipment", "rates": rates})
+
+        shipment_id, action = path.split("/")[1:]
+        if action == "smartrate":
+            smart_rates = [
+                {**rate, "time_in_transit": {"percentile_90": rate["days"] + 1, "percentile_50": rate["days"]}}
+                for rate in RATES
+            ]
+            return self.respond(200, {"result": smart_rates})
+
+        rate_id = json.loads(request.body or b"{}")["rate"]["id"]
+        with self.lock:
+            self.bought[shipment_id] = rate_id
+        return self.respond(200, {"id": shipment_id, "object": "Shipment", "selected_rate": {"id": rate_id}})
+
+
+def test_create_and_buy_many(recording_transport):
+    """Tests that every shipment is created and its lowest rate bought, at most `concurrency` at a time."""
+    api = ShipmentsApi()
+    transport = recording_transport(api, delay=0.01)
+    client = EasyPostClient("123", transport=transport, response_format="dict")
+
+    bulk_buy = client.shipment.create_and_buy_many(({"reference": str(index)} for index in range(40)), concurrency=4)
+    results = list(bulk_buy)
+
+    assert sorted(result.position for result in results) == list(range(40))
+    assert all(result.ok and result.rate["id"] == "rate_usps_ground" for result in results)
+    assert sorted(result.shipment["id"] for result in results) == sorted(api.bought)
+    assert set(api.bought.values()) == {"rate_usps_ground"}
+    assert transport.max_in_flight <= 4
+
+    stats = bulk_buy.stats
+    assert (stats.total, stats.succeeded, stats.failed) == (40, 40, 0)
+    assert stats.throughput > 0
+    assert stats.mean_latency >= 0.02
+
+
+@pytest.mark.parametrize(
+    "rate_policy, rate_id",
+    [
+        (RatePolicy(carriers=["ups"]), "rate_ups_ground"),
+        (RatePolicy(services=["Priority"]), "rate_usps_priority"),
+        (RatePolicy(delivery_days=3, delivery_accuracy="percentile_90"), "rate_usps_priority"),
+        (RatePolicy(delivery_days=3, delivery_accuracy="percentile_50"), "rate_ups_ground"),
+        (RatePolicy(carriers=["UPS"], delivery_days=5, delivery_accuracy="percentile_90"), "rate_ups_ground"),
+        (lambda shipment: shipment["rates"][0], "rate_usps_priority"),
+    ],
+)
+def test_create_and_buy_many_rate_policy(recording_transport, rate_policy, rate_id):
+    """Tests that the rate selected by the policy is the one bought."""
+    api = ShipmentsApi()
+    client = EasyPostClient("123", transport=recording_transport(api), response_format="dict")
+
+    results = list(client.shipment.create_and_buy_many([{}, {}], rate_policy=rate_policy))
+
+    assert [result.rate["id"] for result in results] == [rate_id, rate_id]
+    assert list(api.bought.values()) == [rate_id, rate_id]
+
+
+def test_create_and_buy_many_partial_failure(recording_transport):
+    """Tests that failures are reported per shipment without stopping the others."""
+    api = ShipmentsApi()
+    client = EasyPostClient("123", transport=recording_transport(api), response_format="dict")
+    shipments = [{"reference": "fail" if index % 5 == 0 else str(index)} for index in range(20)]
+
+    bulk_buy = client.shipment.create_and_buy_many(shipments, rate_policy=RatePolicy(carriers=["FedEx"]))
+    results = sorted(bulk_buy, key=lambda result: result.position)
+
+    # Shipments failing to be created have no shipment, those with no matching rate keep the created shipment
+    assert all(result.shipment is None for result in results[::5])
+    assert all(isinstance(result.error, FilteringError) and result.shipment for result in results[1::5])
+    assert [result.params for result in results] == shipments
+    assert api.bought == {}
+    assert bulk_buy.stats.failed == 20
+
+
+def test_create_and_buy_many_single_use(recording_transport):
+    """Tests that iterating over a bulk buy again raises an error instead of buying every shipment twice."""
+    api = ShipmentsApi()
+    client = EasyPostClient("123", transport=recording_transport(api), response_format="dict")
+
+    bulk_buy = client.shipment.create_and_buy_many([{}, {}])
+    assert len(list(bulk_buy)) == 2
+
+    with pytest.raises(EasyPostError):
+        list(bulk_buy)
+
+    assert api.created == 2
+    assert bulk_buy.stats.total == 2
+
+
+def test_create_and_buy_many_early_exit(recording_transport):
+    """Tests that stopping early waits for the shipments being bought, keeps their results and buys no others."""
+    api = ShipmentsApi()
+    client = EasyPostClient("123", transport=recording_transport(api, delay=0.02), response_format="dict")
+
+    bulk_buy = client.shipment.create_and_buy_many([{"reference": str(index)} for index in range(40)], concurrency=4)
+    for result in bulk_buy:
+        break
+
+    results = [result, *bulk_buy.unread_results]
+    assert 1 < len(results) <= 8
+    assert all(result.ok for result in results)
+    # Every shipment created was bought and reported, no shipment was created once iteration stopped
+    assert sorted(result.shipment["id"] for result in results) == sorted(api.bought)
+    assert api.created == len(results)
+    assert bulk_buy.stats.total == len(results)
+
+
+def test_create_and_buy_many_invalid_concurrency(recording_transport):
+    """Tests that a concurrency lower than 1 is rejected upfront."""
+    client = EasyPostClient("123", transport=recording_transport(ShipmentsApi()))
+
+    with pytest.raises(InvalidParameterError):
+        client.shipment.create_and_buy_many([{}], concurrency=0)
+
+
+def test_create_and_buy_many_invalid_rate_policy(recording_transport):
+    """Tests that a SmartRate policy missing its delivery days or accuracy is rejected upfront."""
+    client = EasyPostClient("123", transport=recording_transport(ShipmentsApi()))
+
+    with pytest.raises(MissingParameterError):
+        client.shipment.create_and_buy_many([{}], rate_policy=RatePolicy(delivery_days=2))
+
+    with pytest.raises(MissingParameterError):
+        client.shipment.create_and_buy_many([{}], rate_policy=RatePolicy(delivery_accuracy="percentile_90"))
@@ -0,0 +1,169 @@
+import asyncio
+import time
+
+import pytest
+
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    CircuitOpenError,
+    InternalServerError,
+    InvalidParameterError,
+    NotFoundError,
+    TimeoutError,
+)
+from easypost.transports import TransportResponse
+
+OK_RESPONSE = TransportResponse(status=200, headers={}, body=b'{"id": "shp_123", "object": "Shipment"}')
+ERROR_RESPONSE = TransportResponse(status=500, headers={}, body=b'{"error": {"code": "INTERNAL_SERVER_ERROR"}}')
+
+
+def test_circuit_breaker_route():
+    """Tests that IDs are normalized out of routes."""
+    assert CircuitBreaker.route("/shipments/shp_a1b2c3/buy") == "/shipments/:id/buy"
+    assert CircuitBreaker.route("/addresses/create_and_verify") == "/addresses/create_and_verify"
+    assert CircuitBreaker.route("/fedex_registrations/123456789/pin") == "/fedex_registrations/:id/pin"
+    assert CircuitBreaker.route("/trackers?page_size=5") == "/trackers"
+    assert CircuitBreaker.route("/partners/stripe_public_key") == "/partners/stripe_public_key"
+
+
+def test_circuit_breaker_failure_rate():
+    """Tests that a circuit opens once the failure rate of its window reaches the threshold."""
+    circuit_breaker = CircuitBreaker(failure_rate_threshold=0.5, min_requests=4)
+
+    for status in (200, 500, 200):
+        circuit_breaker.record("/shipments/:id/buy", status=status)
+    assert circuit_breaker.state("/shipments/:id/buy") == CircuitState.CLOSED
+
+    circuit_breaker.record("/shipments/:id/buy", status=503)
+    assert circuit_breaker.state("/shipments/:id/buy") == CircuitState.OPEN
+    assert circuit_breaker.state("/addresses") == CircuitState.CLOSED
+
+    with pytest.raises(CircuitOpenError) as error:
+        circuit_breaker.before_request("/shipments/:id/buy")
+
+    assert error.value.route == "/shipments/:id/buy"
+    assert 29 < error.value.retry_after <= 30
+
+
+def test_circuit_breaker_consecutive_timeouts():
+    """Tests that a circuit opens after consecutive timeouts even before reaching `min_requests`."""
+    circuit_breaker = CircuitBreaker(timeout_threshold=2)
+
+    circuit_breaker.record("/addresses/create_and_verify", error=TimeoutError("Request timed out."))
+    circuit_breaker.record("/addresses/create_and_verify", status=200)
+    circuit_breaker.record("/addresses/create_and_verify", error=TimeoutError("Request timed out."))
+    assert circuit_breaker.state("/addresses/create_and_verify") == CircuitState.CLOSED
+
+    circuit_breaker.record("/addresses/create_and_verify", error=TimeoutError("Request timed out."))
+    assert circuit_breaker.state("/addresses/create_and_verify") == CircuitState.OPEN
+
+
+def test_circuit_breaker_half_open():
+    """Tests that an open circuit lets a probe through after the recovery timeout and closes when it succeeds."""
+    circuit_breaker = CircuitBreaker(timeout_threshold=1, recovery_timeout=0.05)
+    circuit_breaker.record("/trackers", error=TimeoutError("Request timed out."))
+    time.sleep(0.05)
+
+    assert circuit_breaker.state("/trackers") == CircuitState.HALF_OPEN
+    circuit_breaker.before_request("/trackers")
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_request("/trackers")
+
+    circuit_breaker.record("/trackers", status=200)
+    assert circuit_breaker.state("/trackers") == CircuitState.CLOSED
+
+
+def test_circuit_breaker_half_open_failure():
+    """Tests that a failed probe re-opens the circuit."""
+    circuit_breaker = CircuitBreaker(timeout_threshold=1, recovery_timeout=0.05)
+    circuit_breaker.record("/trackers", error=TimeoutError("Request timed out."))
+    time.sleep(0.05)
+
+    circuit_breaker.before_request("/trackers")
+    circuit_breaker.record("/trackers", status=502)
+
+    assert circuit_breaker.state("/trackers") == CircuitState.OPEN
+
+
+@pytest.mark.parametrize(
+    "params, message",
+    [
+        ({"failure_rate_threshold": 0}, "Invalid failure_rate_threshold: 0, must be greater than 0 and at most 1."),
+        ({"failure_rate_threshold": 1.5}, "Invalid failure_rate_threshold: 1.5, must be greater than 0 and at most 1."),
+        ({"window_size": 0}, "Invalid window_size: 0, must be at least 1."),
+        ({"min_requests": 0}, "Invalid min_requests: 0, must be at least 1."),
+        ({"timeout_threshold": 0}, "Invalid timeout_threshold: 0, must be at least 1."),
+        ({"recovery_timeout": -1}, "Invalid recovery_timeout: -1, must be at least 0."),
+        ({"half_open_probes": 0}, "Invalid half_open_probes: 0, must be at least 1."),
+    ],
+)
+def test_circuit_breaker_invalid_params(params, message):
+    """Tests that invalid thresholds, window sizes, timeouts and probe counts are rejected upfront."""
+    with pytest.raises(InvalidParameterError) as error:
+        CircuitBreaker(**params)
+
+    assert error.value.message == message
+
+
+def test_easypost_client_circuit_breaker(recording_transport):
+    """Tests that a client fails fast once a route's circuit opened and reports its state."""
+    transport = recording_transport(ERROR_RESPONSE)
+    client = EasyPostClient(
+        api_key="123", transport=transport, circuit_breaker=CircuitBreaker(min_requests=2, recovery_timeout=60)
+    )
+
+    for _ in range(2):
+        with pytest.raises(InternalServerError):
+            client.shipment.buy("shp_123", rate={"id": "rate_123"})
+
+    with pytest.raises(CircuitOpenError):
+        client.shipment.buy("shp_456", rate={"id": "rate_123"})
+
+    assert len(transport.requests) == 2
+    assert client.circuit_states() == {"/shipments/:id/buy": CircuitState.OPEN}
+
+    transport.responses = OK_RESPONSE
+    assert client.shipment.retrieve("shp_123").id == "shp_123"
+
+
+def test_easypost_client_circuit_breaker_client_errors(recording_transport):
+    """Tests that client errors (4xx) don't count as failures."""
+    transport = recording_transport(
+        TransportResponse(status=404, headers={}, body=b'{"error": {"code": "NOT_FOUND", "message": "Not found"}}')
+    )
+    client = EasyPostClient(api_key="123", transport=transport, circuit_breaker=CircuitBreaker(min_requests=2))
+
+    for _ in range(3):
+        with pytest.raises(NotFoundError):
+            client.shipment.retrieve("shp_123")
+
+    assert client.circuit_states() == {"/shipments/:id": CircuitState.CLOSED}
+
+
+def test_easypost_client_no_circuit_breaker():
+    """Tests that a client without a circuit breaker reports no states."""
+    assert EasyPostClient(api_key="123").circuit_states() == {}
+
+
+def test_async_easypost_client_circuit_breaker(async_recording_transport):
+    """Tests that the async client fails fast once a route's circuit opened."""
+    client = AsyncEasyPostClient(
+        api_key="123",
+        transport=async_recording_transport(TimeoutError("Request timed out.")),
+        circuit_breaker=CircuitBreaker(timeout_threshold=1),
+    )
+
+    async def run():
+        with pytest.raises(TimeoutError):
+            await client.address.create_and_verify(street1="388 Townsend St")
+        with pytest.raises(CircuitOpenError):
+            await client.address.create_and_verify(street1="388 Townsend St")
+
+    asyncio.run(run())
+
+    assert client.circuit_states() == {"/addresses/create_and_verify": CircuitState.OPEN}
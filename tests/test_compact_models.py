@@ -0,0 +1,109 @@
+import copy
+import json
+
+import pytest
+
+from easypost.easypost_client import EasyPostClient
+from easypost.easypost_object import (
+    EasyPostObject,
+    convert_to_easypost_object,
+)
+from easypost.models import (
+    Rate,
+    Shipment,
+    Tracker,
+)
+from easypost.models.compact import (
+    CompactRate,
+    CompactShipment,
+    CompactTracker,
+    CompactTrackingDetail,
+)
+
+TRACKER = {
+    "id": "trk_123",
+    "object": "Tracker",
+    "status": "in_transit",
+    "tracking_code": "EZ1000000001",
+    "carrier_detail": {"object": "CarrierDetail", "service": "First-Class Package Service"},
+    "tracking_details": [
+        {
+            "object": "TrackingDetail",
+            "message": "Pre-Shipment Info Sent to USPS",
+            "status": "pre_transit",
+            "tracking_location": {"object": "TrackingLocation", "city": None, "zip": None},
+        },
+        {"object": "TrackingDetail", "message": "Shipping Label Created", "status": "pre_transit"},
+    ],
+    "new_field": {"nested": True},
+}
+
+SHIPMENT = {
+    "id": "shp_123",
+    "object": "Shipment",
+    "rates": [
+        {"id": "rate_1", "object": "Rate", "carrier": "USPS", "service": "Priority", "rate": "7.50"},
+        {"id": "rate_2", "object": "Rate", "carrier": "USPS", "service": "Express", "rate": "27.10"},
+    ],
+}
+
+
+def test_compact_models_conversion():
+    """Tests that compact conversion builds compact models all the way down, keeping the regular model types."""
+    tracker = convert_to_easypost_object(response=TRACKER, compact=True)
+
+    assert isinstance(tracker, CompactTracker)
+    assert isinstance(tracker, Tracker)
+    assert isinstance(tracker.tracking_details[0], CompactTrackingDetail)
+    assert type(tracker.carrier_detail) is EasyPostObject
+    assert type(convert_to_easypost_object(response=TRACKER)) is Tracker
+
+
+def test_compact_models_access():
+    """Tests that compact models behave like regular models, unknown fields included."""
+    regular = convert_to_easypost_object(response=TRACKER)
+    tracker = convert_to_easypost_object(response=TRACKER, compact=True)
+
+    assert tracker.id == tracker["id"] == "trk_123"
+    assert tracker.status == tracker.get("status") == "in_transit"
+    assert tracker.new_field.nested is True
+    assert tracker.get("signed_by", "nobody") == "nobody"
+    assert tracker.tracking_details[0].tracking_location.city is None
+    assert tracker.to_dict() == regular.to_dict()
+    assert json.loads(tracker.to_json()) == json.loads(regular.to_json())
+    assert tracker == regular
+
+    with pytest.raises(AttributeError) as error:
+        tracker.signed_by
+    assert str(error.value) == "CompactTracker object has no attribute signed_by"
+
+    with pytest.raises(KeyError):
+        tracker["signed_by"]
+
+    tracker.signed_by = "John"
+    tracker["custom"] = "value"
+    assert tracker.to_dict()["signed_by"] == "John"
+    assert tracker.custom == "value"
+    assert copy.deepcopy(tracker).to_dict() == tracker.to_dict()
+
+
+def test_compact_models_memory():
+    """Tests that compact models keep known fields out of a per-instance dict."""
+    tracker = convert_to_easypost_object(response=TRACKER, compact=True)
+
+    assert "status" not in vars(tracker)
+    assert vars(tracker.tracking_details[1]) == {}
+    assert vars(tracker) == {"new_field": tracker.new_field}
+
+
+def test_compact_models_client(recording_transport):
+    """Tests that a client set to use compact models returns them from its services."""
+    client = EasyPostClient("123", transport=recording_transport(SHIPMENT), compact_models=True)
+    shipment = client.shipment.retrieve("shp_123")
+
+    assert isinstance(shipment, CompactShipment)
+    assert isinstance(shipment, Shipment)
+    assert isinstance(shipment.rates[0], CompactRate)
+    assert isinstance(shipment.rates[0], Rate)
+    assert shipment.lowest_rate().id == "rate_1"
+    assert type(EasyPostClient("123", transport=recording_transport(SHIPMENT)).shipment.retrieve("shp_123")) is Shipment
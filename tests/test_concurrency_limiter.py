@@ -0,0 +1,115 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.concurrency_limiter import ConcurrencyLimiter
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    InvalidParameterError,
+    ServiceUnavailableError,
+)
+from easypost.transports import TransportResponse
+
+TRACKER_RESPONSE = TransportResponse(status=200, headers={}, body=b'{"id": "trk_123", "object": "Tracker"}')
+UNAVAILABLE_RESPONSE = TransportResponse(status=503, headers={}, body=b'{"error": {"code": "UNAVAILABLE"}}')
+
+
+def test_concurrency_limiter_additive_increase():
+    """Tests that healthy responses grow the limit by about one per window of requests."""
+    concurrency_limiter = ConcurrencyLimiter(initial_limit=4, max_limit=5, latency_tolerance=1000)
+
+    for _ in range(4):
+        concurrency_limiter.release(concurrency_limiter.acquire(), status=200)
+    assert concurrency_limiter.limit == 4
+
+    concurrency_limiter.release(concurrency_limiter.acquire(), status=200)
+    assert concurrency_limiter.limit == 5
+
+    for _ in range(20):
+        concurrency_limiter.release(concurrency_limiter.acquire(), status=200)
+    assert concurrency_limiter.limit == 5
+
+
+def test_concurrency_limiter_multiplicative_decrease():
+    """Tests that overload signals halve the limit, once per window of in-flight requests."""
+    concurrency_limiter = ConcurrencyLimiter(initial_limit=16, min_limit=2)
+
+    started_at = [concurrency_limiter.acquire() for _ in range(3)]
+    for start in started_at:
+        concurrency_limiter.release(start, status=429)
+    assert concurrency_limiter.limit == 8
+
+    concurrency_limiter.release(concurrency_limiter.acquire(), status=None)
+    assert concurrency_limiter.limit == 4
+
+    for _ in range(3):
+        concurrency_limiter.release(concurrency_limiter.acquire(), status=503)
+    assert concurrency_limiter.limit == 2
+    assert concurrency_limiter.in_flight == 0
+
+
+def test_concurrency_limiter_latency_decrease():
+    """Tests that latency climbing past the tolerance counts as congestion."""
+    concurrency_limiter = ConcurrencyLimiter(initial_limit=10, latency_tolerance=2)
+    concurrency_limiter.release(concurrency_limiter.acquire(), status=200)
+
+    concurrency_limiter.release(time.monotonic() - 1, status=200)
+
+    assert concurrency_limiter.limit == 5
+
+
+def test_concurrency_limiter_invalid_limits():
+    """Tests that the limits are validated."""
+    with pytest.raises(InvalidParameterError):
+        ConcurrencyLimiter(initial_limit=5, max_limit=2)
+
+    with pytest.raises(InvalidParameterError) as error:
+        ConcurrencyLimiter(decrease_factor=1)
+
+    assert error.value.message == "Invalid decrease_factor: 1, must be between 0 and 1."
+
+
+def test_easypost_client_concurrency_limiter_threads(recording_transport):
+    """Tests that threads sharing a client never exceed the limit."""
+    transport = recording_transport(TRACKER_RESPONSE, delay=0.005)
+    concurrency_limiter = ConcurrencyLimiter(initial_limit=3, min_limit=3, max_limit=3)
+    client = EasyPostClient(api_key="123", transport=transport, concurrency_limiter=concurrency_limiter)
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        list(executor.map(lambda _: client.tracker.retrieve("trk_123"), range(30)))
+
+    assert transport.max_in_flight == 3
+    assert concurrency_limiter.in_flight == 0
+
+
+def test_easypost_client_concurrency_limiter_backs_off(recording_transport):
+    """Tests that overloaded responses shrink the limit of a client."""
+    concurrency_limiter = ConcurrencyLimiter(initial_limit=8)
+    client = EasyPostClient(
+        api_key="123",
+        transport=recording_transport(UNAVAILABLE_RESPONSE, delay=0.005),
+        concurrency_limiter=concurrency_limiter,
+    )
+
+    with pytest.raises(ServiceUnavailableError):
+        client.tracker.retrieve("trk_123")
+
+    assert concurrency_limiter.limit == 4
+
+
+def test_async_easypost_client_concurrency_limiter(async_recording_transport):
+    """Tests that asyncio tasks sharing a client never exceed the limit."""
+    transport = async_recording_transport(TRACKER_RESPONSE, delay=0.005)
+    concurrency_limiter = ConcurrencyLimiter(initial_limit=4, min_limit=4, max_limit=4)
+    client = AsyncEasyPostClient(api_key="123", transport=transport, concurrency_limiter=concurrency_limiter)
+
+    async def run():
+        await asyncio.gather(*[client.tracker.retrieve("trk_123") for _ in range(40)])
+
+    asyncio.run(run())
+
+    assert transport.max_in_flight == 4
+    assert concurrency_limiter.in_flight == 0
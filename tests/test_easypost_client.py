@@ -1,12 +1,23 @@
+import copy
 import os
+import pickle
 from unittest.mock import patch
 
 import pytest
 import requests
 
 from easypost.easypost_client import EasyPostClient
-from easypost.errors import TimeoutError
+from easypost.errors import (
+    HttpError,
+    JsonError,
+    TimeoutError,
+)
 from easypost.requestor import RequestMethod
+from easypost.services import ShipmentService
+from easypost.transports import (
+    RequestsTransport,
+    TransportResponse,
+)
 
 
 def test_easypost_client_api_key():
@@ -26,6 +37,40 @@ def test_easypost_client_no_api_key():
     assert "missing 1 required positional argument: 'api_key'" in str(error.value)
 
 
+def test_easypost_client_lazy_services():
+    """Tests that services are only built on first access and then reused."""
+    client = EasyPostClient("123")
+    assert "shipment" not in vars(client)
+
+    shipment_service = client.shipment
+    assert isinstance(shipment_service, ShipmentService)
+    assert shipment_service._client is client
+    assert client.shipment is shipment_service
+    assert EasyPostClient("123").shipment is not shipment_service
+
+
+def test_requests_transport_lazy_session():
+    """Tests that the requests transport only opens its session when the first request is sent."""
+    transport = RequestsTransport(api_base="https://api.easypost.com/v2")
+    assert transport._session_instance is None
+
+    transport.close()
+    assert transport._session is transport._session
+
+
+def test_requests_transport_copy():
+    """Tests that the requests transport can be copied and pickled, each copy opening its own session."""
+    transport = RequestsTransport(api_base="https://api.easypost.com/v2", max_retries=5)
+    session = transport._session
+
+    for transport_copy in (copy.deepcopy(transport), pickle.loads(pickle.dumps(transport))):
+        assert transport_copy._max_retries == 5
+        assert transport_copy._session_instance is None
+        assert transport_copy._session is not session
+
+    transport.close()
+
+
 def test_easypost_client_invalid_client_property():
     """Tests that we throw an error when attempting to use an invalid property of a client."""
     with pytest.raises(AttributeError) as error:
@@ -65,3 +110,88 @@ def test_client_make_api_call():
 
     assert len(response["addresses"]) == 1
     assert response["addresses"][0]["object"] == "Address"
+
+
+def test_easypost_client_default_transport():
+    """Tests that the client uses the requests transport by default."""
+    client = EasyPostClient(api_key="123")
+
+    assert isinstance(client._transport, RequestsTransport)
+
+
+def test_easypost_client_custom_transport_post(recording_transport):
+    """Tests that a custom transport receives a fully prepared POST request."""
+    transport = recording_transport(TransportResponse(status=201, headers={}, body=b'{"id": "prcl_123"}'))
+    client = EasyPostClient(api_key="123", transport=transport, json_codec="json")
+
+    parcel = client.parcel.create(weight=10)
+
+    request = transport.requests[0]
+    assert parcel.id == "prcl_123"
+    assert request.method == "POST"
+    assert request.url == "https://api.easypost.com/v2/parcels"
+    assert request.headers["Authorization"] == "Bearer 123"
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.body == b'{"parcel": {"weight": 10}}'
+    assert request.timeout == client.timeout
+
+
+def test_easypost_client_custom_transport_get(recording_transport):
+    """Tests that a custom transport receives GET params encoded in the URL, dropping `None` values."""
+    transport = recording_transport(TransportResponse(status=200, headers={}, body=b'{"trackers": []}'))
+    client = EasyPostClient(api_key="123", transport=transport)
+
+    client.tracker.all(page_size=5, carrier=None, tracking_codes=["1", "2"])
+
+    request = transport.requests[0]
+    assert request.method == "GET"
+    assert (
+        request.url == "https://api.easypost.com/v2/trackers?page_size=5&tracking_codes%5B%5D=1&tracking_codes%5B%5D=2"
+    )
+    assert request.body is None
+    assert "Content-Type" not in request.headers
+
+
+def test_easypost_client_custom_transport_error(recording_transport):
+    """Tests that unexpected transport errors are wrapped in an HttpError."""
+
+    client = EasyPostClient(api_key="123", transport=recording_transport(ConnectionError("connection reset")))
+
+    with pytest.raises(HttpError) as error:
+        client.parcel.retrieve("prcl_123")
+
+    assert "connection reset" in error.value.message
+
+
+def test_easypost_client_invalid_response_body(recording_transport):
+    """Tests that a response body that isn't JSON raises a JsonError carrying the raw body."""
+    transport = recording_transport(TransportResponse(status=502, headers={}, body=b"<html>Bad Gateway</html>"))
+    client = EasyPostClient(api_key="123", transport=transport)
+
+    with pytest.raises(JsonError) as error:
+        client.parcel.retrieve("prcl_123")
+
+    assert error.value.http_status == 502
+    assert error.value.http_body == "<html>Bad Gateway</html>"
+    assert "<html>Bad Gateway</html>" in error.value.message
+
+
+def test_easypost_client_shared_headers(recording_transport):
+    """Tests that requests copy the prepared headers of the client until its API key changes."""
+    transport = recording_transport(TransportResponse(status=200, headers={}, body=b'{"id": "prcl_123"}'))
+    client = EasyPostClient(api_key="123", transport=transport)
+
+    client.parcel.retrieve("prcl_123")
+    client.parcel.retrieve("prcl_123")
+    client.make_api_call(RequestMethod.GET, "/parcels/prcl_123", params={}, headers={"X-Test": "1"})
+    client.api_key = "456"
+    client.parcel.retrieve("prcl_123")
+
+    first, second, with_extra_headers, new_api_key = transport.requests
+    assert first.headers == second.headers
+    assert first.headers is not second.headers
+    assert first.headers["User-Agent"].startswith("EasyPost/v2 PythonClient/")
+    assert with_extra_headers.headers["X-Test"] == "1"
+    assert "X-Test" not in first.headers
+    assert new_api_key.headers["Authorization"] == "Bearer 456"
+    assert first.headers["Authorization"] == "Bearer 123"
@@ -0,0 +1,76 @@
+import json
+
+from easypost.easypost_object import (
+    EasyPostObject,
+    convert_to_easypost_object,
+)
+
+TRACKER = {
+    "id": "trk_123",
+    "object": "Tracker",
+    "status": "in_transit",
+    "tracking_code": "EZ1000000001",
+    "tracking_details": [
+        {"object": "TrackingDetail", "message": "Pre-Shipment Info Sent to USPS", "status": "pre_transit"},
+        {"object": "TrackingDetail", "message": "Shipping Label Created", "status": "pre_transit"},
+    ],
+    "carrier_detail": {"object": "CarrierDetail", "service": "First-Class Package Service"},
+}
+
+
+def updated_tracker(**changes) -> dict:
+    """Return a copy of the tracker with the changes applied to its last tracking detail."""
+    tracker = json.loads(json.dumps(TRACKER))
+    tracker["tracking_details"][-1].update(changes)
+    return tracker
+
+
+def test_easypost_object_equality():
+    """Tests that objects are equal when their content is, wherever a difference is nested."""
+    tracker = convert_to_easypost_object(response=TRACKER)
+
+    assert tracker == convert_to_easypost_object(response=TRACKER)
+    assert tracker == convert_to_easypost_object(response=TRACKER, lazy=True)
+    assert tracker == convert_to_easypost_object(response=TRACKER, compact=True)
+    assert tracker != convert_to_easypost_object(response=updated_tracker(status="in_transit"))
+    assert tracker != convert_to_easypost_object(response={**TRACKER, "id": "trk_456"})
+    assert tracker != convert_to_easypost_object(response={**TRACKER, "signed_by": None})
+    assert tracker != TRACKER
+    assert convert_to_easypost_object(response=TRACKER, lazy=True) != convert_to_easypost_object(
+        response=updated_tracker(message="Delivered"), lazy=True
+    )
+
+    tracker.__dict__["carrier_detail"] = {"object": "CarrierDetail", "service": "First-Class Package Service"}
+    assert tracker == convert_to_easypost_object(response=TRACKER)
+
+
+def test_easypost_object_content_hash():
+    """Tests that the content hash is stable for equal objects and changes with their content."""
+    tracker = convert_to_easypost_object(response=TRACKER)
+
+    assert tracker.content_hash() == convert_to_easypost_object(response=dict(reversed(TRACKER.items()))).content_hash()
+    assert tracker.content_hash() == convert_to_easypost_object(response=TRACKER, compact=True).content_hash()
+    assert tracker.content_hash() != convert_to_easypost_object(response=updated_tracker(status="x")).content_hash()
+    assert len(tracker.content_hash()) == 64
+
+
+def test_easypost_object_to_dict_order():
+    """Tests that keys follow the order of the response, including nested and lazily converted objects."""
+    values = {"id": "shp_123", "status": "unknown", "parcel": {"weight": 10.0, "mode": "test"}, "mode": "test"}
+
+    for easypost_object in (EasyPostObject.construct_from(values), EasyPostObject.construct_from(values, lazy=True)):
+        dictionary = easypost_object.to_dict()
+
+        assert list(dictionary) == ["id", "status", "parcel", "mode"]
+        assert list(dictionary["parcel"]) == ["weight", "mode"]
+
+
+def test_easypost_object_to_dict_canonical():
+    """Tests that only canonical output sorts keys, while holding the same data."""
+    easypost_object = EasyPostObject.construct_from(values={"id": "prcl_123", "weight": 10.0, "mode": "test"})
+
+    assert list(easypost_object.to_dict(canonical=True)) == ["id", "mode", "weight"]
+    assert list(easypost_object.to_dict()) == ["id", "weight", "mode"]
+    assert easypost_object.to_dict() == easypost_object.to_dict(canonical=True)
+    assert json.loads(easypost_object.to_json()) == json.loads(easypost_object.to_json(canonical=True))
+    assert str(easypost_object) == easypost_object.to_json(indent=2, canonical=True)
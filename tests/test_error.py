@@ -89,3 +89,12 @@ def test_error_bad_format_message():
     error = ApiError(message=message_data)
 
     assert error.message == "Bad format 1, Bad format 2, Bad format 3, Bad format 4, Bad format 5"
+
+
+def test_error_bytes_body():
+    """Tests that an error built from a raw bytes body parses it and decodes `http_body` on access."""
+    error = ApiError(message="", http_body=b'{"error": {"code": "NOT_FOUND", "errors": []}}')
+
+    assert error.code == "NOT_FOUND"
+    assert error.json_body == {"error": {"code": "NOT_FOUND", "errors": []}}
+    assert error.http_body == '{"error": {"code": "NOT_FOUND", "errors": []}}'
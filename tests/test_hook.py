@@ -3,6 +3,10 @@ import uuid
 
 import pytest
 
+from easypost.easypost_client import EasyPostClient
+from easypost.hooks import ResponseHook
+from easypost.transports import TransportResponse
+
 
 @pytest.mark.vcr()
 def test_request_hooks(basic_parcel, test_client):
@@ -54,3 +58,49 @@ def test_unsubscribe_hooks(basic_parcel, test_client):
     _ = test_client.parcel.create(**basic_parcel)
 
     assert True
+
+
+def test_response_hook_body(recording_transport):
+    """Test that a ResponseHook receives the response body as text along with its raw bytes."""
+
+    transport = recording_transport(
+        TransportResponse(status=200, headers={}, body='{"object": "Parcel", "id": "prcl_é"}'.encode("utf-8"))
+    )
+    bodies = []
+    client = EasyPostClient(api_key="123", transport=transport)
+    client.subscribe_to_response_hook(lambda **kwargs: bodies.append(kwargs))
+
+    client.parcel.retrieve("prcl_123")
+
+    assert bodies[0]["response_body"] == '{"object": "Parcel", "id": "prcl_é"}'
+    assert bodies[0]["response_body_raw"] == '{"object": "Parcel", "id": "prcl_é"}'.encode("utf-8")
+
+
+def test_hook_has_handlers():
+    """Test that a hook reports whether any function is subscribed to it."""
+    hook = ResponseHook()
+    assert not hook.has_handlers
+
+    hook += print
+    assert hook.has_handlers
+
+    hook -= print
+    assert not hook.has_handlers
+
+
+def test_request_hook_headers_per_request(recording_transport):
+    """Test that a header a RequestHook adds to one request isn't sent with the next ones."""
+
+    transport = recording_transport({"object": "Parcel", "id": "prcl_123"})
+    client = EasyPostClient(api_key="123", transport=transport)
+
+    def add_header(**kwargs):
+        kwargs["headers"]["X-First"] = "1"
+        client.unsubscribe_from_request_hook(add_header)
+
+    client.subscribe_to_request_hook(add_header)
+    client.parcel.retrieve("prcl_123")
+    client.parcel.retrieve("prcl_123")
+
+    assert transport.requests[0].headers["X-First"] == "1"
+    assert "X-First" not in transport.requests[1].headers
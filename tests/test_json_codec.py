@@ -0,0 +1,91 @@
+import pytest
+
+from easypost.easypost_client import EasyPostClient
+from easypost.easypost_object import EasyPostObject
+from easypost.errors import InvalidParameterError
+from easypost.json_codec import (
+    JsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    UjsonCodec,
+    detect_json_codec,
+    get_json_codec,
+)
+
+
+def _installed_codecs():
+    codecs = [StdlibJsonCodec()]
+    for codec_class in (OrjsonCodec, UjsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _installed_codecs(), ids=lambda codec: codec.name)
+def test_json_codec_round_trip(codec):
+    """Tests that every installed codec encodes to bytes and decodes both bytes and strings."""
+    data = {"shipment": {"reference": "café", "parcel": {"weight": 15.4}, "rates": [1, None, True]}}
+
+    encoded = codec.dumps(data)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == data
+    assert codec.loads(encoded.decode("utf-8")) == data
+
+
+@pytest.mark.parametrize("codec", _installed_codecs(), ids=lambda codec: codec.name)
+def test_json_codec_options(codec):
+    """Tests that every installed codec honours `default`, `sort_keys` and `indent`."""
+    encoded = codec.dumps({"b": b"bytes", "a": 1}, default=lambda value: value.decode("utf-8"), sort_keys=True)
+
+    assert encoded.index(b'"a"') < encoded.index(b'"b"')
+    assert codec.loads(encoded) == {"a": 1, "b": "bytes"}
+    assert b"\n" in codec.dumps({"a": 1}, indent=2)
+
+
+@pytest.mark.parametrize("codec", _installed_codecs(), ids=lambda codec: codec.name)
+def test_json_codec_invalid_json(codec):
+    """Tests that every installed codec raises a ValueError for invalid JSON."""
+    with pytest.raises(ValueError):
+        codec.loads(b"<html>Bad Gateway</html>")
+
+
+def test_json_codec_stdlib_encoding():
+    """Tests that the standard library codec encodes bodies exactly as `json.dumps` does."""
+    assert StdlibJsonCodec().dumps({"parcel": {"weight": 10}}) == b'{"parcel": {"weight": 10}}'
+
+
+def test_get_json_codec():
+    """Tests resolving a codec from a name, an instance or by detecting the fastest one installed."""
+    codec = StdlibJsonCodec()
+
+    assert get_json_codec("json").name == "json"
+    assert get_json_codec(codec) is codec
+    assert get_json_codec() is detect_json_codec()
+    assert isinstance(detect_json_codec(), JsonCodec)
+
+
+def test_get_json_codec_invalid_name():
+    """Tests that an unknown codec name raises an error listing the valid names."""
+    with pytest.raises(InvalidParameterError) as error:
+        get_json_codec("simplejson")
+
+    assert error.value.message == "Invalid JSON codec: simplejson, must be one of: orjson, ujson, json."
+
+
+def test_easypost_client_json_codec():
+    """Tests that a client resolves the codec it was configured with."""
+    assert EasyPostClient(api_key="123", json_codec="json")._json_codec.name == "json"
+    assert EasyPostClient(api_key="123")._json_codec is detect_json_codec()
+
+
+def test_easypost_object_to_json():
+    """Tests that canonical `to_json` output is sorted and decodes back to the same data with the detected codec."""
+    easypost_object = EasyPostObject.construct_from(values={"id": "prcl_123", "weight": 10.0, "mode": "test"})
+
+    json_string = easypost_object.to_json(canonical=True)
+
+    assert json_string.index('"id"') < json_string.index('"mode"') < json_string.index('"weight"')
+    assert detect_json_codec().loads(json_string) == {"id": "prcl_123", "mode": "test", "weight": 10.0}
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+
+import pytest
+
+import easypost
+
+
+def test_import_easypost_is_lazy():
+    """Tests that `import easypost` doesn't import the clients, services, models or heavy dependencies."""
+    code = (
+        "import sys, easypost; "
+        "print(sorted(m for m in ('asyncio', 'requests', 'easypost.easypost_client', 'easypost.services', "
+        "'easypost.models', 'easypost.errors') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_submodules():
+    """Tests that the submodules of a lazily loaded package are reachable as attributes after importing it alone."""
+    code = (
+        "import easypost; "
+        "print(easypost.errors.ApiError.__name__, easypost.models.Shipment.__name__, "
+        "easypost.services.ShipmentService.__name__, easypost.util.receive_event.__name__, "
+        "easypost.hooks.RequestHook.__name__, easypost.requestor.RequestMethod.__name__, "
+        "easypost.errors.api.api_error.ApiError.__name__)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.split() == [
+        "ApiError",
+        "Shipment",
+        "ShipmentService",
+        "receive_event",
+        "RequestHook",
+        "RequestMethod",
+        "ApiError",
+    ]
+
+
+def test_lazy_attributes():
+    """Tests that the public attributes of lazily loaded packages resolve, are listed and are cached."""
+    from easypost.easypost_client import EasyPostClient
+    from easypost.errors.api.not_found_error import NotFoundError
+    from easypost.models.shipment import Shipment
+    from easypost.services.shipment_service import ShipmentService
+
+    assert easypost.EasyPostClient is EasyPostClient
+    assert easypost.errors.NotFoundError is NotFoundError
+    assert easypost.models.Shipment is Shipment
+    assert easypost.services.ShipmentService is ShipmentService
+
+    assert "Shipment" in vars(easypost.models)
+    assert "Tracker" in dir(easypost.models)
+    assert set(easypost.errors.__all__) >= {"ApiError", "EasyPostError", "CircuitOpenError"}
+
+
+def test_lazy_attribute_missing():
+    """Tests that accessing an attribute that doesn't exist on a lazily loaded package still raises."""
+    with pytest.raises(AttributeError) as error:
+        easypost.models.Invalid
+
+    assert str(error.value) == "module 'easypost.models' has no attribute 'Invalid'"
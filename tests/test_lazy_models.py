@@ -0,0 +1,93 @@
+import json
+
+from easypost.easypost_client import EasyPostClient
+from easypost.easypost_object import (
+    EasyPostObject,
+    convert_to_easypost_object,
+)
+from easypost.models import (
+    Event,
+    Rate,
+    Shipment,
+)
+from easypost.requestor import RequestMethod
+from easypost.util import receive_event
+
+SHIPMENTS = {
+    "shipments": [
+        {
+            "id": "shp_123",
+            "object": "Shipment",
+            "tracking_code": "EZ1000000001",
+            "rates": [
+                {"id": "rate_1", "object": "Rate", "carrier": "USPS", "service": "Priority", "rate": "7.50"},
+                {"id": "rate_2", "object": "Rate", "carrier": "USPS", "service": "Express", "rate": "27.10"},
+            ],
+            "selected_rate": {"id": "rate_1", "object": "Rate", "rate": "7.50"},
+            "options": {"label_format": "PDF"},
+        },
+    ],
+    "has_more": False,
+}
+
+EVENT = {
+    "id": "evt_123",
+    "object": "Event",
+    "description": "tracker.updated",
+    "result": {"id": "trk_123", "object": "Tracker", "status": "delivered"},
+}
+
+
+def test_lazy_models_conversion():
+    """Tests that lazy conversion only converts nested objects when they are accessed, then caches them."""
+    page = convert_to_easypost_object(response=SHIPMENTS, lazy=True)
+
+    assert "shipments" not in vars(page)
+    shipment = page.shipments[0]
+    assert page.shipments is page.shipments
+    assert isinstance(shipment, Shipment)
+    assert shipment.id == "shp_123"
+    assert "selected_rate" not in vars(shipment)
+    assert isinstance(shipment.selected_rate, Rate)
+    assert shipment["selected_rate"] is shipment.selected_rate
+    assert shipment.selected_rate._parent is shipment
+    assert "rates" not in vars(shipment)
+    assert shipment.get("options").label_format == "PDF"
+    assert shipment.get("missing", "default") == "default"
+
+
+def test_lazy_models_match_eager():
+    """Tests that lazy models serialize, compare and update like eagerly converted ones."""
+    eager = convert_to_easypost_object(response=SHIPMENTS)
+    lazy = convert_to_easypost_object(response=SHIPMENTS, lazy=True)
+
+    assert lazy.to_dict() == eager.to_dict()
+    assert json.loads(lazy.to_json()) == json.loads(eager.to_json())
+    assert lazy == eager
+
+    shipment = convert_to_easypost_object(response=SHIPMENTS, lazy=True).shipments[0]
+    shipment.__dict__["tracking_code"] = "EZ2000000002"
+    assert shipment.tracking_code == "EZ2000000002"
+
+
+def test_lazy_models_event():
+    """Tests that events received from a webhook can be converted lazily."""
+    event = receive_event(json.dumps(EVENT), lazy=True)
+
+    assert isinstance(event, Event)
+    assert "result" not in vars(event)
+    assert event.result.status == "delivered"
+    assert event.to_dict() == receive_event(json.dumps(EVENT)).to_dict()
+
+
+def test_lazy_models_client(recording_transport):
+    """Tests that a client set to use lazy models returns them from its services, pagination included."""
+    client = EasyPostClient("123", transport=recording_transport(SHIPMENTS), lazy_models=True)
+    page = client.shipment.all(page_size=1)
+
+    assert "shipments" not in vars(page)
+    assert page.shipments[0].selected_rate.rate == "7.50"
+    response = client.make_api_call(RequestMethod.GET, "/shipments", {})
+    assert type(response) is EasyPostObject
+    assert "shipments" not in vars(response)
+    assert isinstance(response.shipments[0].selected_rate, Rate)
@@ -0,0 +1,79 @@
+import pytest
+
+from easypost import easypost_object
+from easypost.easypost_object import (
+    EasyPostObject,
+    convert_to_easypost_object,
+    register_model,
+)
+from easypost.errors import (
+    InvalidObjectError,
+    MissingParameterError,
+)
+from easypost.models import (
+    Report,
+    Shipment,
+    Tracker,
+)
+
+
+class Manifest(EasyPostObject):
+    pass
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Keep the models registered by a test from leaking into other tests."""
+    monkeypatch.setattr(easypost_object, "_registered_object_type_models", {})
+    monkeypatch.setattr(easypost_object, "_registered_id_prefix_models", {})
+
+
+def test_model_registry_builtin_models():
+    """Tests that objects are converted to the model of their ID prefix, or their object type otherwise."""
+    assert type(convert_to_easypost_object(response={"id": "shp_123", "object": "Shipment"})) is Shipment
+    assert type(convert_to_easypost_object(response={"id": "trk_1_2", "object": "Tracker"})) is Tracker
+    assert type(convert_to_easypost_object(response={"id": "unknown_123", "object": "CashFlowReport"})) is Report
+    assert type(convert_to_easypost_object(response={"object": "ShipmentReport"})) is Report
+    assert type(convert_to_easypost_object(response={"id": "shp", "object": "Shipment"})) is Shipment
+    assert type(convert_to_easypost_object(response={"id": "unknown_123"})) is EasyPostObject
+    assert type(convert_to_easypost_object(response={"object": "TrackingDetail"})) is EasyPostObject
+
+
+def test_model_registry_register_model(registry):
+    """Tests that custom models can be registered for new object types and ID prefixes."""
+    register_model(Manifest, object_type="Manifest", id_prefix="mnfst")
+
+    assert type(convert_to_easypost_object(response={"id": "mnfst_123"})) is Manifest
+    assert type(convert_to_easypost_object(response={"object": "Manifest"})) is Manifest
+    assert type(convert_to_easypost_object(response={"shipments": [{"id": "mnfst_1"}]}).shipments[0]) is Manifest
+
+    register_model(Manifest, id_prefix="shp")
+    assert type(convert_to_easypost_object(response={"id": "shp_123"})) is Manifest
+
+
+def test_model_registry_registered_precedence(registry):
+    """Tests that a model registered for a built-in object type is used even if the ID prefix has a built-in model."""
+
+    class MyShipment(Shipment):
+        pass
+
+    class MyReport(Report):
+        pass
+
+    register_model(MyShipment, object_type="Shipment")
+    register_model(MyReport, object_type="ShipmentReport")
+
+    assert type(convert_to_easypost_object(response={"id": "shp_123", "object": "Shipment"})) is MyShipment
+    assert type(convert_to_easypost_object(response={"id": "shprep_123", "object": "ShipmentReport"})) is MyReport
+    # Other objects sharing the ID prefix keep their built-in model
+    assert type(convert_to_easypost_object(response={"id": "shprep_123", "object": "TrackerReport"})) is Report
+    assert type(convert_to_easypost_object(response={"id": "trk_123", "object": "Tracker"})) is Tracker
+
+
+def test_model_registry_register_model_invalid(registry):
+    """Tests that registering a model requires an EasyPostObject class and an object type or ID prefix."""
+    with pytest.raises(InvalidObjectError):
+        register_model(dict, object_type="Manifest")  # type: ignore[arg-type]
+
+    with pytest.raises(MissingParameterError):
+        register_model(Manifest)
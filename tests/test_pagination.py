@@ -0,0 +1,154 @@
+import asyncio
+import time
+from urllib.parse import (
+    parse_qs,
+    urlsplit,
+)
+
+import httpx
+import pytest
+
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import ServiceUnavailableError
+from easypost.transports import (
+    HttpxTransport,
+    TransportResponse,
+)
+
+SHIPMENT_IDS = [f"shp_{index:03}" for index in range(10, 0, -1)]
+
+
+def list_shipments(url: str) -> dict:
+    """Answer a list of shipments request from the shipments newest first, paginated with `before_id`."""
+    query = {key: values[0] for key, values in parse_qs(urlsplit(url).query).items()}
+    page_size = int(query.get("page_size", 3))
+    ids = SHIPMENT_IDS
+    if "before_id" in query:
+        ids = ids[ids.index(query["before_id"]) + 1 :]
+
+    return {
+        "shipments": [{"id": id, "object": "Shipment"} for id in ids[:page_size]],
+        "has_more": len(ids) > page_size,
+        "query": query,
+    }
+
+
+def shipments_transport(transport_class, fail_after: int = 0):
+    """Build a recording transport listing the shipments, failing every request after the first `fail_after`."""
+    transport = transport_class()
+
+    def respond(request):
+        if fail_after and len(transport.requests) > fail_after:
+            return TransportResponse(status=503, headers={}, body=b'{"error": {"code": "SERVICE_UNAVAILABLE"}}')
+        return list_shipments(request.url)
+
+    transport.responses = respond
+    return transport
+
+
+def test_iter_all(recording_transport):
+    """Tests that `iter_all` streams every item page by page and stops after the last page."""
+    transport = shipments_transport(recording_transport)
+    client = EasyPostClient("123", transport=transport)
+
+    shipments = list(client.shipment.iter_all(page_size=3, purchased=True, start_datetime="2024-01-01"))
+
+    assert [shipment.id for shipment in shipments] == SHIPMENT_IDS
+    assert len(transport.urls) == 4
+    assert all("start_datetime=2024-01-01" in url and "purchased=True" in url for url in transport.urls)
+    assert "before_id=shp_008" in transport.urls[1]
+
+
+def test_iter_all_max_items(recording_transport):
+    """Tests that `iter_all` stops after `max_items` items without retrieving more pages."""
+    transport = shipments_transport(recording_transport)
+    client = EasyPostClient("123", transport=transport)
+
+    assert [shipment.id for shipment in client.shipment.iter_all(max_items=4, page_size=3)] == SHIPMENT_IDS[:4]
+    assert len(transport.urls) == 2
+    assert list(client.shipment.iter_all(max_items=0)) == []
+    assert len(transport.urls) == 2
+
+
+def test_iter_all_lazy(recording_transport):
+    """Tests that `iter_all` only retrieves pages as items are consumed."""
+    transport = shipments_transport(recording_transport)
+    client = EasyPostClient("123", transport=transport, response_format="dict")
+
+    shipments = client.shipment.iter_all(page_size=5)
+    assert transport.urls == []
+    assert next(shipments)["id"] == "shp_010"
+    assert len(transport.urls) == 1
+
+
+def test_iter_all_prefetch(recording_transport):
+    """Tests that `iter_all` retrieves up to `prefetch` pages ahead of the page being consumed."""
+    transport = shipments_transport(recording_transport)
+    client = EasyPostClient("123", transport=transport)
+
+    shipments = client.shipment.iter_all(page_size=2, prefetch=2)
+    assert next(shipments).id == "shp_010"
+    # The first page is being consumed, two more wait in the buffer and the fourth is blocked on the full buffer
+    assert transport.wait_for(4)
+    time.sleep(0.05)
+    assert len(transport.urls) == 4
+
+    assert [shipment.id for shipment in shipments] == SHIPMENT_IDS[1:]
+    assert len(transport.urls) == 5
+    assert [shipment.id for shipment in client.shipment.iter_all(max_items=3, page_size=2, prefetch=3)] == (
+        SHIPMENT_IDS[:3]
+    )
+
+
+def test_iter_all_prefetch_error(recording_transport):
+    """Tests that an error retrieving a prefetched page is raised when the caller reaches that page."""
+    client = EasyPostClient("123", transport=shipments_transport(recording_transport, fail_after=2))
+    shipment_ids = []
+
+    with pytest.raises(ServiceUnavailableError):
+        for shipment in client.shipment.iter_all(page_size=3, prefetch=2):
+            shipment_ids.append(shipment.id)
+
+    assert shipment_ids == SHIPMENT_IDS[:6]
+
+
+def test_iter_all_async():
+    """Tests that async `iter_all` streams every item page by page."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=list_shipments(str(request.url)))
+
+    async def run():
+        transport = HttpxTransport(httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        async with AsyncEasyPostClient("123", transport=transport) as client:
+            all_ids = [shipment.id async for shipment in client.shipment.iter_all(page_size=4)]
+            capped_ids = [shipment.id async for shipment in client.shipment.iter_all(max_items=5, page_size=4)]
+            prefetched_ids = [shipment.id async for shipment in client.shipment.iter_all(page_size=3, prefetch=2)]
+            return all_ids, capped_ids, prefetched_ids
+
+    all_ids, capped_ids, prefetched_ids = asyncio.run(run())
+
+    assert all_ids == SHIPMENT_IDS
+    assert capped_ids == SHIPMENT_IDS[:5]
+    assert prefetched_ids == SHIPMENT_IDS
+
+
+def test_iter_all_async_prefetch_early_exit(async_recording_transport):
+    """Tests that async `iter_all` stops prefetching pages as soon as it stops, without waiting to be collected."""
+
+    async def run():
+        client = AsyncEasyPostClient("123", transport=shipments_transport(async_recording_transport))
+        shipment_ids = [
+            shipment.id async for shipment in client.shipment.iter_all(max_items=2, page_size=1, prefetch=2)
+        ]
+
+        # The prefetching task was cancelled when the iteration stopped, it only needs a step to finish
+        await asyncio.sleep(0)
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        return shipment_ids, pending
+
+    shipment_ids, pending = asyncio.run(run())
+
+    assert shipment_ids == SHIPMENT_IDS[:2]
+    assert pending == []
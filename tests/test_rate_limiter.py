@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import InvalidParameterError
+from easypost.rate_limiter import (
+    FileRateLimiterBackend,
+    MemoryRateLimiterBackend,
+    RateLimiter,
+    _reserve_token,
+)
+from easypost.transports import TransportResponse
+
+OK_RESPONSE = TransportResponse(status=200, headers={}, body=b'{"id": "trk_123", "object": "Tracker"}')
+
+
+def test_reserve_token():
+    """Tests that the bucket refills at its rate up to its burst and goes into debt when empty."""
+    assert _reserve_token(tokens=5, updated_at=0, now=0, rate=10, burst=5) == (4, 0)
+    assert _reserve_token(tokens=0, updated_at=0, now=0.1, rate=10, burst=5) == (0, 0)
+    assert _reserve_token(tokens=0, updated_at=0, now=100, rate=10, burst=5) == (4, 0)
+    assert _reserve_token(tokens=-1, updated_at=0, now=0, rate=10, burst=5) == (-2, 0.2)
+
+
+@pytest.mark.parametrize(
+    "backend_factory",
+    [lambda tmp_path: MemoryRateLimiterBackend(), lambda tmp_path: FileRateLimiterBackend(str(tmp_path / "rate"))],
+    ids=["memory", "file"],
+)
+def test_rate_limiter_reserve(tmp_path, backend_factory):
+    """Tests that a burst is allowed immediately and later requests have to wait for the bucket to refill."""
+    rate_limiter = RateLimiter(rate=10, burst=3, backend=backend_factory(tmp_path))
+
+    waits = [rate_limiter.reserve(api_key="123", url="/trackers") for _ in range(5)]
+
+    assert waits[:3] == [0, 0, 0]
+    assert 0.05 < waits[3] <= 0.1
+    assert 0.15 < waits[4] <= 0.2
+    assert rate_limiter.reserve(api_key="456", url="/trackers") == 0
+
+
+def test_rate_limiter_endpoint_rates():
+    """Tests that an endpoint class gets its own budget on top of the overall one."""
+    rate_limiter = RateLimiter(rate=100, endpoint_rates={"trackers": 1})
+
+    assert rate_limiter.reserve(api_key="123", url="/trackers") == 0
+    assert rate_limiter.reserve(api_key="123", url="/trackers/trk_123") > 0.9
+    assert rate_limiter.reserve(api_key="123", url="/shipments/shp_123/buy") == 0
+
+
+def test_rate_limiter_endpoint_class():
+    """Tests that endpoints are classified by the first segment of their path."""
+    assert RateLimiter.endpoint_class("/shipments/shp_123/buy") == "shipments"
+    assert RateLimiter.endpoint_class("/trackers?page_size=5") == "trackers"
+
+
+def test_file_rate_limiter_backend_shared(tmp_path):
+    """Tests that limiters pointed at the same file (eg: in different processes) share one budget."""
+    path = str(tmp_path / "rate")
+    rate_limiter1 = RateLimiter(rate=1, burst=1, backend=FileRateLimiterBackend(path))
+    rate_limiter2 = RateLimiter(rate=1, burst=1, backend=FileRateLimiterBackend(path))
+
+    assert rate_limiter1.reserve(api_key="123", url="/trackers") == 0
+    assert rate_limiter2.reserve(api_key="123", url="/trackers") > 0.9
+    assert "123" not in (tmp_path / "rate").read_text()
+
+
+def test_rate_limiter_invalid_rate():
+    """Tests that a rate limiter needs a positive rate."""
+    with pytest.raises(InvalidParameterError):
+        RateLimiter(rate=0)
+
+
+def test_easypost_client_rate_limiter(recording_transport):
+    """Tests that a client waits for its rate limiter before each request."""
+    transport = recording_transport(OK_RESPONSE)
+    client = EasyPostClient(api_key="123", transport=transport, rate_limiter=RateLimiter(rate=20, burst=1))
+
+    for _ in range(3):
+        client.tracker.retrieve("trk_123")
+
+    assert transport.sent_at[2] - transport.sent_at[0] >= 0.09
+
+
+def test_async_easypost_client_rate_limiter(async_recording_transport):
+    """Tests that concurrent async requests are spread out by the rate limiter."""
+    transport = async_recording_transport(OK_RESPONSE)
+    client = AsyncEasyPostClient(api_key="123", transport=transport, rate_limiter=RateLimiter(rate=20, burst=1))
+
+    async def run():
+        await asyncio.gather(*[client.tracker.retrieve("trk_123") for _ in range(3)])
+
+    asyncio.run(run())
+
+    assert max(transport.sent_at) - min(transport.sent_at) >= 0.09
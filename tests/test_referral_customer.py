@@ -8,6 +8,7 @@ from easypost.constant import (
     _TEST_FAILED_INTENTIONALLY_ERROR,
     NO_MORE_PAGES_ERROR,
 )
+from easypost.easypost_client import EasyPostClient
 from easypost.errors.api.api_error import ApiError
 from easypost.models import User
 
@@ -159,3 +160,20 @@ def test_referral_customer_add_bank_account_from_stripe(partner_user_prod_client
     assert (
         str(error.value) == "account_holder_name must be present when creating a Financial Connections payment method"
     )
+
+
+def test_referral_customer_add_credit_card_from_stripe_referral_client(recording_transport):
+    """Tests that a referral request uses the referral's API key through the client's transport, leaving the client's
+    API key untouched."""
+
+    transport = recording_transport({"id": "card_123", "object": "CreditCard"})
+    client = EasyPostClient(api_key="partner_key", transport=transport)
+
+    client.referral_customer.add_credit_card_from_stripe("referral_key", "pm_123")
+    client.parcel.retrieve("prcl_123")
+
+    referral_request, client_request = transport.requests
+    assert referral_request.url == "https://api.easypost.com/v2/credit_cards"
+    assert referral_request.headers["Authorization"] == "Bearer referral_key"
+    assert client_request.headers["Authorization"] == "Bearer partner_key"
+    assert client.api_key == "partner_key"
@@ -0,0 +1,103 @@
+import datetime
+from urllib.parse import (
+    unquote,
+    urlsplit,
+)
+
+import pytest
+import requests
+
+from easypost.easypost_object import EasyPostObject
+from easypost.json_codec import JSON_CODECS
+from easypost.request_encoder import (
+    encode_json_body,
+    encode_query,
+    flatten_params,
+)
+from easypost.requestor import Requestor
+
+
+@pytest.mark.parametrize("codec_name", ["json", "orjson"])
+def test_encode_json_body(codec_name):
+    """Tests that request bodies reference nested objects by ID wherever they are, in a single pass."""
+    codec = JSON_CODECS[codec_name]()
+    shipment = EasyPostObject(id="shp_123")
+    params = {
+        "batch": {
+            "shipments": [shipment, {"id": "shp_456"}],
+            "nested": [[shipment]],
+            "reference": b"bytes",
+        },
+        "order": EasyPostObject(id="order_123"),
+    }
+
+    assert codec.loads(encode_json_body(params, codec)) == {
+        "batch": {
+            "shipments": [{"id": "shp_123"}, {"id": "shp_456"}],
+            "nested": [[{"id": "shp_123"}]],
+            "reference": "bytes",
+        },
+        "order": {"id": "order_123"},
+    }
+    # The params are left untouched
+    assert params["order"].id == "order_123"
+
+
+def test_encode_json_body_unsupported_value():
+    """Tests that values that can't be encoded still raise."""
+    with pytest.raises(TypeError):
+        encode_json_body({"value": object()}, JSON_CODECS["json"]())
+
+
+def test_encode_query():
+    """Tests that query params are flattened with bracketed keys, lists repeat their key, Nones are dropped and
+    datetimes are sent as strings whatever the local timezone."""
+    created_at = datetime.datetime(2024, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+    query = encode_query(
+        {
+            "page_size": 5,
+            "carrier": None,
+            "tracking_codes[]": ["1", "2"],
+            "start_datetime": created_at,
+            "shipment": EasyPostObject(id="shp_123"),
+            "options": {"label_format": "PDF", "print_custom": None},
+            "line_items": [{"sku": "a"}],
+        }
+    )
+
+    assert unquote(query).split("&") == [
+        "page_size=5",
+        "tracking_codes[]=1",
+        "tracking_codes[]=2",
+        "start_datetime=2024-01-01+12:00:00+00:00",
+        "shipment[id]=shp_123",
+        "options[label_format]=PDF",
+        "line_items[0][sku]=a",
+    ]
+
+
+def test_encode_query_datetime_matches_requests():
+    """Tests that datetimes are encoded in a query exactly as the requests library encodes them."""
+    created_at = datetime.datetime(2024, 1, 1, 12, 0, 0)
+    url = requests.Request("GET", "https://api.easypost.com/v2/shipments", params={"start_datetime": created_at})
+
+    assert encode_query({"start_datetime": created_at}) == urlsplit(url.prepare().url).query
+
+
+def test_form_encode_params():
+    """Tests that nested dicts are form-encoded to a flat dict, sibling dicts keeping their own keys and other values
+    kept as they are."""
+    params = {
+        "card": {"number": "4242", "exp": {"month": 1, "year": 2030}, "cvc": None},
+        "billing": {"zip": "12345", "lines": ["1", "2"]},
+    }
+
+    assert Requestor.form_encode_params(params) == {
+        "card[number]": "4242",
+        "card[exp][month]": 1,
+        "card[exp][year]": 2030,
+        "card[cvc]": None,
+        "billing[zip]": "12345",
+        "billing[lines]": ["1", "2"],
+    }
+    assert list(flatten_params({})) == []
@@ -0,0 +1,171 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.response_cache import (
+    MemoryCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+)
+
+
+def numbered_carrier_accounts(transport):
+    """Answer each request sent through a recording transport with a carrier account numbering the request."""
+    transport.responses = lambda request: {
+        "id": "ca_123",
+        "object": "CarrierAccount",
+        "description": str(len(transport.requests)),
+    }
+    return transport
+
+
+def test_response_cache_ttl():
+    """Tests that only routes with a TTL are cached."""
+    response_cache = ResponseCache()
+
+    assert response_cache.ttl("/metadata/carriers") == 3600
+    assert response_cache.ttl("/carrier_accounts/ca_123") == 300
+    assert response_cache.ttl("/rates/rate_123") == 300
+    assert response_cache.ttl("/shipments/shp_123") == 0
+
+
+def test_response_cache_invalidate_related():
+    """Tests that a write also invalidates the cached responses of the collections it changes."""
+    response_cache = ResponseCache()
+    for url in ("/users", "/payment_methods", "/carrier_accounts"):
+        response_cache.set(url, "123", url, b"{}")
+
+    response_cache.invalidate("123", "/referral_customers")
+
+    assert response_cache.get("/users") is None
+    assert response_cache.get("/payment_methods") is None
+    assert response_cache.get("/carrier_accounts") == b"{}"
+
+
+def test_memory_cache_backend_lru():
+    """Tests that the memory backend evicts the least recently used entries beyond its bounds."""
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", b"1", 60, ())
+    backend.set("b", b"2", 60, ())
+    backend.get("a")
+    backend.set("c", b"3", 60, ())
+
+    assert backend.get("a") == b"1"
+    assert backend.get("b") is None
+    assert backend.get("c") == b"3"
+
+    backend = MemoryCacheBackend(max_bytes=4)
+    backend.set("a", b"12", 60, ())
+    backend.set("b", b"345", 60, ())
+    backend.set("c", b"12345", 60, ())
+
+    assert backend.get("a") is None
+    assert backend.get("b") == b"345"
+    assert backend.get("c") is None
+
+
+def test_memory_cache_backend_expiry_and_invalidate():
+    """Tests that entries expire after their TTL and can be invalidated by tag."""
+    backend = MemoryCacheBackend()
+    backend.set("a", b"1", 0.01, ())
+    backend.set("b", b"2", 60, ("users",))
+    backend.set("c", b"3", 60, ("rates",))
+    time.sleep(0.02)
+    backend.invalidate("users")
+
+    assert backend.get("a") is None
+    assert backend.get("b") is None
+    assert backend.get("c") == b"3"
+
+
+def test_sqlite_cache_backend(tmp_path):
+    """Tests that the SQLite backend caches, expires, invalidates and evicts entries across instances."""
+    path = os.path.join(tmp_path, "cache.sqlite3")
+    backend = SQLiteCacheBackend(path, max_entries=2)
+    backend.set("a", b"1", 60, ("users",))
+    backend.set("b", b"2", 0.01, ("rates",))
+    time.sleep(0.02)
+
+    other_backend = SQLiteCacheBackend(path, max_entries=2)
+    assert other_backend.get("a") == b"1"
+    assert other_backend.get("b") is None
+
+    other_backend.set("c", b"3", 60, ("users_extra",))
+    other_backend.set("d", b"4", 60, ("rates",))
+    assert backend.get("a") is None
+
+    backend.invalidate("users")
+    assert backend.get("c") == b"3"
+
+    backend.clear()
+    assert backend.get("d") is None
+
+
+def test_response_cache_client(recording_transport):
+    """Tests that cacheable GET requests are answered from the cache until a write invalidates them."""
+    transport = numbered_carrier_accounts(recording_transport())
+    client = EasyPostClient("123", transport=transport, response_cache=ResponseCache())
+
+    first = client.carrier_account.retrieve("ca_123")
+    second = client.carrier_account.retrieve("ca_123")
+    assert first.description == second.description == "1"
+    assert len(transport.requests) == 1
+
+    # Other API keys don't share cached responses
+    EasyPostClient("456", transport=transport, response_cache=client._response_cache).carrier_account.retrieve("ca_123")
+    assert len(transport.requests) == 2
+
+    client.carrier_account.update("ca_123", description="updated")
+    assert client.carrier_account.retrieve("ca_123").description == "4"
+    assert len(transport.requests) == 4
+
+    # Routes without a TTL are never cached
+    client.shipment.retrieve("shp_123")
+    client.shipment.retrieve("shp_123")
+    assert len(transport.requests) == 6
+
+
+def test_response_cache_read_during_write(recording_transport):
+    """Tests that a GET request in flight while a write invalidates the cache doesn't store its stale response."""
+    read_sent = threading.Event()
+    write_done = threading.Event()
+    transport = recording_transport()
+
+    def respond(request):
+        if request.method == "GET" and not read_sent.is_set():
+            read_sent.set()
+            write_done.wait(timeout=5)
+        return {"id": "ca_123", "object": "CarrierAccount", "description": str(len(transport.requests))}
+
+    transport.responses = respond
+    client = EasyPostClient("123", transport=transport, response_cache=ResponseCache())
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        stale_read = executor.submit(client.carrier_account.retrieve, "ca_123")
+        read_sent.wait(timeout=5)
+        client.carrier_account.update("ca_123", description="updated")
+        write_done.set()
+        stale_read.result()
+
+    client.carrier_account.retrieve("ca_123")
+    assert len(transport.requests) == 3
+
+
+def test_response_cache_async_client(async_recording_transport):
+    """Tests that the async client answers cacheable GET requests from the cache."""
+    transport = numbered_carrier_accounts(async_recording_transport())
+
+    async def main():
+        async with AsyncEasyPostClient("123", transport=transport, response_cache=ResponseCache()) as client:
+            await client.carrier_account.retrieve("ca_123")
+            await client.carrier_account.retrieve("ca_123")
+            await client.carrier_account.delete("ca_123")
+            await client.carrier_account.retrieve("ca_123")
+
+    asyncio.run(main())
+
+    assert [request.method for request in transport.requests] == ["GET", "DELETE", "GET"]
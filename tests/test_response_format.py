@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+import pytest
+
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import InvalidParameterError
+from easypost.requestor import RequestMethod
+from easypost.transports import (
+    HttpxTransport,
+)
+from easypost.util import get_lowest_object_rate
+
+SHIPMENTS = {
+    "shipments": [
+        {
+            "id": "shp_123",
+            "object": "Shipment",
+            "rates": [
+                {"id": "rate_1", "object": "Rate", "carrier": "USPS", "service": "Priority", "rate": "7.50"},
+                {"id": "rate_2", "object": "Rate", "carrier": "USPS", "service": "Express", "rate": "27.10"},
+            ],
+        },
+    ],
+    "has_more": True,
+}
+
+
+def test_response_format_dict(recording_transport):
+    """Tests that a client set to the dict response format returns the decoded JSON from services and API calls."""
+    client = EasyPostClient("123", transport=recording_transport(SHIPMENTS), response_format="dict")
+
+    shipment = client.shipment.retrieve("shp_123")
+    assert type(shipment) is dict
+    assert shipment == SHIPMENTS
+
+    response = client.make_api_call(RequestMethod.GET, "/shipments", {})
+    assert type(response) is dict
+    assert type(response["shipments"][0]["rates"][0]) is dict
+    assert get_lowest_object_rate(response["shipments"][0])["id"] == "rate_1"
+
+
+def test_response_format_dict_pagination(recording_transport):
+    """Tests that the pagination helpers work on plain dict responses."""
+    transport = recording_transport(SHIPMENTS)
+    client = EasyPostClient("123", transport=transport, response_format="dict")
+
+    page = client.shipment.all(page_size=1, purchased=True)
+    next_page = client.shipment.get_next_page(page, page_size=1)
+
+    assert type(next_page) is dict
+    assert "before_id=shp_123" in transport.requests[1].url
+    assert "purchased=True" in transport.requests[1].url
+
+
+def test_response_format_dict_async():
+    """Tests that an async client set to the dict response format returns the decoded JSON."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=SHIPMENTS)
+
+    async def run():
+        transport = HttpxTransport(httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        async with AsyncEasyPostClient("123", transport=transport, response_format="dict") as client:
+            page = await client.shipment.all(page_size=1)
+            return page, await client.shipment.get_next_page(page, page_size=1)
+
+    page, next_page = asyncio.run(run())
+
+    assert type(page) is dict
+    assert type(next_page["shipments"][0]) is dict
+
+
+def test_response_format_invalid():
+    """Tests that clients reject unknown response formats."""
+    with pytest.raises(InvalidParameterError) as error:
+        EasyPostClient("123", response_format="xml")
+
+    assert str(error.value) == "Invalid response format: xml, must be one of: object, dict."
@@ -0,0 +1,134 @@
+import datetime
+from email.utils import format_datetime
+
+import pytest
+
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    InvalidParameterError,
+    RateLimitError,
+    ServiceUnavailableError,
+    TimeoutError,
+)
+from easypost.requestor import RequestMethod
+from easypost.retry_policy import RetryPolicy
+from easypost.transports import (
+    TransportRequest,
+    TransportResponse,
+)
+
+OK_RESPONSE = TransportResponse(status=200, headers={}, body=b'{"id": "trk_123", "object": "Tracker"}')
+RATE_LIMITED_RESPONSE = TransportResponse(
+    status=429, headers={"Retry-After": "0"}, body=b'{"error": {"code": "RATE_LIMITED", "message": "Slow down"}}'
+)
+UNAVAILABLE_RESPONSE = TransportResponse(
+    status=503, headers={}, body=b'{"error": {"code": "SERVICE_UNAVAILABLE", "message": "Unavailable"}}'
+)
+
+
+def _request(method: str, headers=None) -> TransportRequest:
+    return TransportRequest(
+        method=method, url="https://api.easypost.com/v2/trackers", headers=headers or {}, body=None, timeout=60
+    )
+
+
+def test_retry_policy_backoff():
+    """Tests that the full-jitter backoff stays between 0 and the exponential delay, capped at max_delay."""
+    retry_policy = RetryPolicy(base_delay=1, max_delay=5)
+
+    for attempt, ceiling in ((1, 1), (2, 2), (3, 4), (4, 5), (10, 5)):
+        delays = [retry_policy.backoff(attempt) for _ in range(50)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+
+
+def test_retry_policy_retry_after():
+    """Tests that Retry-After headers are parsed in seconds or as an HTTP date."""
+    retry_policy = RetryPolicy()
+    retry_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=30)
+
+    assert retry_policy.retry_after({"Retry-After": "2"}) == 2
+    assert retry_policy.retry_after({"retry-after": "1.5"}) == 1.5
+    assert 25 < retry_policy.retry_after({"Retry-After": format_datetime(retry_at, usegmt=True)}) <= 30
+    assert retry_policy.retry_after({"Retry-After": "soon"}) is None
+    assert retry_policy.retry_after({}) is None
+
+
+def test_retry_policy_get_delay():
+    """Tests which failures are retried and that Retry-After is honoured up to max_delay."""
+    retry_policy = RetryPolicy(max_attempts=3, max_delay=10)
+
+    assert retry_policy.get_delay(1, _request("GET"), response=RATE_LIMITED_RESPONSE) == 0
+    assert retry_policy.get_delay(1, _request("GET"), response=TransportResponse(429, {"Retry-After": "60"}, b"")) == 10
+    assert retry_policy.get_delay(1, _request("DELETE"), error=TimeoutError("Request timed out.")) is not None
+    assert retry_policy.get_delay(1, _request("GET"), response=OK_RESPONSE) is None
+    assert retry_policy.get_delay(1, _request("GET"), error=ValueError()) is None
+    assert retry_policy.get_delay(3, _request("GET"), response=UNAVAILABLE_RESPONSE) is None
+
+
+def test_retry_policy_idempotency():
+    """Tests that POST requests are only retried when they carry an idempotency key."""
+    retry_policy = RetryPolicy()
+
+    assert retry_policy.get_delay(1, _request("POST"), response=UNAVAILABLE_RESPONSE) is None
+    assert retry_policy.get_delay(1, _request("POST", {"Idempotency-Key": "123"}), response=UNAVAILABLE_RESPONSE)
+
+
+def test_retry_policy_invalid_max_attempts():
+    """Tests that a policy needs at least one attempt."""
+    with pytest.raises(InvalidParameterError) as error:
+        RetryPolicy(max_attempts=0)
+
+    assert error.value.message == "Invalid max_attempts: 0, must be at least 1."
+
+
+def test_easypost_client_retries(recording_transport):
+    """Tests that the client retries transient failures and reports every attempt through the hooks."""
+    transport = recording_transport([RATE_LIMITED_RESPONSE, TimeoutError("Request timed out."), OK_RESPONSE])
+    client = EasyPostClient(api_key="123", transport=transport, retry_policy=RetryPolicy(base_delay=0))
+    request_attempts, response_attempts = [], []
+    client.subscribe_to_request_hook(lambda **kwargs: request_attempts.append(kwargs))
+    client.subscribe_to_response_hook(lambda **kwargs: response_attempts.append(kwargs))
+
+    tracker = client.tracker.retrieve("trk_123")
+
+    assert tracker.id == "trk_123"
+    assert len(transport.requests) == 3
+    assert [kwargs["attempt"] for kwargs in request_attempts] == [1, 2, 3]
+    assert [(kwargs["attempt"], kwargs["http_status"]) for kwargs in response_attempts] == [(1, 429), (3, 200)]
+    assert len({kwargs["request_uuid"] for kwargs in request_attempts}) == 1
+
+
+def test_easypost_client_retries_exhausted(recording_transport):
+    """Tests that the error of the last attempt is raised once every attempt failed."""
+    transport = recording_transport([UNAVAILABLE_RESPONSE, RATE_LIMITED_RESPONSE])
+    client = EasyPostClient(api_key="123", transport=transport, retry_policy=RetryPolicy(max_attempts=2, base_delay=0))
+
+    with pytest.raises(RateLimitError):
+        client.tracker.retrieve("trk_123")
+
+    assert len(transport.requests) == 2
+
+
+def test_easypost_client_no_retry_policy(recording_transport):
+    """Tests that a client without a retry policy makes a single attempt."""
+    transport = recording_transport([UNAVAILABLE_RESPONSE, OK_RESPONSE])
+    client = EasyPostClient(api_key="123", transport=transport)
+
+    with pytest.raises(ServiceUnavailableError):
+        client.tracker.retrieve("trk_123")
+
+    assert len(transport.requests) == 1
+
+
+def test_easypost_client_retries_post_with_idempotency_key(recording_transport):
+    """Tests that a POST sent with an idempotency key is retried with the same key and body."""
+    transport = recording_transport([UNAVAILABLE_RESPONSE, OK_RESPONSE])
+    client = EasyPostClient(api_key="123", transport=transport, retry_policy=RetryPolicy(base_delay=0))
+
+    client.make_api_call(
+        RequestMethod.POST, "/trackers", {"tracking_code": "EZ1000000001"}, headers={"Idempotency-Key": "abc"}
+    )
+
+    assert len(transport.requests) == 2
+    assert transport.requests[0] == transport.requests[1]
+    assert transport.requests[1].headers["Idempotency-Key"] == "abc"
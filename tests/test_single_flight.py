@@ -0,0 +1,137 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from easypost.async_easypost_client import AsyncEasyPostClient
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import NotFoundError
+from easypost.single_flight import SingleFlight
+from easypost.transports import TransportResponse
+
+SHIPMENT_RESPONSE = TransportResponse(status=200, headers={}, body=b'{"id": "shp_123", "object": "Shipment"}')
+NOT_FOUND_RESPONSE = TransportResponse(status=404, headers={}, body=b'{"error": {"code": "NOT_FOUND"}}')
+
+
+def test_single_flight_do():
+    """Tests that concurrent calls with the same key share one call and its result."""
+    single_flight = SingleFlight()
+    calls = []
+
+    def func():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"id": "shp_123"}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(lambda _: single_flight.do("key", func), range(5)))
+
+    assert len(calls) == 1
+    assert all(result == {"id": "shp_123"} for result in results)
+    assert len({id(result) for result in results}) == 5  # Every caller gets its own copy
+
+
+def test_single_flight_do_error():
+    """Tests that the error of a shared call is raised to every caller and the key is released."""
+    single_flight = SingleFlight()
+
+    def func():
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    def call(_):
+        with pytest.raises(ValueError):
+            single_flight.do("key", func)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(call, range(3)))
+
+    assert single_flight.do("key", lambda: "again") == "again"
+
+
+def test_single_flight_do_async_leader_cancelled():
+    """Tests that cancelling the caller that started a shared call doesn't cancel it for the other callers."""
+    single_flight = SingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"id": "shp_123"}
+
+    async def run():
+        leader = asyncio.ensure_future(single_flight.do_async("key", func))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(single_flight.do_async("key", func)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return results
+
+    assert asyncio.run(run()) == [{"id": "shp_123"}, {"id": "shp_123"}]
+    assert len(calls) == 1
+    assert single_flight._async_calls == {}
+
+
+def test_easypost_client_single_flight_threads(recording_transport):
+    """Tests that concurrent identical GETs share one HTTP call while different ones don't."""
+    transport = recording_transport(SHIPMENT_RESPONSE, delay=0.05)
+    client = EasyPostClient(api_key="123", transport=transport, single_flight=True)
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        shipments = list(executor.map(lambda _: client.shipment.retrieve("shp_123"), range(10)))
+        list(executor.map(lambda _: client.tracker.all(page_size=5), range(3)))
+
+    assert [shipment.id for shipment in shipments] == ["shp_123"] * 10
+    assert transport.urls.count("https://api.easypost.com/v2/shipments/shp_123") == 1
+    assert transport.urls.count("https://api.easypost.com/v2/trackers?page_size=5") == 1
+
+
+def test_easypost_client_single_flight_errors(recording_transport):
+    """Tests that an API error is raised to every caller sharing the call."""
+    transport = recording_transport(NOT_FOUND_RESPONSE, delay=0.05)
+    client = EasyPostClient(api_key="123", transport=transport, single_flight=True)
+
+    def retrieve(_):
+        with pytest.raises(NotFoundError):
+            client.shipment.retrieve("shp_123")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(retrieve, range(4)))
+
+    assert len(transport.requests) == 1
+
+
+def test_easypost_client_single_flight_disabled(recording_transport):
+    """Tests that GETs aren't shared unless single-flight is enabled."""
+    transport = recording_transport(SHIPMENT_RESPONSE, delay=0.05)
+    client = EasyPostClient(api_key="123", transport=transport)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda _: client.shipment.retrieve("shp_123"), range(3)))
+
+    assert len(transport.requests) == 3
+
+
+def test_async_easypost_client_single_flight(async_recording_transport):
+    """Tests that concurrent identical GETs on an event loop share one HTTP call."""
+    transport = async_recording_transport(SHIPMENT_RESPONSE, delay=0.05)
+    client = AsyncEasyPostClient(api_key="123", transport=transport, single_flight=True)
+
+    async def run():
+        return await asyncio.gather(
+            *[client.shipment.retrieve("shp_123") for _ in range(10)],
+            client.shipment.retrieve("shp_456"),
+        )
+
+    shipments = asyncio.run(run())
+
+    assert len(shipments) == 11
+    assert transport.urls == [
+        "https://api.easypost.com/v2/shipments/shp_123",
+        "https://api.easypost.com/v2/shipments/shp_456",
+    ]
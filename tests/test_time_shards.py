@@ -0,0 +1,119 @@
+import datetime
+import time
+from urllib.parse import (
+    parse_qs,
+    urlsplit,
+)
+
+import pytest
+
+from easypost.easypost_client import EasyPostClient
+from easypost.time_shards import (
+    format_datetime,
+    parse_datetime,
+    split_range,
+)
+from easypost.transports import TransportRequest
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def build_shipments() -> list[dict]:
+    """Build a year of shipments, newest first: one a day and a burst of 300 on a single day."""
+    created = [START + datetime.timedelta(days=day, hours=12) for day in range(365)]
+    created += [START + datetime.timedelta(days=200, seconds=10 * index) for index in range(300)]
+    created.sort()
+
+    return [
+        {"id": f"shp_{index:04}", "object": "Shipment", "created_at": format_datetime(created_at)}
+        for index, created_at in reversed(list(enumerate(created)))
+    ]
+
+
+SHIPMENTS = build_shipments()
+
+
+def list_shipments(shipments: list[dict] = SHIPMENTS, inclusive: bool = True):
+    """Answer list requests with the shipments newest first, filtered on `start_datetime` and `end_datetime` and
+    paginated with `before_id`."""
+
+    def in_range(shipment: dict, start: datetime.datetime, end: datetime.datetime) -> bool:
+        created_at = parse_datetime(shipment["created_at"])
+        if inclusive:
+            return start <= created_at <= end
+        return start < created_at < end
+
+    def respond(request: TransportRequest) -> dict:
+        query = {key: values[0] for key, values in parse_qs(urlsplit(request.url).query).items()}
+        start = parse_datetime(query["start_datetime"])
+        end = parse_datetime(query["end_datetime"])
+        page = [shipment for shipment in shipments if in_range(shipment, start, end)]
+        if "before_id" in query:
+            page = [shipment for shipment in page if shipment["id"] < query["before_id"]]
+        page_size = int(query.get("page_size", 20))
+        return {"shipments": page[:page_size], "has_more": len(page) > page_size}
+
+    return respond
+
+
+@pytest.mark.parametrize("inclusive", [True, False])
+def test_iter_all_sharded(recording_transport, inclusive):
+    """Tests that a sharded export lists every object of the range once, in order, splitting dense windows."""
+    transport = recording_transport(list_shipments(inclusive=inclusive))
+    client = EasyPostClient("123", transport=transport, response_format="dict")
+
+    shipments = list(
+        client.shipment.iter_all_sharded(
+            START,
+            "2025-01-01T00:00:00Z",
+            workers=4,
+            page_size=20,
+        )
+    )
+
+    assert [shipment["id"] for shipment in shipments] == [shipment["id"] for shipment in SHIPMENTS]
+    # The burst of shipments was spread over smaller windows rather than paginated by a single worker
+    assert len(transport.requests) > 4
+
+
+def test_iter_all_sharded_max_items(recording_transport):
+    """Tests that a sharded export stops after `max_items` objects."""
+    client = EasyPostClient("123", transport=recording_transport(list_shipments()))
+
+    shipments = list(client.shipment.iter_all_sharded(START, START + datetime.timedelta(days=366), max_items=50))
+
+    assert [shipment.id for shipment in shipments] == [shipment["id"] for shipment in SHIPMENTS[:50]]
+    assert list(client.shipment.iter_all_sharded(START, START - datetime.timedelta(days=1))) == []
+
+
+def test_iter_all_sharded_backpressure(recording_transport):
+    """Tests that only the windows next in line are paginated ahead of a caller that stops consuming."""
+    shipments = [
+        {
+            "id": f"shp_{index:04}",
+            "object": "Shipment",
+            "created_at": format_datetime(START + datetime.timedelta(minutes=index)),
+        }
+        for index in reversed(range(2000))
+    ]
+    transport = recording_transport(list_shipments(shipments))
+    client = EasyPostClient("123", transport=transport, response_format="dict")
+
+    export = client.shipment.iter_all_sharded(START, START + datetime.timedelta(days=2), workers=2, page_size=10)
+    next(export)
+    time.sleep(0.2)
+
+    # Paginating every window ahead of the caller takes about 100 requests
+    assert len(transport.requests) < 20
+    assert len(list(export)) == 1999
+
+
+def test_split_range():
+    """Tests that ranges are split into equal windows, newest first, overlapping by a second."""
+    end = START + datetime.timedelta(hours=3)
+
+    assert split_range(START, end, 3) == [
+        (START + datetime.timedelta(hours=2), end),
+        (START + datetime.timedelta(hours=1), START + datetime.timedelta(hours=2, seconds=1)),
+        (START, START + datetime.timedelta(hours=1, seconds=1)),
+    ]
@@ -0,0 +1,111 @@
+import threading
+from http.server import (
+    BaseHTTPRequestHandler,
+    HTTPServer,
+)
+
+import pytest
+
+from easypost.easypost_client import EasyPostClient
+from easypost.errors import (
+    NotFoundError,
+    TimeoutError,
+)
+from easypost.requestor import RequestMethod
+from easypost.transports import Urllib3Transport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        received = (self.command, self.path, dict(self.headers), self.rfile.read(length))
+        self.server.received.append(received)  # type: ignore[attr-defined]
+
+        if self.path.startswith("/v2/slow"):
+            threading.Event().wait(0.5)
+
+        if "missing" in self.path:
+            status, body = 404, b'{"error": {"code": "NOT_FOUND", "message": "Not found"}}'
+        else:
+            status, body = 200, b'{"id": "prcl_123", "object": "Parcel"}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    server.received = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stub_client(stub_server):
+    transport = Urllib3Transport()
+    yield EasyPostClient(
+        api_key="123",
+        api_base=f"http://127.0.0.1:{stub_server.server_address[1]}/v2",
+        transport=transport,
+        json_codec="json",
+    )
+    transport.close()
+
+
+def test_urllib3_transport_post(stub_server, stub_client):
+    """Tests that the urllib3 transport sends the pre-encoded body and parses the raw response bytes."""
+    parcel = stub_client.parcel.create(weight=10)
+
+    method, path, headers, body = stub_server.received[0]
+    assert parcel.id == "prcl_123"
+    assert method == "POST"
+    assert path == "/v2/parcels"
+    assert headers["Authorization"] == "Bearer 123"
+    assert headers["Content-Type"] == "application/json"
+    assert headers["Accept-Encoding"] == "gzip, deflate"
+    assert body == b'{"parcel": {"weight": 10}}'
+
+
+def test_urllib3_transport_get_reuses_connection(stub_server, stub_client):
+    """Tests that query params are sent and consecutive requests share a pooled connection."""
+    stub_client.parcel.retrieve("prcl_123")
+    stub_client.tracker.all(page_size=5)
+
+    assert [request[1] for request in stub_server.received] == ["/v2/parcels/prcl_123", "/v2/trackers?page_size=5"]
+    pool = stub_client._transport._pool_manager.connection_from_url(stub_client.api_base)
+    assert pool.num_connections == 1
+
+
+def test_urllib3_transport_api_error(stub_client):
+    """Tests that error responses are mapped to the matching EasyPost error."""
+    with pytest.raises(NotFoundError) as error:
+        stub_client.parcel.retrieve("missing")
+
+    assert error.value.http_status == 404
+
+
+def test_urllib3_transport_timeout(stub_server):
+    """Tests that a slow response raises an EasyPost TimeoutError."""
+    client = EasyPostClient(
+        api_key="123",
+        api_base=f"http://127.0.0.1:{stub_server.server_address[1]}/v2",
+        timeout=0.1,
+        transport=Urllib3Transport(max_retries=0),
+    )
+
+    with pytest.raises(TimeoutError):
+        client.make_api_call(RequestMethod.GET, "/slow", {})